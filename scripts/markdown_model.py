@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Shared markdown document model for skill validators.
+
+A document is tokenized in one pass over its lines into headings, fenced
+code blocks and tables. Lines inside fenced code blocks are never read as
+headings or tables. The heading tree and section spans are derived from
+the headings on first use. Documents are memoized by (path, mtime, size),
+so a file checked by several validators in one batch run is parsed once.
+
+Memoized documents are shared between callers. Treat them as read-only.
+
+Usage:
+    python markdown_model.py <file.md> [...]
+"""
+
+import re
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import Optional
+
+MAX_CACHED_DOCUMENTS = 256
+
+HEADING_PATTERN = re.compile(r"^(#{1,6})\s+(.+)$")
+FENCE_PATTERN = re.compile(r"^\s*(`{3,}|~{3,})(.*)$")
+TABLE_DELIMITER_PATTERN = re.compile(r"^\s*\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?\s*$")
+
+_cache: OrderedDict = OrderedDict()
+_stats = {"hits": 0, "misses": 0}
+
+
+@dataclass(frozen=True)
+class Heading:
+    level: int
+    text: str
+    line: int
+
+
+@dataclass(frozen=True)
+class CodeBlock:
+    """A fenced code block. line is the opening fence, end_line the closing one."""
+    line: int
+    language: str
+    info: str
+    content: str
+    end_line: int
+
+
+@dataclass(frozen=True)
+class Table:
+    """A pipe table. line is the header row."""
+    line: int
+    header_line: str
+    columns: tuple[str, ...]
+    rows: tuple[tuple[str, ...], ...]
+
+
+@dataclass
+class Section:
+    """A heading and the lines up to the next heading of the same or higher level."""
+    heading: Heading
+    end_line: int
+    children: list["Section"] = field(default_factory=list)
+
+    @property
+    def title(self) -> str:
+        return self.heading.text
+
+
+def split_row(line: str) -> tuple[str, ...]:
+    """Split a table row into stripped cells."""
+    row = line.strip()
+    if row.startswith("|"):
+        row = row[1:]
+    if row.endswith("|"):
+        row = row[:-1]
+    return tuple(cell.strip() for cell in row.split("|"))
+
+
+class MarkdownDocument:
+    """Headings, sections, fenced code blocks and tables of one markdown text."""
+
+    def __init__(self, content: str):
+        self.content = content
+
+    @cached_property
+    def lines(self) -> list[str]:
+        return self.content.split("\n")
+
+    @cached_property
+    def _tokens(self) -> tuple[list[Heading], list[CodeBlock], list[Table]]:
+        headings: list[Heading] = []
+        blocks: list[CodeBlock] = []
+        tables: list[Table] = []
+        lines = self.lines
+        i = 0
+        while i < len(lines):
+            line = lines[i]
+            fence = FENCE_PATTERN.match(line) if ("`" in line or "~" in line) else None
+            if fence and not (fence.group(1)[0] == "`" and "`" in fence.group(2)):
+                marker = fence.group(1)
+                info = fence.group(2).strip()
+                end = i + 1
+                while end < len(lines):
+                    closing = lines[end].strip()
+                    if closing.startswith(marker) and closing.strip(marker[0]) == "":
+                        break
+                    end += 1
+                blocks.append(CodeBlock(
+                    line=i + 1,
+                    language=info.split()[0].lower() if info else "",
+                    info=info,
+                    content="\n".join(lines[i + 1:end]),
+                    end_line=min(end + 1, len(lines)),
+                ))
+                i = end + 1
+                continue
+            if line.startswith("#"):
+                match = HEADING_PATTERN.match(line)
+                if match:
+                    headings.append(Heading(len(match.group(1)), match.group(2).strip(), i + 1))
+            elif (
+                line.lstrip().startswith("|")
+                and i + 1 < len(lines)
+                and TABLE_DELIMITER_PATTERN.match(lines[i + 1])
+            ):
+                end = i + 2
+                while end < len(lines) and lines[end].lstrip().startswith("|"):
+                    end += 1
+                tables.append(Table(
+                    line=i + 1,
+                    header_line=line,
+                    columns=split_row(line),
+                    rows=tuple(split_row(row) for row in lines[i + 2:end]),
+                ))
+                i = end
+                continue
+            i += 1
+        return headings, blocks, tables
+
+    @property
+    def headings(self) -> list[Heading]:
+        return self._tokens[0]
+
+    @property
+    def code_blocks(self) -> list[CodeBlock]:
+        return self._tokens[1]
+
+    @property
+    def tables(self) -> list[Table]:
+        return self._tokens[2]
+
+    @cached_property
+    def sections(self) -> list[Section]:
+        """Heading tree: top-level sections, each with nested child sections."""
+        roots: list[Section] = []
+        stack: list[Section] = []
+        last_line = len(self.lines)
+        for heading in self.headings:
+            while stack and stack[-1].heading.level >= heading.level:
+                stack.pop().end_line = heading.line - 1
+            section = Section(heading, last_line)
+            (stack[-1].children if stack else roots).append(section)
+            stack.append(section)
+        return roots
+
+    def iter_sections(self, level: Optional[int] = None):
+        """Yield sections depth-first in document order, optionally at one level."""
+        pending = list(reversed(self.sections))
+        while pending:
+            section = pending.pop()
+            if level is None or section.heading.level == level:
+                yield section
+            pending.extend(reversed(section.children))
+
+    def section_text(self, section: Section) -> str:
+        """Body of a section, from the line after its heading to its end."""
+        return "\n".join(self.lines[section.heading.line:section.end_line])
+
+    def sections_by_title(self, level: int = 2) -> dict[str, str]:
+        """Map heading text to section body for one level. Later duplicates win."""
+        return {s.title: self.section_text(s) for s in self.iter_sections(level)}
+
+    def blocks_in(self, language: str) -> list[CodeBlock]:
+        return [block for block in self.code_blocks if block.language == language]
+
+
+def load_document(filepath: Path) -> MarkdownDocument:
+    """Read and model a markdown file, memoized by its path, mtime and size.
+
+    The least recently used document is dropped once MAX_CACHED_DOCUMENTS
+    are held. Read errors are raised and not cached.
+    """
+    stat = Path(filepath).stat()
+    key = (str(Path(filepath).resolve()), stat.st_mtime_ns, stat.st_size)
+    if key in _cache:
+        _cache.move_to_end(key)
+        _stats["hits"] += 1
+        return _cache[key]
+
+    _stats["misses"] += 1
+    document = MarkdownDocument(Path(filepath).read_text(encoding="utf-8"))
+    _cache[key] = document
+    if len(_cache) > MAX_CACHED_DOCUMENTS:
+        _cache.popitem(last=False)
+    return document
+
+
+def cache_info() -> dict:
+    """Return memoization statistics for this process."""
+    return {**_stats, "documents": len(_cache)}
+
+
+def clear_cache() -> None:
+    _cache.clear()
+    _stats["hits"] = 0
+    _stats["misses"] = 0
+
+
+def main() -> int:
+    if len(sys.argv) < 2:
+        print("Usage: python markdown_model.py <file.md> [...]", file=sys.stderr)
+        return 2
+
+    for arg in sys.argv[1:]:
+        filepath = Path(arg)
+        if not filepath.exists():
+            print(f"Error: File not found: {filepath}", file=sys.stderr)
+            return 2
+        start = time.perf_counter()
+        document = load_document(filepath)
+        headings, blocks, tables = document.headings, document.code_blocks, document.tables
+        print(
+            f"{filepath}: {len(headings)} headings, {len(blocks)} code blocks, "
+            f"{len(tables)} tables in {time.perf_counter() - start:.3f}s"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
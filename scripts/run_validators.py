@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+"""
+Batch runner for skill validator scripts.
+
+Discovers every script under skills/*/*/scripts/, imports each selected
+validator once per worker process, and runs it over a whole tree of files.
+Results from all validators and files are merged into one JSON report.
+
+Validators are named <skill>/<script>, for example
+writing-how-to-guides/heading_validator. Selectors accept glob patterns.
+
+Usage:
+    python run_validators.py --list
+    python run_validators.py -v writing-how-to-guides/heading_validator docs/
+    python run_validators.py -v 'writing-*/validate_*' --include '*.yaml' specs/ --jobs 8
+    python run_validators.py -v writing-api-documentation/api_doc_validator docs/ -o report.json
+    python run_validators.py -v 'writing-*/*' docs/ --cache .validator-cache.sqlite
+
+Exit codes:
+    0 - All validations passed
+    1 - Validation failures found
+    2 - Invalid input
+"""
+
+import argparse
+import contextlib
+import fnmatch
+import importlib.util
+import io
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterator, Optional
+
+from validator_cache import DEFAULT_MAX_BYTES, ResultCache, config_hash, content_hash, file_hash
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SKILLS_DIR = REPO_ROOT / "skills"
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+# Modules in this folder that validators import when run from here
+SHARED_MODULES = ("markdown_model", "yaml_loader")
+SHARED_IMPORT_PATTERN = re.compile(
+    r"^\s*(?:from|import)\s+(" + "|".join(SHARED_MODULES) + r")\b", re.MULTILINE
+)
+
+DEFAULT_INCLUDE = ["*.md", "*.yaml", "*.yml", "*.json"]
+
+# Command-line arguments for validators whose main() does not take a single
+# file path as its only argument. "{file}" is replaced with the file path.
+VALIDATOR_ARGS = {
+    "auditing-ui-copy/audit_report_generator": ["--validate", "{file}"],
+    "designing-content-governance-flows/flow_validator": ["validate", "{file}"],
+    "designing-content-pattern-libraries/pattern_validator": ["validate", "{file}"],
+    "naming-features-and-settings/name_validator": ["batch", "{file}"],
+}
+
+# Scripts that are not single-file validators
+EXCLUDED_VALIDATORS = {
+    "diffing-and-versioning-context-packs/diff_context_packs",
+}
+
+
+@dataclass
+class Validator:
+    """A discovered validator script."""
+    name: str
+    path: str
+    version: str = ""
+    rule_config: str = ""
+
+    def argv(self, filepath: str) -> list[str]:
+        template = VALIDATOR_ARGS.get(self.name, ["{file}"])
+        return [arg.replace("{file}", filepath) for arg in template]
+
+
+@dataclass
+class RunResult:
+    """Outcome of one validator run against one file."""
+    file: str
+    validator: str
+    status: str  # passed, failed, error
+    exit_code: int
+    output: str
+
+
+def validator_version(path: Path) -> str:
+    """
+    Hash a validator script together with the shared modules it imports.
+    
+    Editing markdown_model.py or yaml_loader.py changes the version of every
+    validator that imports it, so their cached results are not reused.
+    """
+    source = Path(path).read_bytes()
+    shared = sorted(set(SHARED_IMPORT_PATTERN.findall(source.decode("utf-8", "replace"))))
+    if not shared:
+        return file_hash(path)
+    parts = [file_hash(path)] + [f"{name}:{file_hash(SCRIPTS_DIR / f'{name}.py')}" for name in shared]
+    return content_hash("\n".join(parts).encode("utf-8"))
+
+
+def discover_validators(skills_dir: Path = SKILLS_DIR) -> list[Validator]:
+    """Find all validator scripts under skills/<category>/<skill>/scripts/."""
+    validators = []
+    for path in sorted(skills_dir.glob("*/*/scripts/*.py")):
+        name = f"{path.parent.parent.name}/{path.stem}"
+        if name in EXCLUDED_VALIDATORS:
+            continue
+        validators.append(Validator(
+            name=name,
+            path=str(path),
+            version=validator_version(path),
+            rule_config=config_hash(VALIDATOR_ARGS.get(name, ["{file}"])),
+        ))
+    return validators
+
+
+def select_validators(validators: list[Validator], selectors: list[str]) -> list[Validator]:
+    """Return validators whose name matches any selector glob."""
+    return [
+        v for v in validators
+        if any(fnmatch.fnmatchcase(v.name, s) for s in selectors)
+    ]
+
+
+def iter_files(paths: list[str], include: list[str]) -> Iterator[Path]:
+    """Yield files under paths whose name matches an include glob, sorted per directory."""
+    for root in paths:
+        root_path = Path(root)
+        if root_path.is_file():
+            yield root_path
+            continue
+        for dirpath, dirnames, filenames in os.walk(root_path):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                if any(fnmatch.fnmatch(filename, pattern) for pattern in include):
+                    yield Path(dirpath) / filename
+
+
+def load_validator_module(validator: Validator):
+    """Import a validator script as a module without running its __main__ block."""
+    module_name = "hcs_" + validator.name.replace("/", "__").replace("-", "_")
+    spec = importlib.util.spec_from_file_location(module_name, validator.path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_validator(module, validator: Validator, filepath: str) -> RunResult:
+    """Call a validator's main() with patched argv and captured output."""
+    output = io.StringIO()
+    saved_argv = sys.argv
+    sys.argv = [validator.path] + validator.argv(filepath)
+    try:
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            returned = module.main()
+        exit_code = returned if isinstance(returned, int) else 0
+    except SystemExit as e:
+        if e.code is None:
+            exit_code = 0
+        elif isinstance(e.code, int):
+            exit_code = e.code
+        else:
+            output.write(f"{e.code}\n")
+            exit_code = 1
+    except Exception as e:  # a crashing validator must not take down the batch
+        output.write(f"{type(e).__name__}: {e}\n")
+        exit_code = 2
+    finally:
+        sys.argv = saved_argv
+
+    if exit_code == 0:
+        status = "passed"
+    elif exit_code == 1:
+        status = "failed"
+    else:
+        status = "error"
+    return RunResult(
+        file=filepath,
+        validator=validator.name,
+        status=status,
+        exit_code=exit_code,
+        output=output.getvalue(),
+    )
+
+
+# Per-process state, populated once by _init_worker
+_WORKER_VALIDATORS: dict[str, tuple[Validator, object]] = {}
+
+
+def _init_worker(validators: list[Validator]) -> None:
+    _WORKER_VALIDATORS.clear()
+    for validator in validators:
+        _WORKER_VALIDATORS[validator.name] = (validator, load_validator_module(validator))
+
+
+def _run_file(task: tuple[str, list[str]]) -> list[RunResult]:
+    filepath, names = task
+    results = []
+    for name in names:
+        validator, module = _WORKER_VALIDATORS[name]
+        results.append(run_validator(module, validator, filepath))
+    return results
+
+
+def _cache_key(validator: Validator, filepath: str, digest: str) -> str:
+    return ResultCache.make_key(digest, filepath, validator.version, validator.rule_config)
+
+
+def run_batch(
+    validators: list[Validator],
+    files: Iterator[Path],
+    jobs: int = 1,
+    cache: Optional[ResultCache] = None,
+) -> list[RunResult]:
+    """Run validators over files. Results are in file order, then validator order.
+
+    With a cache, results for unchanged files are reused and only cache
+    misses are dispatched to workers. Only completed runs (passed or
+    failed) are cached; a validator that errored runs again next time.
+    """
+    # One slot per (file, validator); cached slots are filled up front
+    slots: list[list[Optional[RunResult]]] = []
+    tasks: list[tuple[str, list[str]]] = []
+    task_slots: list[int] = []
+    digests: dict[str, str] = {}
+    for f in files:
+        filepath = str(f)
+        row: list[Optional[RunResult]] = [None] * len(validators)
+        if cache is not None:
+            try:
+                digests[filepath] = file_hash(f)
+            except OSError:
+                pass
+        if filepath in digests:
+            for i, validator in enumerate(validators):
+                cached = cache.get(_cache_key(validator, filepath, digests[filepath]))
+                if cached is not None and cached["status"] != "error":
+                    row[i] = RunResult(**cached)
+        pending = [v.name for v, r in zip(validators, row) if r is None]
+        if pending:
+            tasks.append((filepath, pending))
+            task_slots.append(len(slots))
+        slots.append(row)
+
+    if tasks:
+        if jobs <= 1:
+            _init_worker(validators)
+            task_results = map(_run_file, tasks)
+            executor = None
+        else:
+            executor = ProcessPoolExecutor(
+                max_workers=jobs,
+                initializer=_init_worker,
+                initargs=(validators,),
+            )
+            task_results = executor.map(_run_file, tasks, chunksize=16)
+        try:
+            for slot_index, file_results in zip(task_slots, task_results):
+                row = slots[slot_index]
+                fresh = iter(file_results)
+                for i, validator in enumerate(validators):
+                    if row[i] is not None:
+                        continue
+                    row[i] = next(fresh)
+                    digest = digests.get(row[i].file)
+                    if cache is not None and digest is not None and row[i].status != "error":
+                        cache.put(_cache_key(validator, row[i].file, digest), asdict(row[i]))
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+    return [result for row in slots for result in row]
+
+
+def build_report(
+    validators: list[Validator],
+    results: list[RunResult],
+    cache: Optional[ResultCache] = None,
+) -> dict:
+    """Merge run results into a single report."""
+    files = {r.file for r in results}
+    report = {
+        "summary": {
+            "files": len(files),
+            "validators": [v.name for v in validators],
+            "runs": len(results),
+            "passed": sum(1 for r in results if r.status == "passed"),
+            "failed": sum(1 for r in results if r.status == "failed"),
+            "errors": sum(1 for r in results if r.status == "error"),
+        },
+        "results": [asdict(r) for r in results],
+    }
+    if cache is not None:
+        report["summary"]["cache"] = cache.summary()
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Run skill validators over a tree of files"
+    )
+    parser.add_argument("paths", nargs="*", help="Files or directories to validate")
+    parser.add_argument(
+        "--validator", "-v",
+        action="append",
+        default=[],
+        help="Validator name or glob, e.g. writing-how-to-guides/heading_validator (repeatable)",
+    )
+    parser.add_argument(
+        "--include",
+        action="append",
+        help=f"File name glob to include (repeatable, default: {' '.join(DEFAULT_INCLUDE)})",
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes (default: CPU count, 1 runs in-process)",
+    )
+    parser.add_argument("--output", "-o", help="Write JSON report to file")
+    parser.add_argument(
+        "--cache",
+        help="Result cache file; unchanged files are not re-validated",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_MAX_BYTES // (1024 * 1024),
+        help="Maximum cache size in MB (default: %(default)s)",
+    )
+    parser.add_argument("--list", action="store_true", help="List available validators")
+
+    args = parser.parse_args()
+
+    validators = discover_validators()
+
+    if args.list:
+        for v in validators:
+            print(v.name)
+        return 0
+
+    if not args.validator or not args.paths:
+        parser.error("at least one --validator and one path are required")
+
+    selected = select_validators(validators, args.validator)
+    if not selected:
+        print(f"Error: No validators match: {', '.join(args.validator)}", file=sys.stderr)
+        return 2
+
+    for path in args.paths:
+        if not Path(path).exists():
+            print(f"Error: Path not found: {path}", file=sys.stderr)
+            return 2
+
+    files = iter_files(args.paths, args.include or DEFAULT_INCLUDE)
+    cache = ResultCache(Path(args.cache), args.cache_size * 1024 * 1024) if args.cache else None
+    try:
+        results = run_batch(selected, files, jobs=args.jobs, cache=cache)
+        if cache is not None:
+            cache.evict()
+        report = build_report(selected, results, cache)
+    finally:
+        if cache is not None:
+            cache.close()
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output, encoding="utf-8")
+        summary = report["summary"]
+        print(
+            f"{summary['runs']} runs over {summary['files']} files: "
+            f"{summary['passed']} passed, {summary['failed']} failed, "
+            f"{summary['errors']} errors. Report written to {args.output}"
+        )
+        if "cache" in summary:
+            print(
+                f"Cache: {summary['cache']['hits']} hits, "
+                f"{summary['cache']['misses']} misses "
+                f"({summary['cache']['hit_rate']:.0%} hit rate)"
+            )
+    else:
+        print(output)
+
+    summary = report["summary"]
+    if summary["errors"]:
+        return 2
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+On-disk result cache for skill validators.
+
+Results are keyed by the file's content hash, its path, the validator
+version (a hash of the validator script source) and the rule-config hash
+(a hash of the arguments the validator is run with). Any change to the
+file, the validator script or its arguments is a cache miss.
+
+The cache is a single SQLite file. When it grows past max_bytes, the least
+recently used entries are evicted.
+
+Usage:
+    python validator_cache.py stats <cache.sqlite>
+    python validator_cache.py clear <cache.sqlite>
+"""
+
+import argparse
+import hashlib
+import json
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+)
+"""
+
+
+def content_hash(data: bytes) -> str:
+    """Return the SHA-256 hex digest of data."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_hash(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's content."""
+    return content_hash(Path(path).read_bytes())
+
+
+def config_hash(config) -> str:
+    """Return a stable hash of any JSON-serializable rule configuration."""
+    return content_hash(json.dumps(config, sort_keys=True).encode("utf-8"))
+
+
+class ResultCache:
+    """Size-bounded LRU cache of validator results stored in SQLite."""
+
+    def __init__(self, path: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute(SCHEMA)
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    @staticmethod
+    def make_key(file_digest: str, filepath: str, validator_version: str, rule_config: str) -> str:
+        return content_hash(
+            "\0".join([file_digest, filepath, validator_version, rule_config]).encode("utf-8")
+        )
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return the cached value for key, or None on a miss."""
+        row = self.conn.execute(
+            "SELECT value FROM results WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self.stats["misses"] += 1
+            return None
+        self.conn.execute(
+            "UPDATE results SET last_used = ? WHERE key = ?", (time.time(), key)
+        )
+        self.stats["hits"] += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, value: dict) -> None:
+        """Store value under key."""
+        encoded = json.dumps(value)
+        self.conn.execute(
+            "INSERT OR REPLACE INTO results (key, value, size, last_used) VALUES (?, ?, ?, ?)",
+            (key, encoded, len(encoded), time.time()),
+        )
+        self.stats["stores"] += 1
+
+    def total_bytes(self) -> int:
+        return self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+
+    def evict(self) -> int:
+        """Delete least recently used entries until the cache fits max_bytes."""
+        excess = self.total_bytes() - self.max_bytes
+        if excess <= 0:
+            return 0
+
+        evicted = 0
+        rows = self.conn.execute(
+            "SELECT key, size FROM results ORDER BY last_used ASC"
+        ).fetchall()
+        for key, size in rows:
+            if excess <= 0:
+                break
+            self.conn.execute("DELETE FROM results WHERE key = ?", (key,))
+            excess -= size
+            evicted += 1
+        self.stats["evictions"] += evicted
+        return evicted
+
+    def summary(self) -> dict:
+        """Return hit statistics for this session."""
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_rate": round(self.stats["hits"] / lookups, 4) if lookups else 0.0,
+            "entries": self.conn.execute("SELECT COUNT(*) FROM results").fetchone()[0],
+            "bytes": self.total_bytes(),
+        }
+
+    def clear(self) -> None:
+        self.conn.execute("DELETE FROM results")
+
+    def close(self) -> None:
+        """Evict down to max_bytes, then commit and close."""
+        self.evict()
+        self.conn.commit()
+        self.conn.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Inspect or clear a validator result cache")
+    parser.add_argument("command", choices=["stats", "clear"])
+    parser.add_argument("cache", help="Cache file")
+
+    args = parser.parse_args()
+
+    if not Path(args.cache).exists():
+        print(f"Error: Cache not found: {args.cache}", file=sys.stderr)
+        return 2
+
+    cache = ResultCache(Path(args.cache))
+    if args.command == "clear":
+        cache.clear()
+        print(f"Cleared {args.cache}")
+    else:
+        summary = cache.summary()
+        print(f"Entries: {summary['entries']}")
+        print(f"Size:    {summary['bytes']} bytes")
+    cache.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Shared YAML loader for skill validators.
+
+Uses libyaml's CSafeLoader when PyYAML was built with it, which is often
+10x faster than the pure-Python SafeLoader, and falls back to SafeLoader
+otherwise. Parsed documents are memoized by (path, mtime, size), so a
+file read by several validators in one batch run is parsed once.
+
+Memoized documents are shared between callers and are read-only: their
+dicts and lists raise TypeError on changes. copy.deepcopy() of a document
+gives a plain, writable copy.
+
+Usage:
+    python yaml_loader.py <file.yaml> [...]
+"""
+
+import copy
+import json
+import sys
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+try:
+    import yaml  # type: ignore[import-not-found]
+    YAML_AVAILABLE = True
+    SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+except ImportError:
+    YAML_AVAILABLE = False
+    SafeLoader = None
+
+LIBYAML_AVAILABLE = YAML_AVAILABLE and SafeLoader is not yaml.SafeLoader
+
+MAX_CACHED_DOCUMENTS = 256
+
+_cache: OrderedDict = OrderedDict()
+_stats = {"hits": 0, "misses": 0}
+
+
+def safe_load(content: str) -> Any:
+    """Parse YAML content with the fastest available safe loader."""
+    if not YAML_AVAILABLE:
+        raise ImportError(
+            "PyYAML is required for YAML files. "
+            "Install with: pip install pyyaml"
+        )
+    return yaml.load(content, Loader=SafeLoader)
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(
+        "documents from yaml_loader.load_cached are shared and read-only; "
+        "change a copy.deepcopy() of the document instead"
+    )
+
+
+class ReadOnlyDict(dict):
+    """A dict that cannot be changed after it is built."""
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return (ReadOnlyDict, (dict(self),))
+
+    def __copy__(self) -> dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo: dict) -> dict:
+        return {copy.deepcopy(k, memo): copy.deepcopy(v, memo) for k, v in self.items()}
+
+
+class ReadOnlyList(list):
+    """A list that cannot be changed after it is built."""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = clear = extend = insert = pop = remove = reverse = sort = _read_only
+
+    def __reduce__(self):
+        return (ReadOnlyList, (list(self),))
+
+    def __copy__(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo: dict) -> list:
+        return [copy.deepcopy(v, memo) for v in self]
+
+
+def freeze(value: Any) -> Any:
+    """Return value with every dict and list replaced by a read-only one."""
+    if isinstance(value, dict):
+        return ReadOnlyDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return ReadOnlyList(freeze(v) for v in value)
+    return value
+
+
+def parse_file(filepath: Path) -> Any:
+    """Parse a YAML or JSON file.
+
+    .yaml/.yml files are YAML and .json files are JSON. Any other file is
+    tried as JSON, then as YAML.
+    """
+    filepath = Path(filepath)
+    content = filepath.read_text(encoding="utf-8")
+
+    if filepath.suffix in (".yaml", ".yml"):
+        return safe_load(content)
+    if filepath.suffix == ".json":
+        return json.loads(content)
+    # Try JSON first (no external dependency), then YAML
+    try:
+        return json.loads(content)
+    except json.JSONDecodeError:
+        if YAML_AVAILABLE:
+            return safe_load(content)
+        raise ValueError(
+            f"Could not parse {filepath}. "
+            "For YAML files, install PyYAML: pip install pyyaml"
+        )
+
+
+def load_cached(filepath: Path) -> Any:
+    """Return parse_file(filepath) as a read-only document, memoized by the
+    file's path, mtime and size.
+
+    The least recently used document is dropped once MAX_CACHED_DOCUMENTS
+    are held. Parse errors are not cached.
+    """
+    stat = Path(filepath).stat()
+    key = (str(Path(filepath).resolve()), stat.st_mtime_ns, stat.st_size)
+    if key in _cache:
+        _cache.move_to_end(key)
+        _stats["hits"] += 1
+        return _cache[key]
+
+    _stats["misses"] += 1
+    document = freeze(parse_file(filepath))
+    _cache[key] = document
+    if len(_cache) > MAX_CACHED_DOCUMENTS:
+        _cache.popitem(last=False)
+    return document
+
+
+def cache_info() -> dict:
+    """Return memoization statistics for this process."""
+    return {**_stats, "documents": len(_cache), "libyaml": LIBYAML_AVAILABLE}
+
+
+def clear_cache() -> None:
+    _cache.clear()
+    _stats["hits"] = 0
+    _stats["misses"] = 0
+
+
+def main() -> int:
+    if len(sys.argv) < 2:
+        print("Usage: python yaml_loader.py <file.yaml> [...]", file=sys.stderr)
+        return 2
+
+    print(f"Loader: {'CSafeLoader (libyaml)' if LIBYAML_AVAILABLE else 'SafeLoader (pure Python)'}")
+    for arg in sys.argv[1:]:
+        filepath = Path(arg)
+        if not filepath.exists():
+            print(f"Error: File not found: {filepath}", file=sys.stderr)
+            return 2
+        start = time.perf_counter()
+        safe_load(filepath.read_text(encoding="utf-8"))
+        print(f"{filepath}: parsed in {time.perf_counter() - start:.3f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
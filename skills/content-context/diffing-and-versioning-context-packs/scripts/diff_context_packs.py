@@ -9,9 +9,14 @@ Recommends version increment based on semver rules.
 Usage:
     python diff_context_packs.py <base.yaml> <head.yaml>
     python diff_context_packs.py <base.json> <head.json>
+    python diff_context_packs.py --history v1.yaml v2.yaml v3.yaml [--jobs N]
+    python diff_context_packs.py --history-dir snapshots/ [--jobs N]
+    python diff_context_packs.py --benchmark [entries]
 
 Output:
-    JSON diff report with change classification and version recommendation
+    JSON diff report with change classification and version recommendation.
+    History mode emits a changelog of consecutive diffs with the chain of
+    recommended versions.
 
 Exit codes:
     0: Success
@@ -20,13 +25,27 @@ Exit codes:
 """
 
 import sys
+import argparse
 import json
+import random
 import re
+import time
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Optional
 from enum import Enum
 
+# Parsed files are memoized by scripts/yaml_loader.py when this skill sits in
+# the repository; a copy of the skill parses each file itself.
+try:
+    sys.path.append(str(Path(__file__).resolve().parents[4] / "scripts"))
+    from yaml_loader import load_cached
+except (IndexError, ImportError):
+    load_cached = None
+
 
 class ChangeType(Enum):
     BREAKING = "breaking"
@@ -41,6 +60,26 @@ class VersionBump(Enum):
     NONE = "NONE"
 
 
+def bump_version(version: str, bump: VersionBump) -> str:
+    """Apply a semver increment to version. Returns "unknown" if version isn't semver."""
+    if version == "unknown":
+        return "unknown"
+    
+    try:
+        parts = str(version).split(".")
+        major, minor, patch = int(parts[0]), int(parts[1]), int(parts[2].split("-")[0])
+    except (ValueError, IndexError):
+        return "unknown"
+    
+    if bump == VersionBump.MAJOR:
+        return f"{major + 1}.0.0"
+    elif bump == VersionBump.MINOR:
+        return f"{major}.{minor + 1}.0"
+    elif bump == VersionBump.PATCH:
+        return f"{major}.{minor}.{patch + 1}"
+    return version
+
+
 @dataclass
 class Change:
     code: str
@@ -83,23 +122,7 @@ class DiffResult:
     
     @property
     def recommended_version(self) -> str:
-        if self.base_version == "unknown":
-            return "unknown"
-        
-        try:
-            parts = self.base_version.split(".")
-            major, minor, patch = int(parts[0]), int(parts[1]), int(parts[2].split("-")[0])
-        except (ValueError, IndexError):
-            return "unknown"
-        
-        bump = self.version_bump
-        if bump == VersionBump.MAJOR:
-            return f"{major + 1}.0.0"
-        elif bump == VersionBump.MINOR:
-            return f"{major}.{minor + 1}.0"
-        elif bump == VersionBump.PATCH:
-            return f"{major}.{minor}.{patch + 1}"
-        return self.base_version
+        return bump_version(self.base_version, self.version_bump)
     
     def to_json(self) -> dict:
         return {
@@ -143,6 +166,11 @@ class DiffResult:
 
 def load_context_pack(file_path: Path) -> dict:
     """Load context pack from YAML or JSON file."""
+    if load_cached is not None and file_path.suffix in [".yaml", ".yml", ".json"]:
+        try:
+            return load_cached(file_path)
+        except ImportError:
+            pass  # PyYAML is not installed; parse as JSON below
     content = file_path.read_text(encoding="utf-8")
     
     if file_path.suffix in [".yaml", ".yml"]:
@@ -155,21 +183,116 @@ def load_context_pack(file_path: Path) -> dict:
         return json.loads(content)
 
 
+TYPO_MAX_EDITS = 3
+
+KEYWORD_PATTERN = re.compile(r"[\w']+")
+
+
+def bounded_edit_distance(a: str, b: str, limit: int) -> int:
+    """Damerau-Levenshtein (optimal string alignment) distance, capped at limit + 1.
+
+    Counts insertions, deletions, substitutions and adjacent transpositions.
+    Only the diagonal band of width 2 * limit + 1 is computed, and the scan
+    stops as soon as every cell in a row exceeds limit, so unrelated strings
+    are rejected in O(limit) rows.
+    """
+    if a == b:
+        return 0
+    
+    # Common prefix and suffix never contribute edits
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    end_a, end_b = len(a), len(b)
+    while end_a > start and end_b > start and a[end_a - 1] == b[end_b - 1]:
+        end_a -= 1
+        end_b -= 1
+    a, b = a[start:end_a], b[start:end_b]
+    
+    len_a, len_b = len(a), len(b)
+    over = limit + 1
+    if abs(len_a - len_b) > limit:
+        return over
+    if not len_a or not len_b:
+        return min(max(len_a, len_b), over)
+    
+    prev2: list = []
+    prev = [min(j, over) for j in range(len_b + 1)]
+    for i in range(1, len_a + 1):
+        cur = [over] * (len_b + 1)
+        cur[0] = min(i, over)
+        row_min = cur[0]
+        char_a = a[i - 1]
+        for j in range(max(1, i - limit), min(len_b, i + limit) + 1):
+            cost = 0 if char_a == b[j - 1] else 1
+            value = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and char_a == b[j - 2] and a[i - 2] == b[j - 1]:
+                value = min(value, prev2[j - 2] + 1)
+            if value > over:
+                value = over
+            cur[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > limit:
+            return over
+        prev2, prev = prev, cur
+    
+    return prev[len_b]
+
+
+@lru_cache(maxsize=65536)
+def keyword_tokens(text: str) -> frozenset:
+    """Key words of text (nouns, verbs - simplified as words > 4 chars), punctuation stripped.
+
+    Cached, since the same descriptions recur across states and versions.
+    """
+    return frozenset(w for w in KEYWORD_PATTERN.findall(text.lower()) if len(w) > 4)
+
+
+def keyword_similarity(old_keywords: frozenset, new_keywords: frozenset) -> float:
+    """Jaccard similarity where keywords one edit apart count as the same word.
+
+    Unmatched new keywords are bucketed by length, so each old keyword is only
+    compared against candidates whose length is within one character.
+    """
+    total_keywords = len(old_keywords | new_keywords)
+    if not total_keywords:
+        return 1.0
+    
+    overlap = len(old_keywords & new_keywords)
+    by_length: dict = {}
+    for word in new_keywords - old_keywords:
+        by_length.setdefault(len(word), []).append(word)
+    
+    for word in old_keywords - new_keywords:
+        for length in (len(word), len(word) - 1, len(word) + 1):
+            candidates = by_length.get(length, [])
+            match = next(
+                (c for c in candidates if bounded_edit_distance(word, c, 1) <= 1),
+                None
+            )
+            if match is not None:
+                candidates.remove(match)
+                overlap += 1
+                break
+    
+    # Each fuzzy match merges two distinct keywords into one
+    union = len(old_keywords) + len(new_keywords) - overlap
+    return overlap / union
+
+
 def is_typo_fix(old_val: str, new_val: str) -> bool:
     """Detect if change is a typo fix (high similarity, low edit distance)."""
     if not isinstance(old_val, str) or not isinstance(new_val, str):
         return False
     
-    # Simple Levenshtein-like check: same length, few character differences
-    if abs(len(old_val) - len(new_val)) > 3:
+    # Cheap reject before computing the distance
+    if abs(len(old_val) - len(new_val)) > TYPO_MAX_EDITS:
         return False
     
-    # Count character differences
-    differences = sum(1 for a, b in zip(old_val.lower(), new_val.lower()) if a != b)
-    differences += abs(len(old_val) - len(new_val))
-    
-    # Threshold: 3 or fewer character differences is likely a typo
-    return differences <= 3
+    # Threshold: 3 or fewer character edits is likely a typo
+    distance = bounded_edit_distance(old_val.lower(), new_val.lower(), TYPO_MAX_EDITS)
+    return distance <= TYPO_MAX_EDITS
 
 
 def is_clarification(old_val: str, new_val: str) -> bool:
@@ -189,19 +312,15 @@ def is_meaning_change(old_val: str, new_val: str) -> bool:
     if not isinstance(old_val, str) or not isinstance(new_val, str):
         return True  # Non-string changes are breaking by default
     
-    # Extract key words (nouns, verbs - simplified as words > 4 chars)
-    old_keywords = {w.lower() for w in old_val.split() if len(w) > 4}
-    new_keywords = {w.lower() for w in new_val.split() if len(w) > 4}
+    old_keywords = keyword_tokens(old_val)
+    new_keywords = keyword_tokens(new_val)
     
     # If keywords significantly differ, meaning changed
     if not old_keywords or not new_keywords:
         return False
     
-    overlap = len(old_keywords & new_keywords)
-    total = len(old_keywords | new_keywords)
-    
     # Less than 50% keyword overlap suggests meaning change
-    return overlap / total < 0.5 if total > 0 else False
+    return keyword_similarity(old_keywords, new_keywords) < 0.5
 
 
 def diff_states(base: dict, head: dict, result: DiffResult, counters: dict) -> None:
@@ -385,24 +504,106 @@ def diff_vocabulary(base: dict, head: dict, result: DiffResult, counters: dict)
             ))
 
 
+# Fields that identify an entry in an array section, in priority order
+ARRAY_KEY_FIELDS = ("id", "name", "code")
+
+
+def entry_key(item: Any, key_fields: tuple = ARRAY_KEY_FIELDS) -> Any:
+    """Stable key for an array entry: its first present key field, or the value itself.
+
+    Unhashable keys (a list or mapping used as an id, or an entry without
+    key fields) are replaced by their JSON text.
+    """
+    if isinstance(item, dict):
+        for key_field in key_fields:
+            if item.get(key_field) is not None:
+                item = item[key_field]
+                break
+        else:
+            return json.dumps(item, sort_keys=True, default=str)
+    try:
+        hash(item)
+        return item
+    except TypeError:
+        return json.dumps(item, sort_keys=True, default=str)
+
+
+def index_entries(items: list, key_fields: tuple = ARRAY_KEY_FIELDS) -> dict:
+    """Map each entry's stable key to (position, entry).
+
+    When several entries share a key the last one wins, as in a dict built
+    from the list, and the key is ordered by that last position.
+    """
+    index = {}
+    for position, item in enumerate(items or []):
+        key = entry_key(item, key_fields)
+        index.pop(key, None)
+        index[key] = (position, item)
+    return index
+
+
+def find_moved_keys(base_index: dict, head_index: dict) -> list:
+    """Keys present in both versions whose relative order changed.
+
+    The longest run of common entries that kept their relative order (a
+    longest increasing subsequence of base positions, in head order) is
+    treated as stationary; every other common entry moved. O(n log n).
+    """
+    common = [key for key in head_index if key in base_index]
+    positions = [base_index[key][0] for key in common]
+    
+    tails: list = []       # smallest tail base position for each run length
+    tail_indexes: list = []
+    previous = [-1] * len(common)
+    for i, position in enumerate(positions):
+        length = bisect_left(tails, position)
+        if length == len(tails):
+            tails.append(position)
+            tail_indexes.append(i)
+        else:
+            tails[length] = position
+            tail_indexes[length] = i
+        previous[i] = tail_indexes[length - 1] if length else -1
+    
+    stationary = set()
+    i = tail_indexes[-1] if tail_indexes else -1
+    while i != -1:
+        stationary.add(i)
+        i = previous[i]
+    
+    return [key for i, key in enumerate(common) if i not in stationary]
+
+
+def describe_entry(item: Any, key: Any) -> Any:
+    return item if not isinstance(item, dict) else key
+
+
 def diff_array_section(base: dict, head: dict, section: str, 
                        result: DiffResult, counters: dict,
                        removal_breaking: bool = True) -> None:
-    """Diff an array section (user_goals, core_actions)."""
-    base_items = set(base.get(section, []))
-    head_items = set(head.get(section, []))
+    """Diff an array section (user_goals, core_actions).
+
+    Entries are matched by stable key (id/name/code, or the value itself)
+    through hash indexes, so matching is O(n). Reordered entries are
+    reported as moves instead of a removal plus an addition.
+    """
+    base_index = index_entries(base.get(section, []))
+    head_index = index_entries(head.get(section, []))
     
     # Removed items
-    for item in base_items - head_items:
+    for key, (_, item) in base_index.items():
+        if key in head_index:
+            continue
+        label = describe_entry(item, key)
         if removal_breaking:
             counters["break"] += 1
             result.changes.append(Change(
                 code=f"BREAK-{counters['break']:03d}",
                 change_type=ChangeType.BREAKING,
                 section=section,
-                description=f"Removed from {section}: {item}",
+                description=f"Removed from {section}: {label}",
                 base_value=item,
-                migration=f"Remove references to '{item}'"
+                migration=f"Remove references to '{label}'"
             ))
         else:
             counters["corr"] += 1
@@ -410,57 +611,89 @@ def diff_array_section(base: dict, head: dict, section: str,
                 code=f"CORR-{counters['corr']:03d}",
                 change_type=ChangeType.CORRECTIVE,
                 section=section,
-                description=f"Removed from {section}: {item}",
+                description=f"Removed from {section}: {label}",
                 base_value=item
             ))
     
     # Added items
-    for item in head_items - base_items:
+    for key, (_, item) in head_index.items():
+        if key in base_index:
+            continue
         counters["add"] += 1
         result.changes.append(Change(
             code=f"ADD-{counters['add']:03d}",
             change_type=ChangeType.ADDITIVE,
             section=section,
-            description=f"Added to {section}: {item}",
+            description=f"Added to {section}: {describe_entry(item, key)}",
             head_value=item
         ))
+    
+    # Modified items (keyed dict entries whose content changed)
+    for key, (_, item) in head_index.items():
+        if key in base_index and base_index[key][1] != item:
+            counters["corr"] += 1
+            result.changes.append(Change(
+                code=f"CORR-{counters['corr']:03d}",
+                change_type=ChangeType.CORRECTIVE,
+                section=section,
+                description=f"Updated in {section}: {key}",
+                base_value=base_index[key][1],
+                head_value=item
+            ))
+    
+    # Moved items
+    for key in find_moved_keys(base_index, head_index):
+        base_position, item = base_index[key]
+        head_position = head_index[key][0]
+        counters["corr"] += 1
+        result.changes.append(Change(
+            code=f"CORR-{counters['corr']:03d}",
+            change_type=ChangeType.CORRECTIVE,
+            section=section,
+            description=f"Moved in {section}: {describe_entry(item, key)} "
+                        f"(position {base_position + 1} -> {head_position + 1})",
+            base_value=base_position,
+            head_value=head_position
+        ))
 
 
 def diff_error_taxonomy(base: dict, head: dict, result: DiffResult, counters: dict) -> None:
-    """Diff error taxonomy section."""
-    base_errors = {e.get("code"): e for e in base.get("error_taxonomy", [])}
-    head_errors = {e.get("code"): e for e in head.get("error_taxonomy", [])}
-    
-    base_codes = set(base_errors.keys())
-    head_codes = set(head_errors.keys())
+    """Diff error taxonomy section. Entries are matched by code."""
+    base_index = index_entries(base.get("error_taxonomy", []), ("code",))
+    head_index = index_entries(head.get("error_taxonomy", []), ("code",))
     
     # Removed errors (breaking)
-    for code in base_codes - head_codes:
+    for code, (_, base_err) in base_index.items():
+        if code in head_index:
+            continue
         counters["break"] += 1
         result.changes.append(Change(
             code=f"BREAK-{counters['break']:03d}",
             change_type=ChangeType.BREAKING,
             section=f"error_taxonomy.{code}",
             description=f"Error code removed: {code}",
-            base_value=base_errors[code],
+            base_value=base_err,
             migration=f"Update error handling for '{code}'"
         ))
     
     # Added errors (additive)
-    for code in head_codes - base_codes:
+    for code, (_, head_err) in head_index.items():
+        if code in base_index:
+            continue
         counters["add"] += 1
         result.changes.append(Change(
             code=f"ADD-{counters['add']:03d}",
             change_type=ChangeType.ADDITIVE,
             section=f"error_taxonomy.{code}",
             description=f"Error code added: {code}",
-            head_value=head_errors[code]
+            head_value=head_err
         ))
     
     # Modified errors
-    for code in base_codes & head_codes:
-        base_err = base_errors[code]
-        head_err = head_errors[code]
+    for code, (_, head_err) in head_index.items():
+        if code not in base_index:
+            continue
+        base_err = base_index[code][1]
         
         if base_err == head_err:
             continue
@@ -490,6 +723,19 @@ def diff_error_taxonomy(base: dict, head: dict, result: DiffResult, counters: di
                     base_value=old_msg,
                     head_value=new_msg
                 ))
+    
+    # Moved errors
+    for code in find_moved_keys(base_index, head_index):
+        counters["corr"] += 1
+        result.changes.append(Change(
+            code=f"CORR-{counters['corr']:03d}",
+            change_type=ChangeType.CORRECTIVE,
+            section=f"error_taxonomy.{code}",
+            description=f"Error code moved: {code} "
+                        f"(position {base_index[code][0] + 1} -> {head_index[code][0] + 1})",
+            base_value=base_index[code][0],
+            head_value=head_index[code][0]
+        ))
 
 
 def diff(base: dict, head: dict) -> DiffResult:
@@ -515,19 +761,202 @@ def diff(base: dict, head: dict) -> DiffResult:
     return result
 
 
+SNAPSHOT_SUFFIXES = (".yaml", ".yml", ".json")
+
+
+def version_key(version: Any) -> Optional[tuple]:
+    """Sortable (major, minor, patch) tuple for a version string, or None."""
+    match = re.match(r"^v?(\d+)\.(\d+)\.(\d+)", str(version))
+    return tuple(int(part) for part in match.groups()) if match else None
+
+
+def pack_version(pack: dict) -> str:
+    return (pack or {}).get("feature", {}).get("version", "unknown")
+
+
+class SnapshotParseError(Exception):
+    """A history snapshot could not be read or parsed."""
+
+
+def _load_snapshot(path: Path) -> dict:
+    try:
+        return load_context_pack(path)
+    except Exception as e:
+        raise SnapshotParseError(f"{path}: {e}") from e
+
+
+def _diff_pair(pair: tuple) -> DiffResult:
+    return diff(*pair)
+
+
+def diff_history(paths: list, jobs: int = 1, sort_by_version: bool = False) -> list:
+    """Diff consecutive snapshots of a pack.
+
+    Each snapshot is parsed exactly once, then consecutive pairs are diffed.
+    With jobs > 1, both phases run in a process pool. With sort_by_version,
+    snapshots are ordered by feature.version when every snapshot has a
+    semver version, and by path otherwise.
+
+    Returns a list of (base_path, head_path, DiffResult). Raises
+    SnapshotParseError if a snapshot cannot be parsed.
+    """
+    executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    try:
+        mapper = executor.map if executor else map
+        packs = list(mapper(_load_snapshot, paths))
+        
+        order = list(range(len(paths)))
+        if sort_by_version:
+            keys = [version_key(pack_version(pack)) for pack in packs]
+            if all(key is not None for key in keys):
+                order.sort(key=lambda i: (keys[i], str(paths[i])))
+        paths = [paths[i] for i in order]
+        packs = [packs[i] for i in order]
+        
+        results = list(mapper(_diff_pair, zip(packs, packs[1:])))
+    finally:
+        if executor:
+            executor.shutdown()
+    
+    return [(paths[i], paths[i + 1], result) for i, result in enumerate(results)]
+
+
+def build_changelog(steps: list) -> dict:
+    """Build a changelog from diff_history steps.
+
+    recommended_chain starts at the first snapshot's declared version and
+    applies each step's recommended increment in turn, showing what the
+    version history would be had every recommendation been followed.
+    """
+    if not steps:
+        return {"pack": "unknown", "versions": [], "recommended_chain": [], "steps": [], "summary": {}}
+    
+    first = steps[0][2]
+    versions = [first.base_version] + [result.head_version for _, _, result in steps]
+    chain = [first.base_version]
+    entries = []
+    for base_path, head_path, result in steps:
+        chain.append(bump_version(chain[-1], result.version_bump))
+        entries.append({
+            "base_file": str(base_path),
+            "head_file": str(head_path),
+            "matches_recommendation": result.head_version == result.recommended_version,
+            **result.to_json()
+        })
+    
+    return {
+        "pack": steps[-1][2].pack_name,
+        "versions": versions,
+        "recommended_chain": chain,
+        "summary": {
+            "steps": len(steps),
+            "breaking": sum(len(result.breaking) for _, _, result in steps),
+            "additive": sum(len(result.additive) for _, _, result in steps),
+            "corrective": sum(len(result.corrective) for _, _, result in steps),
+            "version_mismatches": sum(1 for e in entries if not e["matches_recommendation"])
+        },
+        "steps": entries
+    }
+
+
+def make_synthetic_packs(entries: int, seed: int = 0) -> tuple:
+    """Build a base/head pack pair with `entries` items per array section.
+
+    The head removes, adds, edits and moves about 1% of entries each.
+    """
+    rng = random.Random(seed)
+    base = {
+        "feature": {"name": "synthetic", "version": "1.0.0"},
+        "user_goals": [f"goal-{i}" for i in range(entries)],
+        "core_actions": [{"id": f"action-{i}", "label": f"Action {i}"} for i in range(entries)],
+        "error_taxonomy": [
+            {"code": f"E{i:06d}", "message_pattern": f"Could not complete step {i}"}
+            for i in range(entries)
+        ],
+    }
+    head = json.loads(json.dumps(base))
+    head["feature"]["version"] = "1.1.0"
+    churn = max(1, entries // 100)
+    for section in ("user_goals", "core_actions", "error_taxonomy"):
+        items = head[section]
+        for _ in range(churn):
+            items.pop(rng.randrange(len(items)))
+        for _ in range(churn):
+            items.insert(rng.randrange(len(items)), items.pop(rng.randrange(len(items))))
+        for i in range(churn):
+            items.append(f"new-goal-{i}" if section == "user_goals"
+                         else {"id": f"new-{i}", "code": f"N{i:06d}", "message_pattern": "New"})
+    for item in rng.sample(head["error_taxonomy"], churn):
+        item["message_pattern"] += " again"
+    return base, head
+
+
+def benchmark(entries: int = 50000) -> dict:
+    """Time a full diff of synthetic packs with `entries` items per array section."""
+    base, head = make_synthetic_packs(entries)
+    start = time.perf_counter()
+    result = diff(base, head)
+    elapsed = time.perf_counter() - start
+    return {
+        "entries_per_section": entries,
+        "seconds": round(elapsed, 3),
+        "summary": result.to_json()["summary"],
+    }
+
+
 def main():
-    if len(sys.argv) < 3:
-        print("Usage: python diff_context_packs.py <base.yaml> <head.yaml>", file=sys.stderr)
-        sys.exit(2)
+    parser = argparse.ArgumentParser(
+        description="Compare context pack versions and recommend a version increment"
+    )
+    parser.add_argument("packs", nargs="*", help="Base and head packs, or ordered snapshots with --history")
+    parser.add_argument("--history", action="store_true",
+                        help="Diff each consecutive pair of the given snapshots")
+    parser.add_argument("--history-dir", metavar="DIR",
+                        help="Diff every snapshot in DIR, ordered by feature.version")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="Worker processes for history mode (default: 1)")
+    parser.add_argument("--benchmark", nargs="?", type=int, const=50000, metavar="ENTRIES",
+                        help="Time a diff of synthetic packs (default: 50000 entries)")
+    args = parser.parse_args()
+    
+    if args.benchmark is not None:
+        print(json.dumps(benchmark(args.benchmark), indent=2))
+        sys.exit(0)
+    
+    if args.history_dir:
+        directory = Path(args.history_dir)
+        if not directory.is_dir():
+            print(f"Error: Not a directory: {directory}", file=sys.stderr)
+            sys.exit(2)
+        paths = sorted(p for p in directory.iterdir() if p.suffix in SNAPSHOT_SUFFIXES)
+    else:
+        paths = [Path(p) for p in args.packs]
     
-    base_path = Path(sys.argv[1])
-    head_path = Path(sys.argv[2])
+    history = args.history or bool(args.history_dir)
+    if (history and len(paths) < 2) or (not history and len(paths) != 2):
+        parser.print_usage(sys.stderr)
+        sys.exit(2)
     
-    for p in [base_path, head_path]:
+    for p in paths:
         if not p.exists():
             print(f"Error: File not found: {p}", file=sys.stderr)
             sys.exit(2)
     
+    if history:
+        try:
+            steps = diff_history(paths, jobs=args.jobs, sort_by_version=bool(args.history_dir))
+            changelog = build_changelog(steps)
+        except SnapshotParseError as e:
+            print(f"Error: Failed to parse files: {e}", file=sys.stderr)
+            sys.exit(2)
+        except Exception as e:
+            print(f"Error: Failed to diff snapshots: {e}", file=sys.stderr)
+            sys.exit(2)
+        print(json.dumps(changelog, indent=2))
+        sys.exit(1 if changelog["summary"]["breaking"] else 0)
+    
+    base_path, head_path = paths
+    
     try:
         base = load_context_pack(base_path)
         head = load_context_pack(head_path)
@@ -14,8 +14,10 @@ Exit codes:
 import sys
 import re
 from pathlib import Path
-from typing import NamedTuple
+from typing import NamedTuple, Optional
 from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 # --- Constants (justified) ---
 # Minimum states for a meaningful feature: entry + at least one other
@@ -32,79 +34,159 @@ REQUIRED_STATE_SECTIONS = [
     'Type', 'Description', 'Entry triggers', 'Content requirements'
 ]
 
+# Level 3+ headings that are not states
+NON_STATE_SECTIONS = {'change', 'overview'}
+
+HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.+)$')
+FENCE_PATTERN = re.compile(r'^\s*(`{3,}|~{3,})\s*(\S*)')
+TYPE_PATTERN = re.compile(r'\*\*Type:\*\*\s*(\w+)')
+EXIT_TARGET_PATTERN = re.compile(r'→\s*(\w+):')
+# state --> state, where either side may be the [*] start/end marker
+EDGE_PATTERN = re.compile(r'(\w+)?\s*-->\s*(\w+)?')
+
+EXIT_MARKER = '**Exit transitions:**'
+
 
 class ValidationResult(NamedTuple):
     passed: bool
     message: str
 
 
+@dataclass
+class StateMap:
+    """States documented in a state map and the edges of its Mermaid diagram.
+
+    State records hold the state type, whether entry triggers, exit
+    transitions and content requirements are documented, and the exit
+    targets. Diagram edges are (source, target) pairs; None stands for
+    the [*] start/end marker.
+    """
+    states: dict[str, dict] = field(default_factory=dict)
+    diagram_edges: list[tuple[Optional[str], Optional[str]]] = field(default_factory=list)
+
+    @property
+    def diagram_states(self) -> set[str]:
+        names = set()
+        for source, target in self.diagram_edges:
+            names.add(source)
+            names.add(target)
+        names.discard(None)
+        return names
+
+    def inbound(self) -> dict[str, list[str]]:
+        """Map each exit target to the documented states that lead to it."""
+        inbound = defaultdict(list)
+        for state_name, info in self.states.items():
+            for target in info['exit_targets']:
+                inbound[target].append(state_name)
+        return inbound
+
+
+def _new_state_record() -> dict:
+    return {
+        'type': None,
+        'has_entry_triggers': False,
+        'has_exit_transitions': False,
+        'has_content_requirements': False,
+        'exit_targets': []
+    }
+
+
+@lru_cache(maxsize=8)
+def parse_state_map(content: str) -> StateMap:
+    """Scan a state map once, line by line, into state records and diagram edges.
+
+    A state section starts at a level 3+ heading and ends at the next
+    heading of level 2 or deeper (##, ###, ...). A level 1 heading does not
+    end it and is read as part of the section. Exit targets are read from the first
+    Exit transitions list, up to the next bold label. Only the first
+    Mermaid block is read. Headings inside code fences are ignored.
+
+    Parsed maps are shared between callers. Treat them as read-only.
+    """
+    state_map = StateMap()
+    record = None
+    in_exits = False
+    exits_read = False
+    fence = None
+    in_mermaid = False
+    mermaid_read = False
+
+    for line in content.split('\n'):
+        if '`' in line or '~' in line:
+            fence_match = FENCE_PATTERN.match(line)
+            if fence_match:
+                if fence is None:
+                    fence = fence_match.group(1)
+                    in_mermaid = not mermaid_read and fence_match.group(2) == 'mermaid'
+                    continue
+                if fence_match.group(1).startswith(fence) and not fence_match.group(2):
+                    fence = None
+                    if in_mermaid:
+                        in_mermaid = False
+                        mermaid_read = True
+                    continue
+
+        if in_mermaid:
+            if '-->' in line:
+                for edge in EDGE_PATTERN.finditer(line):
+                    state_map.diagram_edges.append((edge.group(1), edge.group(2)))
+            continue
+
+        if fence is None and line.startswith('##'):
+            heading = HEADING_PATTERN.match(line)
+            if heading:
+                record = None
+                in_exits = False
+                name = heading.group(2).strip()
+                if len(heading.group(1)) >= 3 and name.lower() not in NON_STATE_SECTIONS:
+                    record = _new_state_record()
+                    state_map.states[name] = record
+                    exits_read = False
+                continue
+
+        if record is None:
+            continue
+        if '**' not in line and '→' not in line and 'Exit transitions' not in line:
+            continue
+
+        if record['type'] is None and '**Type:**' in line:
+            type_match = TYPE_PATTERN.search(line)
+            if type_match:
+                record['type'] = type_match.group(1).lower()
+        if '**Entry triggers:**' in line:
+            record['has_entry_triggers'] = True
+        if '**Content requirements:**' in line:
+            record['has_content_requirements'] = True
+        if 'Exit transitions' in line:
+            record['has_exit_transitions'] = True
+
+        # Exit targets run from the label to the next bold label
+        if not exits_read and EXIT_MARKER in line:
+            in_exits = True
+            exits_read = True
+            line = line.split(EXIT_MARKER, 1)[1]
+        if in_exits:
+            if '**' in line:
+                line = line[:line.index('**')]
+                in_exits = False
+            if '→' in line:
+                record['exit_targets'].extend(EXIT_TARGET_PATTERN.findall(line))
+
+    return state_map
+
+
 def extract_states_from_diagram(content: str) -> set[str]:
     """Extract state names from Mermaid diagram."""
-    states = set()
-    
-    # Find mermaid block
-    mermaid_match = re.search(r'```mermaid\s*\n(.*?)```', content, re.DOTALL)
-    if not mermaid_match:
-        return states
-    
-    mermaid_content = mermaid_match.group(1)
-    
-    # Extract states from transitions (state1 --> state2)
-    transitions = re.findall(r'(\w+)\s*-->', mermaid_content)
-    states.update(transitions)
-    
-    targets = re.findall(r'-->\s*(\w+)', mermaid_content)
-    states.update(targets)
-    
-    # Remove special markers
-    states.discard('*')  # [*] start/end marker
-    
-    return states
+    return parse_state_map(content).diagram_states
 
 
 def extract_documented_states(content: str) -> dict[str, dict]:
     """Extract state details from documentation sections."""
-    states = {}
-    
-    # Find all ### State sections
-    state_sections = re.findall(
-        r'###\s+([^\n]+)\n(.*?)(?=###|\n## |$)', 
-        content, 
-        re.DOTALL
-    )
-    
-    for name, body in state_sections:
-        name = name.strip()
-        if name.lower() in ['change', 'overview']:  # Skip non-state sections
-            continue
-        
-        state_info = {
-            'type': None,
-            'has_entry_triggers': False,
-            'has_exit_transitions': False,
-            'has_content_requirements': False,
-            'exit_targets': []
-        }
-        
-        # Extract type
-        type_match = re.search(r'\*\*Type:\*\*\s*(\w+)', body)
-        if type_match:
-            state_info['type'] = type_match.group(1).lower()
-        
-        # Check for required sections
-        state_info['has_entry_triggers'] = '**Entry triggers:**' in body
-        state_info['has_exit_transitions'] = '**Exit transitions:**' in body or 'Exit transitions' in body
-        state_info['has_content_requirements'] = '**Content requirements:**' in body
-        
-        # Extract exit transition targets
-        exit_section = re.search(r'\*\*Exit transitions:\*\*\s*(.*?)(?=\*\*|\n###|$)', body, re.DOTALL)
-        if exit_section:
-            targets = re.findall(r'→\s*(\w+):', exit_section.group(1))
-            state_info['exit_targets'] = targets
-        
-        states[name] = state_info
-    
-    return states
+    return {
+        name: {**info, 'exit_targets': list(info['exit_targets'])}
+        for name, info in parse_state_map(content).states.items()
+    }
 
 
 def validate_overview(content: str) -> list[ValidationResult]:
@@ -136,8 +218,9 @@ def validate_states(content: str) -> list[ValidationResult]:
     """Validate state definitions."""
     results = []
     
-    diagram_states = extract_states_from_diagram(content)
-    documented_states = extract_documented_states(content)
+    state_map = parse_state_map(content)
+    diagram_states = state_map.diagram_states
+    documented_states = state_map.states
     
     # Check minimum states
     total_states = len(documented_states)
@@ -190,13 +273,9 @@ def validate_transitions(content: str) -> list[ValidationResult]:
     """Validate transition completeness."""
     results = []
     
-    documented_states = extract_documented_states(content)
-    
-    # Build inbound transition map
-    inbound = defaultdict(list)
-    for state_name, info in documented_states.items():
-        for target in info['exit_targets']:
-            inbound[target].append(state_name)
+    state_map = parse_state_map(content)
+    documented_states = state_map.states
+    inbound = state_map.inbound()
     
     # Check entry state
     entry_match = re.search(r'\*\*Entry state:\*\*\s*(\S+)', content)
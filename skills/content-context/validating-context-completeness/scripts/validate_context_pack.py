@@ -18,11 +18,20 @@ Exit codes:
 import sys
 import json
 import re
+from collections import Counter
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Optional
 from enum import Enum
 
+# Parsed files are memoized by scripts/yaml_loader.py when this skill sits in
+# the repository; a copy of the skill parses each file itself.
+try:
+    sys.path.append(str(Path(__file__).resolve().parents[4] / "scripts"))
+    from yaml_loader import load_cached
+except (IndexError, ImportError):
+    load_cached = None
+
 # Constants with justification
 REQUIRED_SECTIONS = [
     "feature",
@@ -42,6 +51,9 @@ REQUIRED_ERROR_FIELDS = ["code", "message_pattern", "recovery"]  # Per error tax
 NAME_PATTERN = re.compile(r"^[a-z][a-z0-9-]*$")  # lowercase-hyphenated per naming rules
 SNAKE_CASE_PATTERN = re.compile(r"^[a-z][a-z0-9_]*$")  # for states and actions
 
+WILDCARD_STATE = "any"  # transition source that matches every state
+MAX_CYCLE_NAMES = 5  # states listed in a trap cycle message
+
 
 class Severity(Enum):
     BLOCKING = "blocking"
@@ -63,19 +75,23 @@ class ValidationResult:
     pack_name: str = "unknown"
     version: str = "unknown"
     issues: list = field(default_factory=list)
+    counts: Counter = field(default_factory=Counter, repr=False)
     
     @property
     def status(self) -> str:
-        blocking = [i for i in self.issues if i.severity == Severity.BLOCKING]
-        warnings = [i for i in self.issues if i.severity == Severity.WARNING]
-        if blocking:
+        if self.counts[Severity.BLOCKING]:
             return "FAIL"
-        if warnings:
+        if self.counts[Severity.WARNING]:
             return "PASS_WITH_WARNINGS"
         return "PASS"
     
     def add(self, code: str, severity: Severity, location: str, message: str, remediation: str = ""):
         self.issues.append(Issue(code, severity, location, message, remediation))
+        self.counts[severity] += 1
+    
+    def count(self, severity: Severity) -> int:
+        """Number of issues of one severity, without rescanning issues."""
+        return self.counts[severity]
     
     def to_json(self) -> dict:
         return {
@@ -99,6 +115,11 @@ class ValidationResult:
 
 def load_context_pack(file_path: Path) -> dict:
     """Load context pack from YAML or JSON file."""
+    if load_cached is not None and file_path.suffix in [".yaml", ".yml", ".json"]:
+        try:
+            return load_cached(file_path)
+        except ImportError:
+            pass  # PyYAML is not installed; parse as JSON below
     content = file_path.read_text(encoding="utf-8")
     
     if file_path.suffix in [".yaml", ".yml"]:
@@ -187,8 +208,8 @@ def validate_states(pack: dict, result: ValidationResult) -> None:
         return
     
     states = pack["states"]
-    issue_counter = len([i for i in result.issues if i.severity == Severity.BLOCKING]) + 1
-    warn_counter = len([i for i in result.issues if i.severity == Severity.WARNING]) + 1
+    issue_counter = result.count(Severity.BLOCKING) + 1
+    warn_counter = result.count(Severity.WARNING) + 1
     
     for state_name, state_def in states.items():
         if not isinstance(state_def, dict):
@@ -238,16 +259,232 @@ def validate_states(pack: dict, result: ValidationResult) -> None:
             warn_counter += 1
 
 
-def validate_transitions(pack: dict, result: ValidationResult) -> None:
+def parse_state_list(value: Any) -> list[str]:
+    """Split a transition's from field: a comma-separated string or a list."""
+    if isinstance(value, list):
+        return [str(s).strip() for s in value]
+    return [s.strip() for s in str(value).split(",")]
+
+
+@dataclass
+class StateGraph:
+    """States and transitions compiled once into numbered adjacency lists.
+
+    Transitions from the wildcard state go through one virtual node: every
+    state has an edge to it and it has an edge to each wildcard target.
+    This keeps the graph at O(V + E) edges instead of V per wildcard.
+    """
+    names: list[str]
+    index: dict[str, int]
+    successors: list[list[int]]
+    wildcard_targets: list[int]
+    terminal: list[bool]
+    initial: Optional[int]
+    # Undefined references per transition index: (field, state name)
+    undefined: dict[int, list[tuple[str, str]]] = field(default_factory=dict)
+
+    @property
+    def wildcard(self) -> int:
+        """Node id of the virtual wildcard node."""
+        return len(self.names)
+
+    def neighbors(self, node: int) -> list[int]:
+        if node == self.wildcard:
+            return self.wildcard_targets
+        if self.wildcard_targets:
+            return self.successors[node] + [self.wildcard]
+        return self.successors[node]
+
+    def reachable(self) -> list[bool]:
+        """Breadth-first reachability from the initial state."""
+        seen = [False] * (len(self.names) + 1)
+        if self.initial is None:
+            return seen[:-1]
+        seen[self.initial] = True
+        queue = [self.initial]
+        for node in queue:
+            for target in self.neighbors(node):
+                if not seen[target]:
+                    seen[target] = True
+                    queue.append(target)
+        return seen[:-1]
+
+    def dead_ends(self) -> list[int]:
+        """Non-terminal states with no outgoing transition."""
+        if self.wildcard_targets:
+            return []
+        return [
+            node for node, targets in enumerate(self.successors)
+            if not targets and not self.terminal[node]
+        ]
+
+    def components(self) -> list[list[int]]:
+        """Strongly connected components (Tarjan), iterative so deep graphs are safe.
+
+        Components come out in reverse topological order and may include
+        the wildcard node.
+        """
+        size = len(self.names) + (1 if self.wildcard_targets else 0)
+        order = [-1] * size
+        low = [0] * size
+        on_stack = [False] * size
+        stack: list[int] = []
+        components: list[list[int]] = []
+        counter = 0
+        for root in range(size):
+            if order[root] != -1:
+                continue
+            order[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            work = [(root, iter(self.neighbors(root)))]
+            while work:
+                node, targets = work[-1]
+                for target in targets:
+                    if order[target] == -1:
+                        order[target] = low[target] = counter
+                        counter += 1
+                        stack.append(target)
+                        on_stack[target] = True
+                        work.append((target, iter(self.neighbors(target))))
+                        break
+                    if on_stack[target] and order[target] < low[node]:
+                        low[node] = order[target]
+                else:
+                    work.pop()
+                    if work and low[node] < low[work[-1][0]]:
+                        low[work[-1][0]] = low[node]
+                    if low[node] == order[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack[member] = False
+                            component.append(member)
+                            if member == node:
+                                break
+                        components.append(component)
+        return components
+
+    def trap_cycles(self, reachable: list[bool]) -> list[list[int]]:
+        """Reachable cycles that no transition leaves and that hold no terminal state.
+
+        The component holding the initial state is not a trap: a flow that
+        always returns to where it started is a loop, not a dead end.
+        """
+        component_of = [-1] * (len(self.names) + 1)
+        components = self.components()
+        for number, component in enumerate(components):
+            for node in component:
+                component_of[node] = number
+        traps = []
+        for number, component in enumerate(components):
+            states = [node for node in component if node != self.wildcard]
+            if not states or not reachable[states[0]] or self.initial in states:
+                continue
+            if len(component) == 1 and states[0] not in self.successors[states[0]]:
+                continue
+            if any(self.terminal[node] for node in states):
+                continue
+            if all(
+                component_of[target] == number
+                for node in component for target in self.neighbors(node)
+            ):
+                traps.append(sorted(states))
+        return traps
+
+
+def is_state_name_list(value: Any) -> bool:
+    return isinstance(value, list) and all(isinstance(name, str) for name in value)
+
+
+def initial_state_name(pack: dict) -> Any:
+    """The pack's initial_state, or the feature's, as written (None if unset)."""
+    feature = pack.get("feature") if isinstance(pack.get("feature"), dict) else {}
+    return pack.get("initial_state", feature.get("initial_state"))
+
+
+def compile_state_graph(pack: dict) -> Optional[StateGraph]:
+    """Compile a pack's states and transitions, parsing each transition once.
+
+    A terminal_states value that is not a list of names marks no state
+    terminal, and an initial_state that is not a name leaves the graph
+    without an initial state. validate_state_graph reports both.
+    """
+    states = pack.get("states")
+    transitions = pack.get("transitions")
+    if not isinstance(states, dict) or not isinstance(transitions, list):
+        return None
+
+    names = list(states)
+    index = {name: node for node, name in enumerate(names)}
+    successor_sets: list[set[int]] = [set() for _ in names]
+    wildcard_targets: set[int] = set()
+    undefined: dict[int, list[tuple[str, str]]] = {}
+
+    for i, transition in enumerate(transitions):
+        if not isinstance(transition, dict):
+            continue
+        sources: list[int] = []
+        from_any = False
+        if "from" in transition:
+            for name in parse_state_list(transition["from"]):
+                if name == WILDCARD_STATE:
+                    from_any = True
+                elif name in index:
+                    sources.append(index[name])
+                else:
+                    undefined.setdefault(i, []).append(("from", name))
+        if "to" not in transition:
+            continue
+        target_name = transition["to"]
+        if target_name == WILDCARD_STATE:
+            continue
+        target = index.get(target_name) if isinstance(target_name, str) else None
+        if target is None:
+            undefined.setdefault(i, []).append(("to", str(target_name)))
+            continue
+        if from_any:
+            wildcard_targets.add(target)
+        for source in sources:
+            successor_sets[source].add(target)
+
+    terminal_states = pack.get("terminal_states")
+    terminal_names = set(terminal_states) if is_state_name_list(terminal_states) else set()
+    terminal = [
+        name in terminal_names
+        or (isinstance(states[name], dict) and states[name].get("terminal") is True)
+        for name in names
+    ]
+
+    initial_name = initial_state_name(pack)
+    if initial_name is None:
+        initial = 0 if names else None
+    else:
+        initial = index.get(initial_name) if isinstance(initial_name, str) else None
+
+    return StateGraph(
+        names=names,
+        index=index,
+        successors=[sorted(targets) for targets in successor_sets],
+        wildcard_targets=sorted(wildcard_targets),
+        terminal=terminal,
+        initial=initial,
+        undefined=undefined,
+    )
+
+
+def validate_transitions(pack: dict, result: ValidationResult, graph: Optional[StateGraph] = None) -> None:
     """Validate transitions reference defined states."""
     if "transitions" not in pack or "states" not in pack:
         return
     
     transitions = pack["transitions"]
-    states = set(pack["states"].keys())
-    states.add("any")  # Special wildcard state
+    if graph is None:
+        graph = compile_state_graph(pack)
+    undefined = graph.undefined if graph is not None else {}
     
-    issue_counter = len([i for i in result.issues if i.severity == Severity.BLOCKING]) + 1
+    issue_counter = result.count(Severity.BLOCKING) + 1
     
     for i, transition in enumerate(transitions):
         if not isinstance(transition, dict):
@@ -273,31 +510,102 @@ def validate_transitions(pack: dict, result: ValidationResult) -> None:
                 )
                 issue_counter += 1
         
-        # Check state references
-        if "from" in transition:
-            from_state = transition["from"]
-            # Handle comma-separated states
-            from_states = [s.strip() for s in from_state.split(",")]
-            for fs in from_states:
-                if fs not in states:
-                    result.add(
-                        f"BLOCK-{issue_counter:03d}",
-                        Severity.BLOCKING,
-                        f"transitions[{i}].from",
-                        f"Transition from undefined state: {fs}",
-                        f"Define state '{fs}' or fix reference"
-                    )
-                    issue_counter += 1
-        
-        if "to" in transition and transition["to"] not in states:
+        # Check state references, resolved when the graph was compiled
+        for field_name, name in undefined.get(i, []):
+            direction = "from" if field_name == "from" else "to"
+            result.add(
+                f"BLOCK-{issue_counter:03d}",
+                Severity.BLOCKING,
+                f"transitions[{i}].{field_name}",
+                f"Transition {direction} undefined state: {name}",
+                f"Define state '{name}' or fix reference"
+            )
+            issue_counter += 1
+
+
+def validate_state_graph(pack: dict, result: ValidationResult, graph: Optional[StateGraph] = None) -> None:
+    """Check reachability, trapped states and trap cycles (rules M2 and M3)."""
+    issue_counter = result.count(Severity.BLOCKING) + 1
+    warn_counter = result.count(Severity.WARNING) + 1
+    
+    terminal_states = pack.get("terminal_states")
+    if terminal_states is not None and not is_state_name_list(terminal_states):
+        if isinstance(terminal_states, list):
+            bad = next(name for name in terminal_states if not isinstance(name, str))
+            got = f"an entry of type {type(bad).__name__}"
+        else:
+            got = type(terminal_states).__name__
+        result.add(
+            f"BLOCK-{issue_counter:03d}",
+            Severity.BLOCKING,
+            "terminal_states",
+            f"terminal_states must be a list of state names, got {got}",
+            "Write terminal_states as a list, e.g. [done, cancelled]"
+        )
+        issue_counter += 1
+    
+    initial_name = initial_state_name(pack)
+    if initial_name is not None and not isinstance(initial_name, str):
+        result.add(
+            f"BLOCK-{issue_counter:03d}",
+            Severity.BLOCKING,
+            "initial_state",
+            f"initial_state must be a state name, got {type(initial_name).__name__}",
+            "Set initial_state to the name of one state"
+        )
+        return
+    
+    if graph is None:
+        graph = compile_state_graph(pack)
+    if graph is None or not graph.names:
+        return
+    
+    if graph.initial is None:
+        result.add(
+            f"BLOCK-{issue_counter:03d}",
+            Severity.BLOCKING,
+            "initial_state",
+            f"Initial state is not defined: {initial_name}",
+            f"Define state '{initial_name}' or fix initial_state"
+        )
+        return
+    
+    reachable = graph.reachable()
+    for node, name in enumerate(graph.names):
+        if not reachable[node]:
             result.add(
                 f"BLOCK-{issue_counter:03d}",
                 Severity.BLOCKING,
-                f"transitions[{i}].to",
-                f"Transition to undefined state: {transition['to']}",
-                f"Define state '{transition['to']}' or fix reference"
+                f"states.{name}",
+                f"Unreachable state: {name}",
+                f"Add a transition into '{name}' from a reachable state, or remove it"
             )
             issue_counter += 1
+    
+    for node in graph.dead_ends():
+        name = graph.names[node]
+        result.add(
+            f"BLOCK-{issue_counter:03d}",
+            Severity.BLOCKING,
+            f"states.{name}",
+            f"Trapped state with no exits: {name}",
+            "Add an exit transition, or mark the state terminal: true"
+        )
+        issue_counter += 1
+    
+    for cycle in graph.trap_cycles(reachable):
+        names = [graph.names[node] for node in cycle]
+        shown = ", ".join(names[:MAX_CYCLE_NAMES])
+        if len(names) > MAX_CYCLE_NAMES:
+            shown += f" (+{len(names) - MAX_CYCLE_NAMES} more)"
+        result.add(
+            f"WARN-{warn_counter:03d}",
+            Severity.WARNING,
+            f"states.{names[0]}",
+            f"Trap cycle with no way out: {shown}",
+            "Add a transition that leaves the cycle, such as cancel or error recovery"
+        )
+        warn_counter += 1
 
 
 def validate_vocabulary(pack: dict, result: ValidationResult) -> None:
@@ -308,7 +616,7 @@ def validate_vocabulary(pack: dict, result: ValidationResult) -> None:
     vocabulary = pack["vocabulary"]
     terms = set(vocabulary.keys())
     
-    issue_counter = len([i for i in result.issues if i.severity == Severity.BLOCKING]) + 1
+    issue_counter = result.count(Severity.BLOCKING) + 1
     
     # Check for circular definitions
     for term, definition in vocabulary.items():
@@ -338,7 +646,7 @@ def validate_error_taxonomy(pack: dict, result: ValidationResult) -> None:
         return
     
     errors = pack["error_taxonomy"]
-    issue_counter = len([i for i in result.issues if i.severity == Severity.BLOCKING]) + 1
+    issue_counter = result.count(Severity.BLOCKING) + 1
     
     for i, error in enumerate(errors):
         if not isinstance(error, dict):
@@ -370,7 +678,9 @@ def validate(pack: dict) -> ValidationResult:
     
     validate_structure(pack, result)
     validate_states(pack, result)
-    validate_transitions(pack, result)
+    graph = compile_state_graph(pack)
+    validate_transitions(pack, result, graph)
+    validate_state_graph(pack, result, graph)
     validate_vocabulary(pack, result)
     validate_error_taxonomy(pack, result)
     
@@ -7,18 +7,43 @@ Validates report completeness and severity consistency.
 
 Usage:
     python audit_report_generator.py --input findings.json --output report.md
+    python audit_report_generator.py --input findings.jsonl --output report.md
+    python audit_report_generator.py --input findings.jsonl --output report.md --index findings-index.sqlite
     python audit_report_generator.py --validate report.md
+
+JSONL input holds one finding per line. A line of the form
+{"metadata": {...}} sets the audit metadata and may appear anywhere.
+
+With --index, each run records its findings with their rendered report
+entries. The next run reuses the entries of findings whose input is
+unchanged and only parses, validates and renders the rest. Its report
+gains a "Changes since last audit" section listing new, changed and
+resolved findings; the rest is exactly what a run without --index writes.
 """
 
 import argparse
+import hashlib
+import inspect
+import io
 import json
+import os
+import shutil
+import sqlite3
 import sys
+import tempfile
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from typing import Iterable, Iterator, Optional, TextIO, Union
 
 # Severity levels in priority order
 SEVERITY_LEVELS = ["critical", "major", "minor"]
 
+# Report sections held in memory up to this size before spilling to disk
+SPOOL_MAX_BYTES = 1024 * 1024
+
+# Layout of the findings index tables, part of its rules version
+INDEX_FORMAT = 2
+
 # Required fields for each finding
 REQUIRED_FINDING_FIELDS = [
     "id",
@@ -110,78 +135,400 @@ def count_by_severity(findings: list[dict]) -> dict[str, int]:
     return counts
 
 
-def generate_report(audit_data: dict) -> str:
-    """Generate markdown audit report from structured data."""
-    findings = audit_data.get("findings", [])
-    metadata = audit_data.get("metadata", {})
+def render_summary_line(finding: dict) -> str:
+    """Render a finding's one-line entry under its severity heading."""
+    return f"- {finding['id']}: {finding['problem'][:80]}"
+
+
+def render_finding(finding: dict) -> list[str]:
+    """Render a finding's detailed entry as report lines."""
+    lines = []
+    lines.append(f"### {finding['id']}: {finding['problem'][:50]}\n")
+    lines.append(f"**Location**: {finding['location']}")
+    lines.append(f"**Copy**: \"{finding['copy']}\"")
+    lines.append(f"**Severity**: {finding['severity'].capitalize()}")
+    lines.append(f"**Issue type**: {finding['issue_type'].capitalize()}\n")
+    lines.append(f"**Problem**: {finding['problem']}")
     
-    # Validate first
-    errors = validate_findings(findings)
-    if errors:
-        return f"# Validation Errors\n\n" + "\n".join(f"- {e}" for e in errors)
+    if finding.get("impact"):
+        lines.append(f"**Impact**: {finding['impact']}")
     
-    counts = count_by_severity(findings)
+    rec = finding.get("recommendation", {})
+    if isinstance(rec, dict):
+        lines.append("\n**Recommendation**:")
+        lines.append(f"- Before: \"{rec.get('before', '')}\"")
+        lines.append(f"- After: \"{rec.get('after', '')}\"")
+    
+    if finding.get("rationale"):
+        lines.append(f"\n**Rationale**: {finding['rationale']}")
+    
+    lines.append("\n---\n")
+    return lines
+
+
+def render_header(metadata: dict) -> list[str]:
+    """Render the report title, audit scope and executive summary."""
+    return [
+        "# UI Copy Audit Report\n",
+        "## Audit scope",
+        f"- **Screens reviewed**: {metadata.get('screens_reviewed', 'N/A')}",
+        f"- **Copy elements evaluated**: {metadata.get('elements_evaluated', 'N/A')}",
+        f"- **Date**: {metadata.get('date', datetime.now().strftime('%Y-%m-%d'))}",
+        f"- **Auditor**: {metadata.get('auditor', 'N/A')}\n",
+        "## Executive summary",
+        metadata.get("summary", "[Summary not provided]"),
+        "",
+    ]
+
+
+def write_lines(out: TextIO, lines: Iterable[str], first: bool = False) -> None:
+    """Write lines newline-separated, as "\\n".join would, continuing prior output."""
+    for line in lines:
+        if not first:
+            out.write("\n")
+        out.write(line)
+        first = False
+
+
+def finding_key(finding: dict) -> str:
+    """Identify a finding across runs by a hash of its location, copy and issue type."""
+    copy_hash = hashlib.blake2b(str(finding.get("copy", "")).encode("utf-8"), digest_size=16).hexdigest()
+    key = f"{finding.get('location', '')}\0{copy_hash}\0{str(finding.get('issue_type', '')).lower()}"
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def content_digest(finding: dict) -> str:
+    """Hash a finding's full content, independent of key order and formatting."""
+    encoded = json.dumps(finding, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def source_digest(text: str) -> str:
+    """Hash a finding's input text, such as its JSONL line."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def rules_version() -> str:
+    """
+    Hash the rules that decide whether a finding is valid, how it is
+    identified and how it is rendered: their constants and the source of
+    their functions. Other edits to this script leave it unchanged.
+    """
+    rules = [
+        str(INDEX_FORMAT),
+        repr((SEVERITY_LEVELS, REQUIRED_FINDING_FIELDS, VALID_ISSUE_TYPES)),
+    ]
+    for function in (validate_finding, render_summary_line, render_finding,
+                     finding_key, content_digest):
+        rules.append(inspect.getsource(function))
+    return hashlib.blake2b("\0".join(rules).encode("utf-8"), digest_size=16).hexdigest()
+
+
+@dataclass
+class RawFinding:
+    """A JSONL finding line, parsed only if its stored entries cannot be reused."""
+    line_number: int
+    text: str
     
-    report = []
+    def parse(self):
+        try:
+            return json.loads(self.text)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"line {self.line_number}: {e}") from e
+
+
+class FindingsIndex:
+    """
+    Findings from the last audit run, stored in SQLite with their rendered
+    summary line and detailed entry.
     
-    # Header
-    report.append("# UI Copy Audit Report\n")
+    Rows are found by a digest of the finding's input: its JSONL line, or
+    its content for JSON input. A finding whose input is unchanged reuses
+    the stored row instead of being parsed, validated and rendered again;
+    rows are only stored by runs that passed validation. Other findings are
+    classified as new or changed by their key and content digest.
     
-    # Metadata
-    report.append("## Audit scope")
-    report.append(f"- **Screens reviewed**: {metadata.get('screens_reviewed', 'N/A')}")
-    report.append(f"- **Copy elements evaluated**: {metadata.get('elements_evaluated', 'N/A')}")
-    report.append(f"- **Date**: {metadata.get('date', datetime.now().strftime('%Y-%m-%d'))}")
-    report.append(f"- **Auditor**: {metadata.get('auditor', 'N/A')}\n")
+    The index records the rules version it was built with (see
+    rules_version). An index built under other rules is cleared and the
+    run starts a new baseline, since its entries may no longer be valid or
+    render the same.
     
-    # Executive summary
-    report.append("## Executive summary")
-    report.append(metadata.get("summary", "[Summary not provided]"))
-    report.append("")
+    A run updates the index in place inside one transaction: reused rows
+    stay, other current findings are inserted, previous rows that were not
+    reused are deleted on finish(), and close() without finish() rolls the
+    run back.
+    """
     
-    # Findings by severity
-    report.append("## Findings by severity\n")
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS meta (
+        name TEXT PRIMARY KEY,
+        value TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS findings (
+        source TEXT NOT NULL,
+        key TEXT NOT NULL,
+        content TEXT NOT NULL,
+        id,
+        severity TEXT NOT NULL,
+        summary TEXT NOT NULL,
+        detail TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS findings_key ON findings (key);
+    """
+    BATCH_SIZE = 1000
     
-    for severity in SEVERITY_LEVELS:
-        severity_findings = [
-            f for f in findings 
-            if f.get("severity", "").lower() == severity
-        ]
-        report.append(f"### {severity.capitalize()} ({counts[severity]})")
-        
-        if severity_findings:
-            for f in severity_findings:
-                report.append(f"- {f['id']}: {f['problem'][:80]}")
-        else:
-            report.append("None")
-        report.append("")
+    def __init__(self, path: str, version: Optional[str] = None):
+        self.path = path
+        self.version = version or rules_version()
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(self.SCHEMA)
+        stored = self.conn.execute("SELECT value FROM meta WHERE name = 'rules_version'").fetchone()
+        self.outdated = stored is not None and stored[0] != self.version
+        if stored is None or self.outdated:
+            self.conn.execute("DROP TABLE findings")
+            self.conn.execute(
+                "INSERT OR REPLACE INTO meta VALUES ('rules_version', ?)", (self.version,)
+            )
+            self.conn.executescript(self.SCHEMA)
+        # Rows up to last_rowid belong to the previous run
+        self.last_rowid = self.conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM findings").fetchone()[0]
+        self.sources: dict[str, int] = dict(self.conn.execute("SELECT source, rowid FROM findings"))
+        self.reused: set[int] = set()
+        self.read_ahead: dict[int, tuple] = {}
+        self.read_ahead_end = 0
+        self.pending: list[tuple] = []
+        self.changes = {"new": 0, "changed": 0, "unchanged": 0, "resolved": 0}
     
-    # Detailed findings
-    report.append("## Detailed findings\n")
+    @property
+    def has_previous_run(self) -> bool:
+        return self.last_rowid > 0
     
-    for finding in findings:
-        report.append(f"### {finding['id']}: {finding['problem'][:50]}\n")
-        report.append(f"**Location**: {finding['location']}")
-        report.append(f"**Copy**: \"{finding['copy']}\"")
-        report.append(f"**Severity**: {finding['severity'].capitalize()}")
-        report.append(f"**Issue type**: {finding['issue_type'].capitalize()}\n")
-        report.append(f"**Problem**: {finding['problem']}")
-        
-        if finding.get("impact"):
-            report.append(f"**Impact**: {finding['impact']}")
+    def reuse(self, source: str) -> Optional[tuple]:
+        """
+        Return the stored (id, severity, summary, detail) of a previous
+        finding with this input digest, or None.
+        """
+        rowid = self.sources.get(source)
+        if rowid is None:
+            return None
+        self.reused.add(rowid)
+        row = self.read_ahead.pop(rowid, None)
+        if row is None and rowid > self.read_ahead_end:
+            # Findings mostly arrive in stored order, so rows from here on
+            # are read a batch at a time
+            batch = self.conn.execute(
+                "SELECT rowid, id, severity, summary, detail FROM findings "
+                "WHERE rowid >= ? AND rowid <= ? ORDER BY rowid LIMIT ?",
+                (rowid, self.last_rowid, self.BATCH_SIZE),
+            ).fetchall()
+            self.read_ahead = {r[0]: r[1:] for r in batch}
+            self.read_ahead_end = batch[-1][0]
+            row = self.read_ahead.pop(rowid)
+        if row is None:
+            row = self.conn.execute(
+                "SELECT id, severity, summary, detail FROM findings WHERE rowid = ?", (rowid,)
+            ).fetchone()
+        return row
+    
+    def classify(self, key: str, content: str) -> str:
+        """Return whether a finding is new, changed or unchanged since the last run."""
+        rows = self.conn.execute(
+            "SELECT content FROM findings WHERE key = ? AND rowid <= ?",
+            (key, self.last_rowid),
+        ).fetchall()
+        if any(row[0] == content for row in rows):
+            return "unchanged"
+        return "changed" if rows else "new"
+    
+    def add(self, source: str, key: str, content: str, fid, severity: str,
+            summary: str, detail: str) -> None:
+        """Record a finding of the current run that did not reuse a row."""
+        self.pending.append((source, key, content, fid, severity, summary, detail))
+        if len(self.pending) >= self.BATCH_SIZE:
+            self.flush()
+    
+    def flush(self) -> None:
+        self.conn.executemany("INSERT INTO findings VALUES (?, ?, ?, ?, ?, ?, ?)", self.pending)
+        self.pending.clear()
+    
+    def finish(self) -> list[str]:
+        """
+        Delete the previous run's rows that were not reused, and commit.
         
-        rec = finding.get("recommendation", {})
-        if isinstance(rec, dict):
-            report.append("\n**Recommendation**:")
-            report.append(f"- Before: \"{rec.get('before', '')}\"")
-            report.append(f"- After: \"{rec.get('after', '')}\"")
+        Returns the summary lines of resolved findings: deleted rows whose
+        key no current finding has.
+        """
+        self.flush()
+        stale_rowids = sorted(set(self.sources.values()) - self.reused)
+        stale = [
+            self.conn.execute("SELECT key, summary FROM findings WHERE rowid = ?", (rowid,)).fetchone()
+            for rowid in stale_rowids
+        ]
+        self.conn.executemany("DELETE FROM findings WHERE rowid = ?", ((rowid,) for rowid in stale_rowids))
+        resolved = [
+            summary for key, summary in stale
+            if self.conn.execute("SELECT 1 FROM findings WHERE key = ? LIMIT 1", (key,)).fetchone() is None
+        ]
+        self.conn.commit()
+        self.changes["resolved"] = len(resolved)
+        return resolved
+    
+    def close(self) -> None:
+        """Close, rolling back a run that did not finish."""
+        self.conn.close()
+
+
+def write_report(findings: Iterable[Union[dict, RawFinding]], out: TextIO, metadata: dict,
+                 index: Optional[FindingsIndex] = None) -> list[str]:
+    """
+    Validate findings and stream the markdown report to out in one pass.
+    
+    Each finding is validated, then its summary line and detailed entry are
+    appended to per-severity and detail spools, which spill to temporary
+    files past SPOOL_MAX_BYTES. Nothing reaches out until every finding has
+    been seen, since the summary comes first and any validation error
+    replaces the report. Memory use is bounded by the set of finding IDs,
+    plus the index's digests of the previous run.
+    
+    Findings may be RawFinding lines, parsed here. With an index, a finding
+    whose input matches a stored row of the previous run takes its entries
+    from that row; other findings are classified against the previous run.
+    The report gains a "Changes since last audit" section, and the index is
+    updated for the next run. The other sections are the same.
+    
+    metadata is read after the findings are consumed, so an input reader
+    may fill it in as it goes. Returns the validation errors, if any.
+    """
+    def spool():
+        return tempfile.SpooledTemporaryFile(
+            max_size=SPOOL_MAX_BYTES, mode="w+", encoding="utf-8"
+        )
+    
+    incremental = index is not None and index.has_previous_run
+    errors = []
+    finding_ids = set()
+    counts = {level: 0 for level in SEVERITY_LEVELS}
+    buckets = {level: spool() for level in SEVERITY_LEVELS}
+    details = spool()
+    changed = {"new": spool(), "changed": spool()} if incremental else {}
+    try:
+        i = 0
+        for i, finding in enumerate(findings, start=1):
+            raw = isinstance(finding, RawFinding)
+            source = stored = None
+            if index is not None:
+                source = source_digest(finding.text) if raw else content_digest(finding)
+                stored = index.reuse(source) if incremental else None
+            if stored is not None:
+                fid, severity, summary, detail = stored
+            else:
+                if raw:
+                    finding = finding.parse()
+                fid = finding.get("id")
+            if fid in finding_ids:
+                errors.append(f"Duplicate finding ID: {fid}")
+            finding_ids.add(fid)
+            
+            if stored is not None:
+                # Stored rows passed validation under the same rules
+                if errors:
+                    continue
+                index.changes["unchanged"] += 1
+            else:
+                finding_errors = validate_finding(finding, i)
+                if finding_errors or errors:
+                    errors.extend(finding_errors)
+                    continue  # the report will not be written, skip rendering
+                severity = finding["severity"].lower()
+                summary = render_summary_line(finding)
+                detail = "\n".join(render_finding(finding))
+                
+                if index is not None:
+                    key = finding_key(finding)
+                    content = content_digest(finding) if raw else source
+                    if incremental:
+                        status = index.classify(key, content)
+                        index.changes[status] += 1
+                        if status != "unchanged":
+                            changed[status].write("\n" + summary)
+                    index.add(source, key, content, fid, severity, summary, detail)
+            counts[severity] += 1
+            buckets[severity].write("\n" + summary)
+            details.write("\n" + detail)
         
-        if finding.get("rationale"):
-            report.append(f"\n**Rationale**: {finding['rationale']}")
+        if i == 0:
+            errors.append("No findings provided")
+        if errors:
+            write_lines(out, ["# Validation Errors\n"], first=True)
+            write_lines(out, (f"- {e}" for e in errors))
+            return errors
         
-        report.append("\n---\n")
+        resolved = index.finish() if index is not None else []
+        write_lines(out, render_header(metadata), first=True)
+        if incremental:
+            write_lines(out, ["## Changes since last audit\n"])
+            for status in ("new", "changed"):
+                write_lines(out, [f"### {status.capitalize()} ({index.changes[status]})"])
+                if index.changes[status]:
+                    changed[status].seek(0)
+                    shutil.copyfileobj(changed[status], out)
+                else:
+                    write_lines(out, ["None"])
+                write_lines(out, [""])
+            write_lines(out, [f"### Resolved ({len(resolved)})"])
+            write_lines(out, resolved or ["None"])
+            write_lines(out, ["", f"### Unchanged ({index.changes['unchanged']})", ""])
+        write_lines(out, ["## Findings by severity\n"])
+        for severity in SEVERITY_LEVELS:
+            write_lines(out, [f"### {severity.capitalize()} ({counts[severity]})"])
+            if counts[severity]:
+                buckets[severity].seek(0)
+                shutil.copyfileobj(buckets[severity], out)
+            else:
+                write_lines(out, ["None"])
+            write_lines(out, [""])
+        write_lines(out, ["## Detailed findings\n"])
+        details.seek(0)
+        shutil.copyfileobj(details, out)
+        return errors
+    finally:
+        details.close()
+        for bucket in [*buckets.values(), *changed.values()]:
+            bucket.close()
+
+
+def generate_report(audit_data: dict) -> str:
+    """Generate markdown audit report from structured data."""
+    out = io.StringIO()
+    write_report(audit_data.get("findings", []), out, audit_data.get("metadata", {}))
+    return out.getvalue()
+
+
+def iter_jsonl_findings(source: TextIO, metadata: dict,
+                        raw: bool = False) -> Iterator[Union[dict, RawFinding]]:
+    """
+    Yield findings from JSONL, one object per line.
     
-    return "\n".join(report)
+    Lines of the form {"metadata": {...}} update metadata instead.
+    Blank lines are skipped. With raw, finding lines are yielded unparsed
+    as RawFinding, for write_report to parse only if needed.
+    """
+    for line_number, line in enumerate(source, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        # Only a line spelling the key out, or \u-escaping it, can be metadata
+        if raw and "metadata" not in line and "\\u" not in line:
+            yield RawFinding(line_number, line)
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"line {line_number}: {e}") from e
+        if isinstance(record, dict) and "metadata" in record and "id" not in record:
+            metadata.update(record["metadata"])
+        else:
+            yield record
 
 
 def validate_report(report_path: str) -> list[str]:
@@ -218,7 +565,7 @@ def main():
     )
     parser.add_argument(
         "--input", "-i",
-        help="Input JSON file with findings data"
+        help="Input JSON file with findings data, or JSONL with one finding per line (- for stdin)"
     )
     parser.add_argument(
         "--output", "-o", 
@@ -228,6 +575,11 @@ def main():
         "--validate", "-v",
         help="Validate an existing report file"
     )
+    parser.add_argument(
+        "--index",
+        help="SQLite findings index from the previous run. Adds a section listing "
+             "new, changed and resolved findings, and is updated for the next run"
+    )
     
     args = parser.parse_args()
     
@@ -245,24 +597,62 @@ def main():
     if not args.input:
         parser.error("--input required when not using --validate")
     
+    is_jsonl = args.input == "-" or args.input.endswith((".jsonl", ".ndjson"))
     try:
-        with open(args.input, 'r', encoding='utf-8') as f:
-            audit_data = json.load(f)
+        source = sys.stdin if args.input == "-" else open(args.input, 'r', encoding='utf-8')
     except FileNotFoundError:
         print(f"Error: Input file not found: {args.input}")
         sys.exit(1)
-    except json.JSONDecodeError as e:
+    
+    # Write beside the target and rename, so bad input never truncates an
+    # existing report. The index is updated in a transaction instead.
+    partial = f"{args.output}.partial" if args.output else None
+    try:
+        index = FindingsIndex(args.index) if args.index else None
+    except sqlite3.DatabaseError as e:
+        print(f"Error: Invalid findings index {args.index}: {e}")
+        sys.exit(1)
+    incremental = index is not None and index.has_previous_run
+    if index is not None and index.outdated:
+        print(
+            f"Findings index {args.index} was built under other validation or rendering rules; "
+            "starting a new baseline",
+            file=sys.stderr,
+        )
+    out = open(partial, 'w', encoding='utf-8') if partial else sys.stdout
+    errors = None
+    try:
+        if is_jsonl:
+            metadata = {}
+            findings = iter_jsonl_findings(source, metadata, raw=index is not None)
+        else:
+            audit_data = json.load(source)
+            findings, metadata = audit_data.get("findings", []), audit_data.get("metadata", {})
+        errors = write_report(findings, out, metadata, index)
+    except (json.JSONDecodeError, ValueError) as e:
         print(f"Error: Invalid JSON in input file: {e}")
         sys.exit(1)
-    
-    report = generate_report(audit_data)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if out is not sys.stdout:
+            out.close()
+        if index is not None:
+            index.close()
+        if errors is None and partial and os.path.exists(partial):
+            os.remove(partial)
     
     if args.output:
-        with open(args.output, 'w', encoding='utf-8') as f:
-            f.write(report)
+        os.replace(partial, args.output)
         print(f"Report generated: {args.output}")
     else:
-        print(report)
+        print()
+    if incremental and not errors:
+        print(
+            "Changes since last audit: "
+            + ", ".join(f"{count} {status}" for status, count in index.changes.items()),
+            file=sys.stderr,
+        )
 
 
 if __name__ == "__main__":
@@ -20,6 +20,14 @@ try:
 except ImportError:
     YAML_AVAILABLE = False
 
+# Parsed files are memoized by scripts/yaml_loader.py when this skill sits in
+# the repository; a copy of the skill parses each file itself.
+try:
+    sys.path.append(str(Path(__file__).resolve().parents[4] / "scripts"))
+    from yaml_loader import load_cached
+except (IndexError, ImportError):
+    load_cached = None
+
 # ============================================================
 # CONSTANTS - Governance workflow schema
 # ============================================================
@@ -381,6 +389,8 @@ def calculate_sla_deadline(flow: dict, stage: str) -> dict:
 
 def load_flow_file(filepath: Path) -> dict:
     """Load flow from YAML or JSON file."""
+    if load_cached is not None:
+        return load_cached(filepath)
     content = filepath.read_text(encoding='utf-8')
     
     if filepath.suffix in ('.yaml', '.yml'):
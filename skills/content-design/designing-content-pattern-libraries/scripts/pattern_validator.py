@@ -10,6 +10,8 @@ import argparse
 import json
 import re
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -21,6 +23,14 @@ try:
 except ImportError:
     YAML_AVAILABLE = False
 
+# Parsed files are memoized by scripts/yaml_loader.py when this skill sits in
+# the repository; a copy of the skill parses each file itself.
+try:
+    sys.path.append(str(Path(__file__).resolve().parents[4] / "scripts"))
+    from yaml_loader import load_cached
+except (IndexError, ImportError):
+    load_cached = None
+
 # ============================================================
 # CONSTANTS - Schema definitions
 # ============================================================
@@ -158,7 +168,7 @@ def validate_slots(slots: list, result: ValidationResult):
         path = f"structure.slots[{i}]"
         
         # Check required fields
-        for field_name in REQUIRED_SLOT_FIELDS:
+        for field_name in sorted(REQUIRED_SLOT_FIELDS):
             if field_name not in slot:
                 result.add_issue(f"{path}.{field_name}", "REQUIRED",
                                f"Slot field '{field_name}' is required")
@@ -178,7 +188,7 @@ def validate_slots(slots: list, result: ValidationResult):
         slot_type = slot.get("type", "")
         if slot_type and slot_type not in VALID_SLOT_TYPES:
             result.add_issue(f"{path}.type", "INVALID",
-                           f"Invalid slot type '{slot_type}'. Valid: {', '.join(VALID_SLOT_TYPES)}")
+                           f"Invalid slot type '{slot_type}'. Valid: {', '.join(sorted(VALID_SLOT_TYPES))}")
         
         # Validate constraints
         constraints = slot.get("constraints", {})
@@ -206,13 +216,13 @@ def validate_constraints(constraints: dict, path: str, result: ValidationResult)
         fmt = constraints["format"]
         if fmt not in VALID_FORMATS:
             result.add_issue(f"{path}.format", "INVALID",
-                           f"Invalid format '{fmt}'. Valid: {', '.join(VALID_FORMATS)}")
+                           f"Invalid format '{fmt}'. Valid: {', '.join(sorted(VALID_FORMATS))}")
     
     if "tone" in constraints:
         tone = constraints["tone"]
         if tone not in VALID_TONES:
             result.add_issue(f"{path}.tone", "INVALID",
-                           f"Invalid tone '{tone}'. Valid: {', '.join(VALID_TONES)}")
+                           f"Invalid tone '{tone}'. Valid: {', '.join(sorted(VALID_TONES))}")
 
 
 def validate_syntax(syntax: str, slot_names: set, result: ValidationResult):
@@ -236,7 +246,7 @@ def validate_syntax(syntax: str, slot_names: set, result: ValidationResult):
 
 def validate_usage(usage: dict, result: ValidationResult):
     """Validate usage section."""
-    for field_name in REQUIRED_USAGE_FIELDS:
+    for field_name in sorted(REQUIRED_USAGE_FIELDS):
         if field_name not in usage:
             result.add_issue(f"usage.{field_name}", "REQUIRED",
                            f"Usage field '{field_name}' is required")
@@ -245,12 +255,12 @@ def validate_usage(usage: dict, result: ValidationResult):
     for platform in platforms:
         if platform not in VALID_PLATFORMS:
             result.add_issue("usage.platforms", "INVALID",
-                           f"Invalid platform '{platform}'. Valid: {', '.join(VALID_PLATFORMS)}")
+                           f"Invalid platform '{platform}'. Valid: {', '.join(sorted(VALID_PLATFORMS))}")
 
 
 def validate_examples(examples: dict, result: ValidationResult):
     """Validate examples section."""
-    for field_name in REQUIRED_EXAMPLE_FIELDS:
+    for field_name in sorted(REQUIRED_EXAMPLE_FIELDS):
         if field_name not in examples:
             result.add_issue(f"examples.{field_name}", "REQUIRED",
                            f"Example '{field_name}' is required")
@@ -261,7 +271,7 @@ def validate_examples(examples: dict, result: ValidationResult):
 
 def validate_metadata(metadata: dict, result: ValidationResult):
     """Validate metadata section."""
-    for field_name in REQUIRED_METADATA_FIELDS:
+    for field_name in sorted(REQUIRED_METADATA_FIELDS):
         if field_name not in metadata:
             result.add_issue(f"metadata.{field_name}", "REQUIRED",
                            f"Metadata field '{field_name}' is required")
@@ -269,7 +279,7 @@ def validate_metadata(metadata: dict, result: ValidationResult):
     status = metadata.get("status", "")
     if status and status not in VALID_STATUSES:
         result.add_issue("metadata.status", "INVALID",
-                        f"Invalid status '{status}'. Valid: {', '.join(VALID_STATUSES)}")
+                        f"Invalid status '{status}'. Valid: {', '.join(sorted(VALID_STATUSES))}")
 
 
 def validate_pattern(pattern: dict) -> ValidationResult:
@@ -278,7 +288,7 @@ def validate_pattern(pattern: dict) -> ValidationResult:
     result = ValidationResult(pattern_id=pattern_id, is_valid=True)
     
     # Check top-level required fields
-    for field_name in REQUIRED_PATTERN_FIELDS:
+    for field_name in sorted(REQUIRED_PATTERN_FIELDS):
         if field_name not in pattern:
             result.add_issue(field_name, "REQUIRED", f"Field '{field_name}' is required")
     
@@ -298,7 +308,7 @@ def validate_pattern(pattern: dict) -> ValidationResult:
     # Validate structure
     structure = pattern.get("structure", {})
     if structure:
-        for field_name in REQUIRED_STRUCTURE_FIELDS:
+        for field_name in sorted(REQUIRED_STRUCTURE_FIELDS):
             if field_name not in structure:
                 result.add_issue(f"structure.{field_name}", "REQUIRED",
                                f"Structure field '{field_name}' is required")
@@ -327,37 +337,94 @@ def validate_pattern(pattern: dict) -> ValidationResult:
 
 def validate_library(patterns: list, known_ids: Optional[set] = None) -> list[ValidationResult]:
     """Validate multiple patterns, checking cross-references."""
-    results = []
+    results = [validate_pattern(pattern) for pattern in patterns]
+    resolve_library_references(
+        [library_entry(pattern) for pattern in patterns], results, known_ids
+    )
+    return results
+
+
+def library_entry(pattern: dict) -> tuple[str, list]:
+    """The parts of a pattern the cross-reference pass needs: (id, related_patterns)."""
+    return pattern.get("id", ""), pattern.get("metadata", {}).get("related_patterns", [])
+
+
+def resolve_library_references(entries: list[tuple[str, list]], results: list[ValidationResult],
+                               known_ids: Optional[set] = None) -> None:
+    """Flag duplicate IDs and unresolved related_patterns across a whole library.
+
+    Runs over every pattern at once, after per-pattern validation.
+    """
     pattern_ids = set()
     
-    # First pass: validate individual patterns and collect IDs
-    for pattern in patterns:
-        result = validate_pattern(pattern)
-        results.append(result)
-        
-        pattern_id = pattern.get("id", "")
+    # Collect IDs, flagging duplicates in library order
+    for (pattern_id, _), result in zip(entries, results):
         if pattern_id:
             if pattern_id in pattern_ids:
                 result.add_issue("id", "DUPLICATE_IN_LIBRARY",
                                f"Pattern ID '{pattern_id}' is duplicated in library")
             pattern_ids.add(pattern_id)
     
-    # Second pass: validate cross-references
+    # Validate cross-references
     all_ids = pattern_ids | (known_ids or set())
     
-    for pattern, result in zip(patterns, results):
-        related = pattern.get("metadata", {}).get("related_patterns", [])
+    for (_, related), result in zip(entries, results):
         for ref_id in related:
             if ref_id not in all_ids:
                 result.add_issue("metadata.related_patterns", "UNRESOLVED_REFERENCE",
                                f"Related pattern '{ref_id}' not found in library",
                                Severity.WARNING)
+
+
+def find_pattern_files(dirpath: Path) -> list[Path]:
+    """Pattern files under dirpath: YAML, then YML, then JSON, each sorted."""
+    files = []
+    for suffix in ("yaml", "yml", "json"):
+        files.extend(sorted(dirpath.glob(f"**/*.{suffix}")))
+    return files
+
+
+def load_and_validate(filepath: Path) -> tuple[tuple[str, list], ValidationResult]:
+    """Load and validate one pattern file. Returns (library entry, result)."""
+    pattern = load_pattern_file(filepath)
+    if "pattern" in pattern:
+        pattern = pattern["pattern"]
+    return library_entry(pattern), validate_pattern(pattern)
+
+
+def validate_library_files(files: list[Path], jobs: int = 1,
+                           known_ids: Optional[set] = None) -> tuple[list[ValidationResult], dict]:
+    """Validate a library of pattern files, in parallel when jobs > 1.
+
+    Loading and per-pattern validation run in a process pool. Duplicate-ID
+    and related_patterns resolution stays a single pass over the whole
+    library. Returns (results in file order, per-phase timings in seconds).
+    """
+    start = time.perf_counter()
+    if jobs > 1 and len(files) > 1:
+        chunksize = max(1, len(files) // (jobs * 8))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            loaded = list(executor.map(load_and_validate, files, chunksize=chunksize))
+    else:
+        loaded = [load_and_validate(filepath) for filepath in files]
+    validated = time.perf_counter()
     
-    return results
+    entries = [entry for entry, _ in loaded]
+    results = [result for _, result in loaded]
+    resolve_library_references(entries, results, known_ids)
+    resolved = time.perf_counter()
+    
+    timings = {
+        "load_and_validate": round(validated - start, 3),
+        "cross_reference": round(resolved - validated, 3),
+    }
+    return results, timings
 
 
 def load_pattern_file(filepath: Path) -> dict:
     """Load pattern from YAML or JSON file."""
+    if load_cached is not None:
+        return load_cached(filepath)
     content = filepath.read_text(encoding='utf-8')
     
     if filepath.suffix in ('.yaml', '.yml'):
@@ -395,6 +462,8 @@ def main():
     lib_parser = subparsers.add_parser("library", help="Validate pattern library")
     lib_parser.add_argument("directory", help="Directory containing pattern files")
     lib_parser.add_argument("--output", "-o", help="Output file for results")
+    lib_parser.add_argument("--jobs", "-j", type=int, default=1,
+                            help="Worker processes for loading and validation (default: 1)")
     
     # Schema info
     subparsers.add_parser("schema", help="Print schema requirements")
@@ -423,35 +492,21 @@ def main():
             print(f"Error: Not a directory: {dirpath}", file=sys.stderr)
             sys.exit(1)
         
-        patterns = []
-        for filepath in dirpath.glob("**/*.yaml"):
-            pattern = load_pattern_file(filepath)
-            if "pattern" in pattern:
-                pattern = pattern["pattern"]
-            patterns.append(pattern)
-        
-        for filepath in dirpath.glob("**/*.yml"):
-            pattern = load_pattern_file(filepath)
-            if "pattern" in pattern:
-                pattern = pattern["pattern"]
-            patterns.append(pattern)
-        
-        for filepath in dirpath.glob("**/*.json"):
-            pattern = load_pattern_file(filepath)
-            if "pattern" in pattern:
-                pattern = pattern["pattern"]
-            patterns.append(pattern)
+        start = time.perf_counter()
+        files = find_pattern_files(dirpath)
+        discovered = time.perf_counter()
         
-        if not patterns:
+        if not files:
             print("No pattern files found", file=sys.stderr)
             sys.exit(1)
         
-        results = validate_library(patterns)
+        results, timings = validate_library_files(files, jobs=args.jobs)
         
         summary = {
             "total_patterns": len(results),
             "valid_patterns": sum(1 for r in results if r.is_valid),
             "invalid_patterns": sum(1 for r in results if not r.is_valid),
+            "timing": {"discover": round(discovered - start, 3), **timings},
             "results": [r.to_dict() for r in results]
         }
         
@@ -4,14 +4,27 @@ Name Validator
 
 Validates feature and setting names against naming rules and banned terms.
 Checks character limits, capitalization, and vocabulary compliance.
+
+Usage:
+    python name_validator.py validate "Smart compose" --type feature_name
+    python name_validator.py batch names.json --output results.json
+    python name_validator.py stream names.jsonl --output results.jsonl --jobs 8
+    cat names.jsonl | python name_validator.py stream - > results.jsonl
+    python name_validator.py check-term cache
+    python name_validator.py benchmark --count 200000
 """
 
 import argparse
 import json
+import random
 import re
 import sys
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from pathlib import Path
 from typing import Optional
 
 # ============================================================
@@ -63,6 +76,41 @@ ALL_BANNED_TERMS = (
     BANNED_LEGAL_RISK
 )
 
+# Category lookup order matters: the first category containing a term wins
+BAN_CATEGORIES = [
+    (BANNED_TECHNICAL_JARGON, "technical jargon"),
+    (BANNED_AMBIGUOUS_VERBS, "ambiguous verb"),
+    (BANNED_ABSOLUTIST, "absolutist language"),
+    (BANNED_NEGATIVE, "negative/alarming"),
+    (BANNED_EXCLUSIONARY, "exclusionary language"),
+    (BANNED_LEGAL_RISK, "legal/compliance risk"),
+]
+
+# Precomputed term -> category index
+TERM_CATEGORY = {}
+for _terms, _category in reversed(BAN_CATEGORIES):
+    TERM_CATEGORY.update(dict.fromkeys(_terms, _category))
+
+# Terms match anywhere in the name, as in the per-term scan, so "cached",
+# "insecure_mode" and "enableCache" are all caught. One compiled lookahead
+# finds the longest term starting at each position, so terms that overlap
+# ("cacheasy") are all seen in a single pass.
+TERM_PATTERN = re.compile(
+    r'(?=(' + '|'.join(
+        re.escape(term) for term in sorted(ALL_BANNED_TERMS, key=len, reverse=True)
+    ) + r'))'
+)
+# A match stands for every term inside it, e.g. "failed" for both "fail" and
+# "failed"
+TERMS_WITHIN = {
+    term: sorted(
+        (other for other in ALL_BANNED_TERMS if other in term),
+        key=lambda other: (term.find(other), len(other))
+    )
+    for term in ALL_BANNED_TERMS
+}
+PHRASE_TERMS = frozenset(t for t in ALL_BANNED_TERMS if not re.fullmatch(r'\w+', t))
+
 # ============================================================
 # CONSTANTS - Character limits by element type
 # ============================================================
@@ -134,7 +182,47 @@ class ValidationResult:
 
 
 def check_banned_terms(name: str) -> list[ValidationIssue]:
-    """Check name for banned terms."""
+    """Check name for banned terms in a single pass.
+
+    Reports the same terms and phrases as check_banned_terms_scan: every
+    one that occurs anywhere in the lowercased name. Terms are reported in
+    the order they appear in the name.
+    """
+    issues = []
+    name_lower = name.lower()
+    
+    found = []
+    for match in TERM_PATTERN.findall(name_lower):
+        for term in TERMS_WITHIN[match]:
+            if term not in found:
+                found.append(term)
+    phrases = [term for term in found if term in PHRASE_TERMS]
+    
+    for term in found:
+        issues.append(ValidationIssue(
+            rule="BANNED_TERM",
+            message=f"Contains banned term '{term}' ({TERM_CATEGORY[term]})",
+            severity=Severity.ERROR,
+            suggestion=f"Replace '{term}' with approved alternative"
+        ))
+    
+    for phrase in phrases:
+        issues.append(ValidationIssue(
+            rule="BANNED_PHRASE",
+            message=f"Contains banned phrase '{phrase}'",
+            severity=Severity.ERROR,
+            suggestion=f"Remove or replace '{phrase}'"
+        ))
+    
+    return issues
+
+
+def check_banned_terms_scan(name: str) -> list[ValidationIssue]:
+    """Check name for banned terms, one substring test per term.
+
+    The original implementation, kept as the benchmark baseline and
+    recall reference for check_banned_terms.
+    """
     issues = []
     name_lower = name.lower()
     words = set(re.findall(r'\b\w+\b', name_lower))
@@ -166,19 +254,7 @@ def check_banned_terms(name: str) -> list[ValidationIssue]:
 
 def get_ban_category(term: str) -> str:
     """Get the category a banned term belongs to."""
-    if term in BANNED_TECHNICAL_JARGON:
-        return "technical jargon"
-    if term in BANNED_AMBIGUOUS_VERBS:
-        return "ambiguous verb"
-    if term in BANNED_ABSOLUTIST:
-        return "absolutist language"
-    if term in BANNED_NEGATIVE:
-        return "negative/alarming"
-    if term in BANNED_EXCLUSIONARY:
-        return "exclusionary language"
-    if term in BANNED_LEGAL_RISK:
-        return "legal/compliance risk"
-    return "unknown category"
+    return TERM_CATEGORY.get(term, "unknown category")
 
 
 def check_character_limit(name: str, element_type: ElementType) -> list[ValidationIssue]:
@@ -316,23 +392,178 @@ def validate_name(name: str, element_type: ElementType) -> ValidationResult:
     )
 
 
+def validate_item(item: dict) -> dict:
+    """Validate one {"name": ..., "type": ...} entry. Unknown types default to feature_name.
+
+    Returns {"error": ...} for an entry that is not an object with a string name.
+    """
+    if not isinstance(item, dict):
+        return {"error": f"Invalid input: expected an object, got {type(item).__name__}"}
+    name = item.get("name", "")
+    if not isinstance(name, str):
+        return {"error": f"Invalid input: name must be a string, got {type(name).__name__}"}
+    type_str = item.get("type", "feature_name")
+    
+    try:
+        element_type = ElementType(type_str)
+    except (ValueError, TypeError):
+        element_type = ElementType.FEATURE_NAME
+    
+    return validate_name(name, element_type).to_dict()
+
+
 def validate_batch(names: list[dict]) -> list[dict]:
     """Validate multiple names from JSON input."""
-    results = []
-    
-    for item in names:
-        name = item.get("name", "")
-        type_str = item.get("type", "feature_name")
-        
+    return [validate_item(item) for item in names]
+
+
+def validate_jsonl_chunk(chunk: list[tuple[int, str]]) -> tuple[list[str], Counter, int]:
+    """Validate a chunk of (line_number, JSONL line) pairs.
+
+    Each line is a {"name": ..., "type": ...} object or a bare JSON string.
+    Returns the output JSONL lines in order, error counts per rule, and the
+    number of invalid names (including unparseable lines).
+    """
+    output = []
+    rule_counts: Counter = Counter()
+    invalid = 0
+    for line_number, line in chunk:
         try:
-            element_type = ElementType(type_str)
-        except ValueError:
-            element_type = ElementType.FEATURE_NAME
+            item = json.loads(line)
+            if isinstance(item, str):
+                item = {"name": item}
+            if not isinstance(item, dict):
+                raise ValueError("expected an object or a string")
+        except ValueError as e:
+            result = {"error": f"Invalid input: {e}"}
+        else:
+            result = validate_item(item)
         
-        result = validate_name(name, element_type)
-        results.append(result.to_dict())
-    
-    return results
+        if "error" in result:
+            output.append(json.dumps({"line": line_number, **result}))
+            rule_counts["INVALID_INPUT"] += 1
+            invalid += 1
+            continue
+        for issue in result["issues"]:
+            if issue["severity"] == Severity.ERROR.value:
+                rule_counts[issue["rule"]] += 1
+        if not result["is_valid"]:
+            invalid += 1
+        output.append(json.dumps(result))
+    return output, rule_counts, invalid
+
+
+def iter_chunks(lines, chunk_size: int):
+    """Group non-blank lines into lists of (line_number, line) pairs."""
+    chunk = []
+    for line_number, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        chunk.append((line_number, line))
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def stream_batch(lines, out, jobs: int = 1, chunk_size: int = 1000) -> dict:
+    """Validate JSONL names from lines and write JSONL results to out in input order.
+
+    Lines are read and validated in chunks. With jobs > 1, chunks go to a
+    process pool with at most jobs * 2 in flight, so memory stays flat
+    regardless of input size. Returns a summary with error counts per rule.
+    """
+    summary = {"total": 0, "invalid_names": 0, "errors_by_rule": Counter()}
+    
+    def write(chunk_output: list[str], rule_counts: Counter, invalid: int) -> None:
+        out.write("".join(record + "\n" for record in chunk_output))
+        summary["total"] += len(chunk_output)
+        summary["invalid_names"] += invalid
+        summary["errors_by_rule"].update(rule_counts)
+    
+    chunks = iter_chunks(lines, chunk_size)
+    if jobs <= 1:
+        for chunk in chunks:
+            write(*validate_jsonl_chunk(chunk))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(executor.submit(validate_jsonl_chunk, chunk))
+                if len(pending) >= jobs * 2:
+                    write(*pending.popleft().result())
+            while pending:
+                write(*pending.popleft().result())
+    
+    summary["errors_by_rule"] = dict(summary["errors_by_rule"].most_common())
+    return summary
+
+
+BENCHMARK_WORDS = [
+    "Account", "sharing", "Backup", "history", "Notification", "sounds", "Smart",
+    "compose", "Adjustments", "Library", "sync", "Offline", "mode", "cache",
+    "Simple", "setup", "Free", "trial", "Sanity check", "Privacy", "dashboard",
+]
+
+
+# Inflections used to check recall over the whole banned-term catalog
+RECALL_FORMS = ["{}", "{}s", "{}d", "{}ed", "{}ing"]
+
+
+def catalog_names() -> list[str]:
+    """Names that use every banned term in plain, inflected and compound forms."""
+    names = ["Cached files", "Clear tokens", "Blacklisted domains", "Manage webhooks",
+             "Rapid sync", "Adjustments", "Sanity checks", "100% backed up",
+             "insecure_mode", "unsafe_write", "precache", "enable_cache", "enableCache",
+             "cacheasy", "Of  course"]
+    for term in sorted(ALL_BANNED_TERMS):
+        for form in RECALL_FORMS:
+            word = form.format(term)
+            names.extend([word.capitalize(), f"Clear {word}", f"{word.capitalize()} settings"])
+    return names
+
+
+def recall_mismatches(names: list[str]) -> list[str]:
+    """Names for which check_banned_terms and the per-term scan report different issues."""
+    def key(issues: list[ValidationIssue]) -> list[tuple[str, str]]:
+        return sorted((issue.rule, issue.message) for issue in issues)
+    
+    return [name for name in names if key(check_banned_terms(name)) != key(check_banned_terms_scan(name))]
+
+
+def benchmark(count: int = 200000, seed: int = 0) -> dict:
+    """Time check_banned_terms against the per-term scan on synthetic names.
+
+    Both functions must report the same issues for every catalog and
+    benchmark name; mismatches are listed in the result.
+    """
+    rng = random.Random(seed)
+    names = [
+        " ".join(rng.choice(BENCHMARK_WORDS) for _ in range(rng.randint(1, 4)))
+        for _ in range(count)
+    ]
+    checked = catalog_names() + names[:10000]
+    mismatches = recall_mismatches(checked)
+    
+    timings = {}
+    for label, check in (("scan", check_banned_terms_scan), ("compiled", check_banned_terms)):
+        start = time.perf_counter()
+        for name in names:
+            check(name)
+        timings[label] = time.perf_counter() - start
+    
+    return {
+        "names": count,
+        "scan_seconds": round(timings["scan"], 3),
+        "compiled_seconds": round(timings["compiled"], 3),
+        "scan_names_per_second": round(count / timings["scan"]),
+        "compiled_names_per_second": round(count / timings["compiled"]),
+        "speedup": round(timings["scan"] / timings["compiled"], 1),
+        "recall_checked_names": len(checked),
+        "recall_mismatches": mismatches[:20],
+    }
 
 
 def main():
@@ -357,10 +588,27 @@ def main():
     batch_parser.add_argument("input", help="Input JSON file with names to validate")
     batch_parser.add_argument("--output", "-o", help="Output file for results")
     
+    # Streaming JSONL validation
+    stream_parser = subparsers.add_parser(
+        "stream", help="Validate names from a JSONL file or stdin, writing JSONL results"
+    )
+    stream_parser.add_argument("input", nargs="?", default="-",
+                               help="Input JSONL file, or - for stdin (default)")
+    stream_parser.add_argument("--output", "-o", help="Output JSONL file (default: stdout)")
+    stream_parser.add_argument("--jobs", "-j", type=int, default=1,
+                               help="Worker processes (default: 1)")
+    stream_parser.add_argument("--chunk-size", type=int, default=1000,
+                               help="Names per worker task (default: 1000)")
+    
     # Check term
     check_parser = subparsers.add_parser("check-term", help="Check if a term is banned")
     check_parser.add_argument("term", help="Term to check")
     
+    # Benchmark banned-term matching
+    bench_parser = subparsers.add_parser("benchmark", help="Benchmark banned-term matching")
+    bench_parser.add_argument("--count", "-n", type=int, default=200000,
+                              help="Number of synthetic names (default: 200000)")
+    
     args = parser.parse_args()
     
     if args.command == "validate":
@@ -370,6 +618,9 @@ def main():
         sys.exit(0 if result.is_valid else 1)
     
     elif args.command == "batch":
+        if not Path(args.input).exists():
+            print(f"Error: File not found: {args.input}", file=sys.stderr)
+            sys.exit(2)
         with open(args.input, 'r', encoding='utf-8') as f:
             names = json.load(f)
         
@@ -384,11 +635,29 @@ def main():
             print(output)
         
         # Exit with error if any names invalid
-        invalid_count = sum(1 for r in results if not r["is_valid"])
+        invalid_count = sum(1 for r in results if not r.get("is_valid", False))
         if invalid_count:
             print(f"\n{invalid_count} of {len(results)} names have errors", file=sys.stderr)
             sys.exit(1)
     
+    elif args.command == "stream":
+        if args.input != "-" and not Path(args.input).exists():
+            print(f"Error: File not found: {args.input}", file=sys.stderr)
+            sys.exit(2)
+        source = sys.stdin if args.input == "-" else open(args.input, 'r', encoding='utf-8')
+        out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+        try:
+            summary = stream_batch(source, out, jobs=args.jobs, chunk_size=args.chunk_size)
+        finally:
+            if source is not sys.stdin:
+                source.close()
+            if out is not sys.stdout:
+                out.close()
+        
+        # Summary goes to stderr so stdout stays pure JSONL
+        print(json.dumps(summary, indent=2), file=sys.stderr)
+        sys.exit(1 if summary["invalid_names"] else 0)
+    
     elif args.command == "check-term":
         term = args.term.lower()
         if term in ALL_BANNED_TERMS:
@@ -399,6 +668,11 @@ def main():
             print(f"OK: '{term}' is not in the banned terms list")
             sys.exit(0)
     
+    elif args.command == "benchmark":
+        stats = benchmark(args.count)
+        print(json.dumps(stats, indent=2))
+        sys.exit(1 if stats["recall_mismatches"] else 0)
+    
     else:
         parser.print_help()
         sys.exit(1)
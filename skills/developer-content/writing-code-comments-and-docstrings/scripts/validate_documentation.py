@@ -11,6 +11,7 @@ Checks:
 Usage:
     python validate_documentation.py <source_file>
     python validate_documentation.py --dir <directory> --lang python
+    python validate_documentation.py --dir <directory> --jobs 8 --exclude vendor --exclude 'third_party/*'
 
 Exit codes:
     0 - All validations passed
@@ -19,12 +20,16 @@ Exit codes:
 """
 
 import re
+import os
 import sys
 import argparse
 import ast
+import fnmatch
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
 # Patterns indicating low-quality comments
 OBVIOUS_COMMENT_PATTERNS = [
@@ -207,21 +212,87 @@ def validate_python_file(filepath: Path) -> List[DocIssue]:
     return issues
 
 
+def is_excluded(relpath: str, excludes: List[str]) -> bool:
+    """Check if a path relative to the walk root matches any exclude glob.
+
+    Globs are matched against both the relative path and its final component,
+    so 'vendor' excludes every directory named vendor.
+    """
+    name = relpath.rsplit('/', 1)[-1]
+    return any(
+        fnmatch.fnmatch(relpath, pattern) or fnmatch.fnmatch(name, pattern)
+        for pattern in excludes
+    )
+
+
+def iter_source_files(root: Path, suffix: str = '.py',
+                      excludes: Optional[List[str]] = None) -> Iterator[Path]:
+    """Yield source files under root in sorted order.
+
+    Excluded directories are pruned before they are walked.
+    """
+    excludes = excludes or []
+    for dirpath, dirnames, filenames in os.walk(root):
+        reldir = os.path.relpath(dirpath, root).replace(os.sep, '/')
+        prefix = '' if reldir == '.' else reldir + '/'
+        dirnames[:] = sorted(
+            d for d in dirnames if not is_excluded(prefix + d, excludes)
+        )
+        for filename in sorted(filenames):
+            if filename.endswith(suffix) and not is_excluded(prefix + filename, excludes):
+                yield Path(dirpath) / filename
+
+
+def validate_files(files: Iterator[Path],
+                   jobs: int = 1) -> Iterator[Tuple[Path, List[DocIssue]]]:
+    """Validate files, yielding (path, issues) in input order.
+
+    With jobs > 1, files are submitted to a process pool as they are
+    discovered, with a bounded number in flight.
+    """
+    if jobs <= 1:
+        for filepath in files:
+            yield filepath, validate_python_file(filepath)
+        return
+    
+    max_pending = jobs * 4
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending = deque()
+        for filepath in files:
+            pending.append((filepath, executor.submit(validate_python_file, filepath)))
+            if len(pending) >= max_pending:
+                done_path, future = pending.popleft()
+                yield done_path, future.result()
+        while pending:
+            done_path, future = pending.popleft()
+            yield done_path, future.result()
+
+
 def main():
     parser = argparse.ArgumentParser(description='Validate code documentation')
     parser.add_argument('file', nargs='?', help='File to validate')
     parser.add_argument('--dir', help='Directory to validate recursively')
     parser.add_argument('--lang', default='python', choices=['python'],
                         help='Language (currently only Python supported)')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Worker processes for --dir (default: 1)')
+    parser.add_argument('--exclude', action='append', default=[],
+                        help='Glob for paths to skip under --dir (repeatable)')
     args = parser.parse_args()
     
     if args.dir:
+        if not Path(args.dir).is_dir():
+            print(f"ERROR: Directory not found: {args.dir}")
+            sys.exit(2)
         if args.lang == 'python':
-            files = list(Path(args.dir).rglob('*.py'))
+            files = iter_source_files(Path(args.dir), '.py', args.exclude)
         else:
-            files = []
+            files = iter([])
     elif args.file:
-        files = [Path(args.file)]
+        if not Path(args.file).exists():
+            print(f"ERROR: File not found: {args.file}")
+            sys.exit(2)
+        files = iter([Path(args.file)])
     else:
         parser.print_help()
         sys.exit(2)
@@ -229,13 +300,7 @@ def main():
     total_errors = 0
     total_warnings = 0
     
-    for filepath in files:
-        if not filepath.exists():
-            print(f"ERROR: File not found: {filepath}")
-            sys.exit(2)
-        
-        issues = validate_python_file(filepath)
-        
+    for filepath, issues in validate_files(files, args.jobs):
         if issues:
             print(f"\n{filepath}:")
             for issue in sorted(issues, key=lambda x: x.line):
@@ -8,10 +8,12 @@ Checks:
 - Placeholder patterns are consistent
 - Required comments are present for complex samples
 - Parameter tables follow required format
+- Python samples parse (syntax only, nothing is executed)
 
 Usage:
     python validate_code_samples.py <markdown_file>
     python validate_code_samples.py --dir <directory>
+    python validate_code_samples.py --dir <directory> --jobs 8
 
 Exit codes:
     0 - All validations passed
@@ -21,10 +23,22 @@ Exit codes:
 
 import re
 import sys
+import ast
 import argparse
+import hashlib
+import textwrap
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+# Parsed documents are memoized by scripts/markdown_model.py when this skill
+# sits in the repository; a copy of the skill parses each file itself.
+try:
+    sys.path.append(str(Path(__file__).resolve().parents[4] / "scripts"))
+    from markdown_model import load_document
+except (IndexError, ImportError):
+    load_document = None
 
 # Minimum lines for a sample to require a purpose comment
 MIN_LINES_FOR_PURPOSE_COMMENT = 5
@@ -34,6 +48,12 @@ LANGUAGES_REQUIRING_IMPORTS = {
     'python', 'javascript', 'typescript', 'java', 'go', 'csharp', 'cs', 'rust'
 }
 
+# Fenced block languages that are syntax-checked as Python
+PYTHON_LANGUAGES = {'python', 'py', 'python3'}
+
+# Parse only; samples may use top-level await as in notebooks and asyncio REPLs
+PYTHON_COMPILE_FLAGS = ast.PyCF_ONLY_AST | ast.PyCF_ALLOW_TOP_LEVEL_AWAIT
+
 # Valid placeholder patterns (uppercase with underscores or kebab-case)
 PLACEHOLDER_PATTERNS = [
     r'YOUR_[A-Z_]+',           # YOUR_API_KEY
@@ -190,51 +210,154 @@ def validate_comments(blocks: List[Tuple[int, str, str]]) -> List[ValidationErro
     return errors
 
 
-def validate_parameter_tables(content: str) -> List[ValidationError]:
+def extract_parameter_table_headers(content: str) -> List[Tuple[int, str]]:
+    """Extract (line number, header row) for each parameter table."""
+    headers = []
+    for i, line in enumerate(content.split('\n'), 1):
+        if '| Parameter |' in line or '| parameter |' in line.lower():
+            headers.append((i, line))
+    return headers
+
+
+def validate_parameter_tables(table_headers: List[Tuple[int, str]]) -> List[ValidationError]:
     """Check parameter tables have required columns."""
     errors = []
-    lines = content.split('\n')
     
-    # Find table headers
-    for i, line in enumerate(lines, 1):
-        if '| Parameter |' in line or '| parameter |' in line.lower():
-            # Check for required columns
-            required_cols = ['type', 'required', 'description']
-            line_lower = line.lower()
-            for col in required_cols:
-                if col not in line_lower:
-                    errors.append(ValidationError(
-                        i,
-                        f"Parameter table missing '{col}' column",
-                        "error"
-                    ))
+    for i, line in table_headers:
+        # Check for required columns
+        required_cols = ['type', 'required', 'description']
+        line_lower = line.lower()
+        for col in required_cols:
+            if col not in line_lower:
+                errors.append(ValidationError(
+                    i,
+                    f"Parameter table missing '{col}' column",
+                    "error"
+                ))
     
     return errors
 
 
-def validate_file(filepath: Path) -> List[ValidationError]:
-    """Run all validations on a file."""
+def block_digest(source: str) -> str:
+    return hashlib.blake2b(source.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def check_python_syntax(source: str) -> Optional[Tuple[int, str]]:
+    """Return (line within the sample, message) for the first syntax error, or None."""
     try:
-        content = filepath.read_text(encoding='utf-8')
+        compile(textwrap.dedent(source), '<sample>', 'exec', PYTHON_COMPILE_FLAGS)
+    except SyntaxError as e:
+        return e.lineno or 1, e.msg
+    except ValueError as e:  # e.g. null bytes in the sample
+        return 1, str(e)
+    return None
+
+
+# Syntax check results by block digest, so duplicated samples are parsed once
+_SYNTAX_CACHE: Dict[str, Optional[Tuple[int, str]]] = {}
+
+
+def python_blocks(blocks: List[Tuple[int, str, str]]) -> List[Tuple[int, str]]:
+    """Return (line number, content) of Python blocks, skipping interactive sessions."""
+    return [
+        (line_num, content) for line_num, lang, content in blocks
+        if lang in PYTHON_LANGUAGES and not content.lstrip().startswith('>>>')
+    ]
+
+
+def validate_python_syntax(samples: List[Tuple[int, str]]) -> List[ValidationError]:
+    """Check that Python samples parse, reusing results for identical samples."""
+    errors = []
+    
+    for line_num, content in samples:
+        digest = block_digest(content)
+        if digest not in _SYNTAX_CACHE:
+            _SYNTAX_CACHE[digest] = check_python_syntax(content)
+        failure = _SYNTAX_CACHE[digest]
+        if failure is not None:
+            offset, message = failure
+            errors.append(ValidationError(
+                line_num + offset,
+                f"Python syntax error: {message}",
+                "error"
+            ))
+    
+    return errors
+
+
+def scan_file(filepath: Path) -> Tuple[List[ValidationError], List[Tuple[int, str]]]:
+    """
+    Run every check except the Python syntax check.
+    
+    Returns the errors found and the Python samples still to be parsed.
+    """
+    try:
+        if load_document is not None:
+            document = load_document(filepath)
+        else:
+            content = filepath.read_text(encoding='utf-8')
     except Exception as e:
-        return [ValidationError(0, f"Could not read file: {e}", "error")]
+        return [ValidationError(0, f"Could not read file: {e}", "error")], []
     
-    blocks = extract_code_blocks(content)
+    if load_document is not None:
+        blocks = [(block.line, block.language, block.content) for block in document.code_blocks]
+        table_headers = [
+            (table.line, table.header_line) for table in document.tables
+            if any(column.lower() == 'parameter' for column in table.columns)
+        ]
+    else:
+        blocks = extract_code_blocks(content)
+        table_headers = extract_parameter_table_headers(content)
     
     errors = []
     errors.extend(validate_language_specifier(blocks))
     errors.extend(validate_imports(blocks))
     errors.extend(validate_placeholders(blocks))
     errors.extend(validate_comments(blocks))
-    errors.extend(validate_parameter_tables(content))
+    errors.extend(validate_parameter_tables(table_headers))
     
+    return errors, python_blocks(blocks)
+
+
+def validate_file(filepath: Path) -> List[ValidationError]:
+    """Run all validations on a file."""
+    errors, samples = scan_file(filepath)
+    errors.extend(validate_python_syntax(samples))
     return errors
 
 
+def validate_files(files: List[Path], jobs: int = 1) -> List[List[ValidationError]]:
+    """
+    Validate files, in parallel when jobs > 1. Results are in file order.
+    
+    Files are scanned in the worker pool first. The Python samples they
+    return are then deduplicated by digest across all files, and each
+    distinct sample is syntax-checked once, also in the pool.
+    """
+    if jobs <= 1:
+        return [validate_file(filepath) for filepath in files]
+    
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        scanned = list(executor.map(scan_file, files, chunksize=8))
+        
+        pending = {}
+        for _, samples in scanned:
+            for _, content in samples:
+                digest = block_digest(content)
+                if digest not in _SYNTAX_CACHE:
+                    pending[digest] = content
+        checked = executor.map(check_python_syntax, pending.values(), chunksize=64)
+        _SYNTAX_CACHE.update(zip(pending, checked))
+    
+    return [errors + validate_python_syntax(samples) for errors, samples in scanned]
+
+
 def main():
     parser = argparse.ArgumentParser(description='Validate SDK documentation code samples')
     parser.add_argument('file', nargs='?', help='Markdown file to validate')
     parser.add_argument('--dir', help='Directory to validate recursively')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Worker processes for --dir (default: 1)')
     args = parser.parse_args()
     
     if args.dir:
@@ -252,8 +375,8 @@ def main():
         if not filepath.exists():
             print(f"ERROR: File not found: {filepath}")
             sys.exit(2)
-        
-        errors = validate_file(filepath)
+    
+    for filepath, errors in zip(files, validate_files(files, args.jobs)):
         if errors:
             print(f"\n{filepath}:")
             for error in errors:
@@ -266,6 +389,8 @@ def main():
     
     print(f"\n{'='*50}")
     print(f"Total: {total_errors} errors, {total_warnings} warnings")
+    if args.dir:
+        print(f"Python samples parsed: {len(_SYNTAX_CACHE)} distinct")
     
     if total_errors > 0:
         sys.exit(1)
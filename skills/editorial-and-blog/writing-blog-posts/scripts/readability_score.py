@@ -8,12 +8,30 @@ Flesch-Kincaid grade level, reading time, and actionable suggestions.
 Usage:
     python readability_score.py <blog_post.md>
     python readability_score.py --target-grade 8 <blog_post.md>
+    python readability_score.py --syllable-table syllables.tsv --cache-stats <blog_post.md>
+    python readability_score.py --compile-syllable-table syllables.tsv syllables.bin
+    python readability_score.py --syllable-table syllables.bin --corpus posts/ --cache-stats
+    python readability_score.py --corpus posts/ --jobs 8 --output scores.jsonl
+    python readability_score.py --revisions draft-v1.md draft-v2.md draft-v3.md
+    python readability_score.py --verify --revisions draft-v1.md draft-v2.md
 """
 
 import argparse
+import hashlib
+import json
+import math
+import mmap
+import os
 import re
+import struct
 import sys
-from dataclasses import dataclass
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
 
 # Constants for readability formulas
 # Flesch-Kincaid Grade Level formula constants (standard)
@@ -32,6 +50,17 @@ GRADE_RECOMMENDATIONS = {
     "executive": (10, 12),  # Business leadership
 }
 
+# Distinct words remembered by the syllable cache. Prose vocabulary is
+# small, so this covers a whole blog archive with room to spare.
+SYLLABLE_CACHE_SIZE = 65536
+
+# Optional precomputed word -> syllable counts, see load_syllable_table.
+# Either a dict parsed from a TSV file or a CompiledSyllableTable.
+SYLLABLE_TABLE = {}
+
+# First bytes of a table written by compile_syllable_table
+SYLLABLE_TABLE_MAGIC = b"SYLTAB1\n"
+
 
 @dataclass
 class ReadabilityResult:
@@ -46,7 +75,7 @@ class ReadabilityResult:
     suggestions: list[str]
 
 
-def count_syllables(word: str) -> int:
+def estimate_syllables(word: str) -> int:
     """
     Estimate syllable count for a word.
     Uses a heuristic approach counting vowel groups.
@@ -76,6 +105,142 @@ def count_syllables(word: str) -> int:
     return max(1, count)
 
 
+@lru_cache(maxsize=SYLLABLE_CACHE_SIZE)
+def count_syllables(word: str) -> int:
+    """
+    Return the syllable count for a word.
+    Uses SYLLABLE_TABLE when the word is listed, otherwise the heuristic.
+    Results are memoized, so repeated words cost a dict lookup.
+    """
+    key = word.lower().strip()
+    syllables = SYLLABLE_TABLE.get(key)
+    if syllables is not None:
+        return syllables
+    return estimate_syllables(key)
+
+
+class CompiledSyllableTable:
+    """
+    Read-only syllable table mapped from a file written by
+    compile_syllable_table.
+
+    Nothing is parsed at load time. Lookups binary-search the sorted
+    entries in place, and worker processes share the mapped pages.
+    Layout after the magic: entry count (uint32), count + 1 entry offsets
+    (uint32), then each entry as UTF-8 word bytes plus one count byte.
+    """
+    
+    def __init__(self, path: Path):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header = len(SYLLABLE_TABLE_MAGIC)
+        if self._map[:header] != SYLLABLE_TABLE_MAGIC:
+            raise ValueError(f"{path}: not a compiled syllable table")
+        (self._count,) = struct.unpack_from("<I", self._map, header)
+        self._offsets = header + 4
+        self._entries = self._offsets + 4 * (self._count + 1)
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def get(self, word: str) -> Optional[int]:
+        key = word.encode("utf-8")
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            start, end = struct.unpack_from("<II", self._map, self._offsets + 4 * middle)
+            entry = self._map[self._entries + start:self._entries + end - 1]
+            if entry < key:
+                low = middle + 1
+            elif entry > key:
+                high = middle
+            else:
+                return self._map[self._entries + end - 1]
+        return None
+
+
+def read_syllable_tsv(path: Path) -> dict[str, int]:
+    """
+    Parse a plain-text syllable table.
+
+    The table has one "word<TAB>syllables" entry per line, for example
+    generated from a pronouncing dictionary. Lines starting with # are
+    comments.
+    """
+    table = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                word, syllables = line.split("\t")
+                table[word.lower()] = int(syllables)
+            except ValueError:
+                raise ValueError(f"{path}:{line_number}: expected 'word<TAB>syllables'")
+    return table
+
+
+def compile_syllable_table(source: Path, target: Path) -> int:
+    """
+    Convert a plain-text syllable table to the compiled form and return
+    the number of entries. Load the compiled file with load_syllable_table.
+    """
+    entries = sorted(
+        (word.encode("utf-8"), syllables)
+        for word, syllables in read_syllable_tsv(source).items()
+    )
+    for word, syllables in entries:
+        if not 0 <= syllables <= 255:
+            raise ValueError(f"{source}: syllable count for {word.decode()!r} is out of range")
+    offsets = [0]
+    for word, _ in entries:
+        offsets.append(offsets[-1] + len(word) + 1)
+    with open(target, "wb") as f:
+        f.write(SYLLABLE_TABLE_MAGIC)
+        f.write(struct.pack(f"<I{len(offsets)}I", len(entries), *offsets))
+        for word, syllables in entries:
+            f.write(word + bytes((syllables,)))
+    return len(entries)
+
+
+def load_syllable_table(path: Path) -> int:
+    """
+    Load a precomputed syllable table and return the number of entries.
+
+    A compiled table (see compile_syllable_table) is memory-mapped; a
+    plain-text table is parsed into a dict. Loading clears the memoized
+    counts.
+    """
+    global SYLLABLE_TABLE
+    with open(path, "rb") as f:
+        compiled = f.read(len(SYLLABLE_TABLE_MAGIC)) == SYLLABLE_TABLE_MAGIC
+    SYLLABLE_TABLE = CompiledSyllableTable(path) if compiled else read_syllable_tsv(path)
+    count_syllables.cache_clear()
+    return len(SYLLABLE_TABLE)
+
+
+def syllable_cache_stats(hits: Optional[int] = None, misses: Optional[int] = None) -> dict:
+    """
+    Return hit statistics for the syllable cache in this process, or for
+    hit and miss counts collected elsewhere, such as from corpus workers.
+    """
+    info = count_syllables.cache_info()
+    if hits is None:
+        hits, misses = info.hits, info.misses
+    lookups = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        "cached_words": info.currsize,
+        "table_words": len(SYLLABLE_TABLE),
+    }
+
+
+FRONTMATTER_PATTERN = re.compile(r'^---\s*\n.*?\n---\s*\n', re.DOTALL)
+
+
 def extract_text(markdown: str) -> str:
     """
     Extract readable text from markdown, removing code blocks,
@@ -137,6 +302,19 @@ def count_sentences(text: str) -> int:
     return max(1, len(sentences))
 
 
+def iter_markdown_files(paths: list[str]):
+    """Yield markdown files under paths, sorted per directory."""
+    for root in paths:
+        if os.path.isfile(root):
+            yield Path(root)
+            continue
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                if filename.endswith(('.md', '.markdown')):
+                    yield Path(dirpath) / filename
+
+
 def calculate_readability(text: str, target_grade: float = 8.0) -> ReadabilityResult:
     """
     Calculate readability metrics for the given text.
@@ -148,6 +326,14 @@ def calculate_readability(text: str, target_grade: float = 8.0) -> ReadabilityRe
     # Calculate syllables
     syllable_count = sum(count_syllables(word) for word in words)
     
+    return readability_from_counts(word_count, sentence_count, syllable_count, target_grade)
+
+
+def readability_from_counts(word_count: int, sentence_count: int, syllable_count: int,
+                            target_grade: float = 8.0) -> ReadabilityResult:
+    """
+    Build readability metrics and suggestions from raw counts.
+    """
     # Avoid division by zero
     if word_count == 0 or sentence_count == 0:
         return ReadabilityResult(
@@ -211,11 +397,261 @@ def calculate_readability(text: str, target_grade: float = 8.0) -> ReadabilityRe
     )
 
 
+SENTENCE_END_PATTERN = re.compile(r'[.!?]+')
+# Blank lines, split after the newline that ends the previous block
+BLANK_LINE_PATTERN = re.compile(r'(?<=\n)[ \t]*\n')
+
+# The extract_text passes whose matches can run across a blank line, each
+# with a pattern for an opener it left unmatched at the end of the text.
+# Images cannot span blank lines. Line markers only do when the whitespace
+# after them runs to the end of the text (see MARKER_LINE_END_PATTERN).
+SPANNING_MARKUP = [
+    (re.compile(r'```.*?```', re.DOTALL), '', re.compile(r'```')),
+    (re.compile(r'`[^`]+`'), '', re.compile(r'`')),
+    (re.compile(r'\[([^\]]+)\]\([^)]+\)'), r'\1', re.compile(r'\[[^\]]*\Z|\]\([^)]*\Z')),
+    (re.compile(r'!\[.*?\]\(.*?\)'), '', None),
+    (re.compile(r'\*\*([^*]+)\*\*'), r'\1', re.compile(r'\*\*[^*]*\Z')),
+    (re.compile(r'\*([^*]+)\*'), r'\1', re.compile(r'\*[^*]*\Z')),
+    (re.compile(r'__([^_]+)__'), r'\1', re.compile(r'__[^_]*\Z')),
+    (re.compile(r'_([^_]+)_'), r'\1', re.compile(r'_[^_]*\Z')),
+]
+OPEN_COMMENT_PATTERN = re.compile(r'<!--(?:(?!-->).)*\Z', re.DOTALL)
+# A last line of only list, quote or header markers, whose trailing
+# whitespace the marker passes would strip from the next line too
+MARKER_LINE_END_PATTERN = re.compile(r'(?:\A|\n)[#>*+\-\d][#>*+\-\d. \t]*\s*\Z')
+# Open blocks longer than this are rechecked only each time they double,
+# so markup left open for long stretches does not make splitting quadratic
+RECHECK_LENGTH = 4096
+
+
+@dataclass(frozen=True)
+class ParagraphCounts:
+    """Counts for one paragraph's prose, enough to combine with its neighbours."""
+    words: int
+    syllables: int
+    sentences: int        # non-empty segments between sentence-ending punctuation
+    starts_open: bool     # text before the first sentence end
+    ends_open: bool       # text after the last sentence end
+    has_end: bool         # any sentence-ending punctuation at all
+
+
+def count_paragraph(text: str) -> ParagraphCounts:
+    """Count words, syllables and sentence segments in extracted paragraph text."""
+    words = re.findall(r'\b[a-zA-Z\']+\b', text)
+    segments = SENTENCE_END_PATTERN.split(text)
+    return ParagraphCounts(
+        words=len(words),
+        syllables=sum(count_syllables(word) for word in words),
+        sentences=sum(1 for segment in segments if segment.strip()),
+        starts_open=bool(segments[0].strip()),
+        ends_open=bool(segments[-1].strip()),
+        has_end=len(segments) > 1,
+    )
+
+
+def leaves_markup_open(text: str) -> bool:
+    """
+    Whether extract_text could pair markup in text with markup after it.
+    Runs the spanning passes of extract_text in order and checks each for
+    an opener left unmatched at the end.
+    """
+    for pattern, replacement, left_open in SPANNING_MARKUP:
+        text = pattern.sub(replacement, text)
+        if left_open and left_open.search(text):
+            return True
+    if MARKER_LINE_END_PATTERN.search(text):
+        return True
+    # HTML comments are removed last, after every other pass
+    return bool(OPEN_COMMENT_PATTERN.search(text))
+
+
+def split_paragraphs(markdown: str) -> list[str]:
+    """
+    Split markdown into blocks at blank lines, without the frontmatter.
+    Blocks stay joined while extract_text could pair markup across the
+    blank line, so fenced code, comments, links and emphasis that span
+    paragraphs stay in one block.
+    """
+    frontmatter = FRONTMATTER_PATTERN.match(markdown)
+    body = markdown[frontmatter.end() if frontmatter else 0:]
+    blocks = []
+    pending = []
+    pending_length = recheck_at = 0
+    for block in BLANK_LINE_PATTERN.split(body):
+        pending.append(block)
+        pending_length += len(block) + 1
+        if pending_length < recheck_at:
+            continue
+        text = '\n'.join(pending)
+        if not leaves_markup_open(text):
+            blocks.append(text)
+            pending = []
+            pending_length = recheck_at = 0
+        elif pending_length > RECHECK_LENGTH:
+            recheck_at = 2 * pending_length
+    if pending:
+        blocks.append('\n'.join(pending))
+    return blocks
+
+
+class IncrementalScorer:
+    """
+    Readability scorer for repeated saves of one document.
+    
+    Counts are kept per paragraph, keyed by a hash of the paragraph's
+    markdown. Each call to score() recomputes only paragraphs that are new
+    or changed and combines the cached totals into the document result.
+    
+    Results equal calculate_readability(extract_text(markdown)); use
+    --revisions with --verify to check this on real documents.
+    """
+    
+    def __init__(self, target_grade: float = 8.0):
+        self.target_grade = target_grade
+        self.paragraphs: dict[bytes, ParagraphCounts] = {}
+        self.last_recomputed = 0
+    
+    def score(self, markdown: str) -> ReadabilityResult:
+        previous = self.paragraphs
+        current: dict[bytes, ParagraphCounts] = {}
+        ordered = []
+        recomputed = 0
+        for block in split_paragraphs(markdown):
+            key = hashlib.blake2b(block.encode('utf-8'), digest_size=16).digest()
+            counts = current.get(key) or previous.get(key)
+            if counts is None:
+                # The leading newline stops extract_text reading a block
+                # that opens with --- as frontmatter
+                counts = count_paragraph(extract_text('\n' + block))
+                recomputed += 1
+            current[key] = counts
+            ordered.append(counts)
+        # Drop paragraphs that are no longer in the document
+        self.paragraphs = current
+        self.last_recomputed = recomputed
+        return self._combine(ordered)
+    
+    def _combine(self, ordered: list[ParagraphCounts]) -> ReadabilityResult:
+        words = syllables = sentences = 0
+        open_before = False
+        for counts in ordered:
+            words += counts.words
+            syllables += counts.syllables
+            sentences += counts.sentences
+            # A sentence left open at the end of one paragraph continues
+            # into the next, as in count_sentences on the whole text
+            if open_before and counts.starts_open:
+                sentences -= 1
+            if counts.has_end:
+                open_before = counts.ends_open
+            elif counts.starts_open:
+                open_before = True
+        return readability_from_counts(words, max(1, sentences), syllables, self.target_grade)
+
+
+# Metrics summarized as percentile distributions in corpus mode
+CORPUS_METRICS = {
+    "flesch_kincaid_grade": "grade",
+    "avg_words_per_sentence": "sentence_length",
+    "reading_time_minutes": "reading_time_minutes",
+}
+CORPUS_PERCENTILES = (50, 90, 99)
+
+
+def score_file(filepath: Path, target_grade: float = 8.0) -> dict:
+    """Score one markdown file. Read errors are reported in the record, not raised."""
+    try:
+        content = Path(filepath).read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as e:
+        return {"file": str(filepath), "error": str(e)}
+    result = calculate_readability(extract_text(content), target_grade)
+    return {"file": str(filepath), **asdict(result)}
+
+
+def _init_corpus_worker(syllable_table: str) -> None:
+    if syllable_table:
+        load_syllable_table(Path(syllable_table))
+
+
+def _score_file_with_cache_stats(filepath: Path, target_grade: float) -> tuple[dict, int, int]:
+    """score_file, plus the syllable cache hits and misses it caused in this process."""
+    before = count_syllables.cache_info()
+    record = score_file(filepath, target_grade)
+    after = count_syllables.cache_info()
+    return record, after.hits - before.hits, after.misses - before.misses
+
+
+def score_corpus(files, target_grade: float = 8.0, jobs: int = 1, syllable_table: str = "",
+                 cache_stats: Optional[dict] = None):
+    """
+    Score files, yielding one record per file in input order.
+    
+    With jobs > 1, files are submitted to a process pool as they are
+    discovered, with a bounded number in flight. If cache_stats is given,
+    the syllable cache hits and misses of every worker are added to its
+    "hits" and "misses" counts.
+    """
+    def collect(scored: tuple[dict, int, int]) -> dict:
+        record, hits, misses = scored
+        if cache_stats is not None:
+            cache_stats["hits"] = cache_stats.get("hits", 0) + hits
+            cache_stats["misses"] = cache_stats.get("misses", 0) + misses
+        return record
+    
+    if jobs <= 1:
+        for filepath in files:
+            yield collect(_score_file_with_cache_stats(filepath, target_grade))
+        return
+    
+    max_pending = jobs * 4
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_corpus_worker,
+        initargs=(syllable_table,),
+    ) as executor:
+        pending = deque()
+        for filepath in files:
+            pending.append(executor.submit(_score_file_with_cache_stats, filepath, target_grade))
+            if len(pending) >= max_pending:
+                yield collect(pending.popleft().result())
+        while pending:
+            yield collect(pending.popleft().result())
+
+
+def percentile(sorted_values: list, p: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize_corpus(records: list[dict]) -> dict:
+    """Aggregate per-file records into totals and percentile distributions."""
+    scored = [r for r in records if "error" not in r and r["word_count"]]
+    summary = {
+        "files": len(records),
+        "scored": len(scored),
+        "empty": sum(1 for r in records if "error" not in r and not r["word_count"]),
+        "errors": sum(1 for r in records if "error" in r),
+        "passed": sum(1 for r in scored if r["passed"]),
+        "needs_work": sum(1 for r in scored if not r["passed"]),
+        "total_words": sum(r["word_count"] for r in scored),
+    }
+    for field_name, label in CORPUS_METRICS.items():
+        values = sorted(r[field_name] for r in scored)
+        summary[label] = {
+            f"p{p}": percentile(values, p) for p in CORPUS_PERCENTILES
+        }
+        summary[label]["max"] = values[-1] if values else 0
+    return summary
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Calculate readability score for blog posts"
     )
-    parser.add_argument("file", help="Markdown file to analyze")
+    parser.add_argument("file", nargs="?", help="Markdown file to analyze")
     parser.add_argument(
         "--target-grade", "-g",
         type=float,
@@ -228,14 +664,131 @@ def main():
         default="general",
         help="Audience type for grade recommendations"
     )
+    parser.add_argument(
+        "--syllable-table",
+        help="Precomputed syllable table, compiled or word<TAB>syllables text; "
+             "unlisted words use the heuristic"
+    )
+    parser.add_argument(
+        "--compile-syllable-table",
+        nargs=2,
+        metavar=("TSV", "OUTPUT"),
+        help="Convert a word<TAB>syllables table to the compiled, memory-mapped form and exit"
+    )
+    parser.add_argument(
+        "--cache-stats",
+        action="store_true",
+        help="Report syllable cache hit rate (summed over workers with --corpus)"
+    )
+    parser.add_argument(
+        "--corpus",
+        nargs="+",
+        metavar="PATH",
+        help="Score every markdown file under these files or directories"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for --corpus (default: CPU count)"
+    )
+    parser.add_argument(
+        "--output", "-o",
+        help="Per-file JSONL output for --corpus (default: stdout)"
+    )
+    parser.add_argument(
+        "--revisions",
+        nargs="+",
+        metavar="FILE",
+        help="Score successive revisions of one post incrementally and report "
+             "how many paragraphs each save recomputed"
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="With --revisions, check each result against whole-document scoring"
+    )
     
     args = parser.parse_args()
     
+    if args.compile_syllable_table:
+        source, target = args.compile_syllable_table
+        try:
+            entries = compile_syllable_table(Path(source), Path(target))
+        except (OSError, ValueError) as e:
+            print(f"Error compiling syllable table: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"Compiled {entries:,} words to {target}")
+        sys.exit(0)
+    
+    if not args.file and not args.corpus and not args.revisions:
+        parser.error("a markdown file, --corpus or --revisions is required")
+    
+    if args.syllable_table:
+        try:
+            load_syllable_table(Path(args.syllable_table))
+        except (OSError, ValueError) as e:
+            print(f"Error loading syllable table: {e}", file=sys.stderr)
+            sys.exit(1)
+    
     # Adjust target based on audience if not explicitly set
     if args.audience != "general" and args.target_grade == 8.0:
         min_grade, max_grade = GRADE_RECOMMENDATIONS[args.audience]
         args.target_grade = (min_grade + max_grade) / 2
     
+    if args.revisions:
+        scorer = IncrementalScorer(args.target_grade)
+        for revision in args.revisions:
+            try:
+                content = Path(revision).read_text(encoding="utf-8")
+            except OSError as e:
+                print(f"Error reading file: {e}", file=sys.stderr)
+                sys.exit(1)
+            start = time.perf_counter()
+            result = scorer.score(content)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            print(f"{revision}: grade {result.flesch_kincaid_grade}, "
+                  f"{result.word_count:,} words, {scorer.last_recomputed}/{len(scorer.paragraphs)} "
+                  f"paragraphs recomputed in {elapsed_ms:.1f} ms")
+            if args.verify and result != calculate_readability(extract_text(content), args.target_grade):
+                print(f"Error: {revision}: incremental result differs from whole-document scoring",
+                      file=sys.stderr)
+                sys.exit(1)
+        sys.exit(0 if result.passed else 1)
+    
+    if args.corpus:
+        for path in args.corpus:
+            if not os.path.exists(path):
+                print(f"Error: Path not found: {path}", file=sys.stderr)
+                sys.exit(1)
+        
+        files = iter_markdown_files(args.corpus)
+        out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+        records = []
+        cache_stats = {"hits": 0, "misses": 0} if args.cache_stats else None
+        start = time.perf_counter()
+        try:
+            for record in score_corpus(files, args.target_grade, args.jobs,
+                                       args.syllable_table or "", cache_stats):
+                out.write(json.dumps(record) + "\n")
+                # Keep only what the summary needs
+                records.append({k: v for k, v in record.items() if k != "suggestions"})
+        finally:
+            if out is not sys.stdout:
+                out.close()
+        
+        summary = summarize_corpus(records)
+        summary["target_grade"] = args.target_grade
+        summary["seconds"] = round(time.perf_counter() - start, 3)
+        if cache_stats is not None:
+            stats = syllable_cache_stats(cache_stats["hits"], cache_stats["misses"])
+            # Cache sizes are per worker, so only the summed counts are reported
+            del stats["cached_words"]
+            summary["syllable_cache"] = stats
+        # Summary goes to stderr so stdout stays pure JSONL
+        print(json.dumps(summary, indent=2), file=sys.stderr)
+        sys.exit(0 if summary["needs_work"] == 0 and summary["errors"] == 0 else 1)
+    
     try:
         with open(args.file, "r", encoding="utf-8") as f:
             content = f.read()
@@ -271,6 +824,12 @@ def main():
     for suggestion in result.suggestions:
         print(f"  • {suggestion}")
     
+    if args.cache_stats:
+        stats = syllable_cache_stats()
+        print()
+        print(f"Syllable cache: {stats['hits']:,} hits, {stats['misses']:,} misses "
+              f"({stats['hit_rate']:.0%} hit rate, {stats['table_words']:,} table words)")
+    
     sys.exit(0 if result.passed else 1)
 
 
@@ -9,13 +9,19 @@ Usage:
     python character_limit_validator.py <listing_file.md>
     python character_limit_validator.py --platform ios <listing_file.md>
     python character_limit_validator.py --platform android <listing_file.md>
+    python character_limit_validator.py --release release/3.2/ --jobs 8 --output report.json
 """
 
 import argparse
+import json
+import os
 import re
 import sys
-from dataclasses import dataclass
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterator, Optional, Union
 
 # Platform character limits (source: Apple/Google documentation, verified Feb 2026)
 IOS_LIMITS = {
@@ -34,6 +40,30 @@ ANDROID_LIMITS = {
     "whats_new": 500,
 }
 
+# Listing fields and the headers each may appear under, in preference order
+IOS_FIELD_HEADERS = {
+    "app_name": ["App Name", "Name"],
+    "subtitle": ["Subtitle"],
+    "promotional_text": ["Promotional Text", "Promo Text"],
+    "description": ["Description"],
+    "keywords": ["Keywords"],
+    "whats_new": ["What's New", "Whats New", "Release Notes"],
+}
+
+ANDROID_FIELD_HEADERS = {
+    "app_name": ["App Name", "Name"],
+    "short_description": ["Short Description", "Short Desc"],
+    "full_description": ["Full Description", "Description"],
+    "whats_new": ["What's New", "Whats New", "Release Notes"],
+}
+
+# Headers that only appear in one store's listing
+IOS_ONLY_HEADERS = ["Subtitle", "Promotional Text", "Promo Text"]
+ANDROID_ONLY_HEADERS = ["Short Description", "Short Desc"]
+
+# Any heading of level 2 or deeper; only level 2 ends a section
+HEADING_PATTERN = re.compile(r"^(#{2,})[ \t]*(.*?)[ \t]*$", re.MULTILINE)
+
 
 @dataclass
 class ValidationResult:
@@ -56,73 +86,81 @@ def count_characters(text: str) -> int:
     return len(text.strip())
 
 
-def extract_field(content: str, field_header: str) -> Optional[str]:
-    """
-    Extract content under a markdown header.
-    Returns content between the header and the next header of same or higher level.
-    """
-    # Match ## Header or variations
-    pattern = rf"##\s*{re.escape(field_header)}\s*\n(.*?)(?=\n##\s|\Z)"
-    match = re.search(pattern, content, re.DOTALL | re.IGNORECASE)
-    if match:
-        return match.group(1).strip()
-    return None
+def normalize_header(header: str) -> str:
+    """Case-fold a header and collapse its internal whitespace."""
+    return " ".join(header.split()).casefold()
 
 
-def validate_ios(content: str) -> list[ValidationResult]:
-    """Validate content against iOS App Store limits."""
-    results = []
+class SectionIndex:
+    """
+    Markdown sections keyed by normalized header, built in one pass.
     
-    field_mapping = {
-        "app_name": ["App Name", "Name"],
-        "subtitle": ["Subtitle"],
-        "promotional_text": ["Promotional Text", "Promo Text"],
-        "description": ["Description"],
-        "keywords": ["Keywords"],
-        "whats_new": ["What's New", "Whats New", "Release Notes"],
-    }
+    A section runs from the line after its header to the next level-2
+    header, so deeper headers stay inside their parent section. When a
+    header repeats, the first occurrence wins.
+    """
     
-    for field, headers in field_mapping.items():
-        limit = IOS_LIMITS[field]
-        extracted = None
-        
+    def __init__(self, content: str):
+        self.content = content
+        self.sections: dict[str, tuple[int, int]] = {}
+        open_keys: list[tuple[str, int]] = []
+        for match in HEADING_PATTERN.finditer(content):
+            if len(match.group(1)) == 2:
+                self._close(open_keys, match.start() - 1)
+            if match.end() < len(content):
+                open_keys.append((normalize_header(match.group(2)), match.end() + 1))
+        self._close(open_keys, len(content))
+    
+    def _close(self, open_keys: list[tuple[str, int]], end: int) -> None:
+        for key, start in open_keys:
+            self.sections.setdefault(key, (start, end))
+        open_keys.clear()
+    
+    def __contains__(self, header: str) -> bool:
+        return normalize_header(header) in self.sections
+    
+    def get(self, header: str) -> Optional[str]:
+        """Return the stripped content under header, or None if absent."""
+        span = self.sections.get(normalize_header(header))
+        if span is None:
+            return None
+        return self.content[span[0]:span[1]].strip()
+    
+    def first(self, headers: list[str]) -> Optional[str]:
+        """Return the content of the first header with non-empty content."""
         for header in headers:
-            extracted = extract_field(content, header)
+            extracted = self.get(header)
             if extracted:
-                break
-        
-        if extracted:
-            char_count = count_characters(extracted)
-            results.append(ValidationResult(
-                field=field,
-                content=extracted[:50] + "..." if len(extracted) > 50 else extracted,
-                limit=limit,
-                actual=char_count,
-                passed=char_count <= limit
-            ))
-    
-    return results
+                return extracted
+        return None
 
 
-def validate_android(content: str) -> list[ValidationResult]:
-    """Validate content against Google Play Store limits."""
+@lru_cache(maxsize=32)
+def index_sections(content: str) -> SectionIndex:
+    """Return the section index for content, reusing it across lookups."""
+    return SectionIndex(content)
+
+
+def as_index(content: Union[str, SectionIndex]) -> SectionIndex:
+    return content if isinstance(content, SectionIndex) else index_sections(content)
+
+
+def extract_field(content: Union[str, SectionIndex], field_header: str) -> Optional[str]:
+    """
+    Extract content under a markdown header.
+    Returns content between the header and the next level-2 header.
+    """
+    return as_index(content).get(field_header)
+
+
+def validate_fields(index: SectionIndex, field_headers: dict[str, list[str]],
+                    limits: dict[str, int]) -> list[ValidationResult]:
+    """Validate each field found in the index against its limit."""
     results = []
     
-    field_mapping = {
-        "app_name": ["App Name", "Name"],
-        "short_description": ["Short Description", "Short Desc"],
-        "full_description": ["Full Description", "Description"],
-        "whats_new": ["What's New", "Whats New", "Release Notes"],
-    }
-    
-    for field, headers in field_mapping.items():
-        limit = ANDROID_LIMITS[field]
-        extracted = None
-        
-        for header in headers:
-            extracted = extract_field(content, header)
-            if extracted:
-                break
+    for field, headers in field_headers.items():
+        limit = limits[field]
+        extracted = index.first(headers)
         
         if extracted:
             char_count = count_characters(extracted)
@@ -137,29 +175,135 @@ def validate_android(content: str) -> list[ValidationResult]:
     return results
 
 
-def detect_platform(content: str) -> str:
-    """Auto-detect platform based on field presence."""
-    if "subtitle" in content.lower() or "promotional text" in content.lower():
+def validate_ios(content: Union[str, SectionIndex]) -> list[ValidationResult]:
+    """Validate content against iOS App Store limits."""
+    return validate_fields(as_index(content), IOS_FIELD_HEADERS, IOS_LIMITS)
+
+
+def validate_android(content: Union[str, SectionIndex]) -> list[ValidationResult]:
+    """Validate content against Google Play Store limits."""
+    return validate_fields(as_index(content), ANDROID_FIELD_HEADERS, ANDROID_LIMITS)
+
+
+def detect_platform(content: Union[str, SectionIndex]) -> str:
+    """Auto-detect platform based on which store-specific headers are present."""
+    index = as_index(content)
+    if any(header in index for header in IOS_ONLY_HEADERS):
         return "ios"
-    if "short description" in content.lower():
+    if any(header in index for header in ANDROID_ONLY_HEADERS):
         return "android"
     return "both"
 
 
+def iter_listings(release_dir: Path) -> Iterator[tuple[str, Path]]:
+    """
+    Yield (locale, path) for every markdown listing under a release folder.
+    
+    Listings in a subfolder take the subfolder's name as their locale
+    (release/de-DE/listing.md); listings at the top level take their file
+    name (release/de-DE.md).
+    """
+    for path in sorted(release_dir.rglob("*.md")):
+        relative = path.relative_to(release_dir)
+        locale = relative.parts[0] if len(relative.parts) > 1 else path.stem
+        yield locale, path
+
+
+def validate_listing(task: tuple[str, str, str]) -> dict:
+    """Validate one listing file. Runs in a worker process in batch mode."""
+    locale, filepath, platform = task
+    try:
+        content = Path(filepath).read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as e:
+        return {"locale": locale, "file": filepath, "error": str(e), "passed": False}
+    
+    index = SectionIndex(content)
+    if platform == "auto":
+        platform = detect_platform(index)
+    results = []
+    if platform in ("ios", "both"):
+        results += [{"platform": "ios", **asdict(r)} for r in validate_ios(index)]
+    if platform in ("android", "both"):
+        results += [{"platform": "android", **asdict(r)} for r in validate_android(index)]
+    return {
+        "locale": locale,
+        "file": filepath,
+        "platform": platform,
+        "passed": bool(results) and all(r["passed"] for r in results),
+        "results": results,
+    }
+
+
+def validate_release(release_dir: Path, platform: str = "auto", jobs: int = 1) -> dict:
+    """Validate every locale's listing in a release folder, in parallel when jobs > 1."""
+    tasks = [(locale, str(path), platform) for locale, path in iter_listings(release_dir)]
+    if jobs <= 1 or len(tasks) <= 1:
+        listings = list(map(validate_listing, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            listings = list(executor.map(validate_listing, tasks))
+    
+    return {
+        "summary": {
+            "release": str(release_dir),
+            "listings": len(listings),
+            "passed": sum(1 for listing in listings if listing["passed"]),
+            "failed": [listing["locale"] for listing in listings if not listing["passed"]],
+        },
+        "listings": listings,
+    }
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Validate app store listing character limits"
     )
-    parser.add_argument("file", help="Markdown file containing listing content")
+    parser.add_argument("file", nargs="?", help="Markdown file containing listing content")
     parser.add_argument(
         "--platform",
         choices=["ios", "android", "both"],
         default="auto",
         help="Target platform (default: auto-detect)"
     )
+    parser.add_argument(
+        "--release",
+        metavar="FOLDER",
+        help="Validate every locale's listing under a release folder"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for --release (default: CPU count)"
+    )
+    parser.add_argument("--output", "-o", help="Write the --release JSON report to a file")
     
     args = parser.parse_args()
     
+    if args.release:
+        release_dir = Path(args.release)
+        if not release_dir.is_dir():
+            print(f"Error: Release folder not found: {args.release}", file=sys.stderr)
+            sys.exit(1)
+        report = validate_release(release_dir, args.platform, args.jobs)
+        summary = report["summary"]
+        if not summary["listings"]:
+            print(f"Warning: No listings found in {args.release}", file=sys.stderr)
+            sys.exit(1)
+        output = json.dumps(report, indent=2, ensure_ascii=False)
+        if args.output:
+            Path(args.output).write_text(output, encoding="utf-8")
+        else:
+            print(output)
+        print(
+            f"=== {summary['passed']}/{summary['listings']} locales passed ===",
+            file=sys.stderr
+        )
+        sys.exit(1 if summary["failed"] else 0)
+    
+    if not args.file:
+        parser.error("a listing file or --release is required")
+    
     try:
         with open(args.file, "r", encoding="utf-8") as f:
             content = f.read()
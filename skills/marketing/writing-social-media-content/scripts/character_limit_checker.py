@@ -10,13 +10,22 @@ Usage:
     python character_limit_checker.py --platform twitter <post_file.md>
     python character_limit_checker.py --platform linkedin <post_file.md>
     python character_limit_checker.py --text "Your post content here" --platform twitter
+    python character_limit_checker.py --bulk campaign.csv --output results.jsonl
+    python character_limit_checker.py --bulk campaign.jsonl --text-field body --platform twitter
+    python character_limit_checker.py --benchmark
 """
 
 import argparse
+import csv
+import json
 import re
 import sys
+import time
+import unicodedata
+from bisect import bisect_right
 from dataclasses import dataclass
-from typing import Optional
+from functools import cached_property, lru_cache
+from typing import Iterator, Optional, Union
 
 # Platform limits (verified Feb 2026)
 # Source: Platform documentation and API specifications
@@ -45,6 +54,255 @@ PLATFORM_LIMITS = {
 }
 
 
+URL_PATTERN = re.compile(r'https?://\S+')
+HASHTAG_PATTERN = re.compile(r'#\w+')
+
+# Twitter weighted length (twitter-text v3 configuration). Code points in
+# these ranges weigh one scale unit; everything else, and every emoji
+# sequence as a whole, weighs TWITTER_DEFAULT_WEIGHT.
+TWITTER_WEIGHT_SCALE = 100
+TWITTER_DEFAULT_WEIGHT = 200
+TWITTER_WEIGHT_RANGES = [
+    # (first, last, weight), sorted and non-overlapping
+    (0x0000, 0x10FF, 100),  # Latin, Greek, Cyrillic, Hebrew, Arabic, Indic, Thai, ...
+    (0x2000, 0x200D, 100),  # General punctuation spaces and joiners
+    (0x2010, 0x201F, 100),  # Dashes and quotation marks
+    (0x2032, 0x2037, 100),  # Primes
+]
+_WEIGHT_RANGE_STARTS = [first for first, _, _ in TWITTER_WEIGHT_RANGES]
+
+# Extended_Pictographic from Unicode emoji-data, as (first, last) ranges
+EXTENDED_PICTOGRAPHIC_RANGES = [
+    (0x00A9, 0x00A9), (0x00AE, 0x00AE), (0x203C, 0x203C), (0x2049, 0x2049),
+    (0x2122, 0x2122), (0x2139, 0x2139), (0x2194, 0x2199), (0x21A9, 0x21AA),
+    (0x231A, 0x231B), (0x2328, 0x2328), (0x2388, 0x2388), (0x23CF, 0x23CF),
+    (0x23E9, 0x23F3), (0x23F8, 0x23FA), (0x24C2, 0x24C2), (0x25AA, 0x25AB),
+    (0x25B6, 0x25B6), (0x25C0, 0x25C0), (0x25FB, 0x25FE), (0x2600, 0x2605),
+    (0x2607, 0x2612), (0x2614, 0x2685), (0x2690, 0x2705), (0x2708, 0x2712),
+    (0x2714, 0x2714), (0x2716, 0x2716), (0x271D, 0x271D), (0x2721, 0x2721),
+    (0x2728, 0x2728), (0x2733, 0x2734), (0x2744, 0x2744), (0x2747, 0x2747),
+    (0x274C, 0x274C), (0x274E, 0x274E), (0x2753, 0x2755), (0x2757, 0x2757),
+    (0x2763, 0x2767), (0x2795, 0x2797), (0x27A1, 0x27A1), (0x27B0, 0x27B0),
+    (0x27BF, 0x27BF), (0x2934, 0x2935), (0x2B05, 0x2B07), (0x2B1B, 0x2B1C),
+    (0x2B50, 0x2B50), (0x2B55, 0x2B55), (0x3030, 0x3030), (0x303D, 0x303D),
+    (0x3297, 0x3297), (0x3299, 0x3299), (0x1F000, 0x1F0FF), (0x1F10D, 0x1F10F),
+    (0x1F12F, 0x1F12F), (0x1F16C, 0x1F171), (0x1F17E, 0x1F17F), (0x1F18E, 0x1F18E),
+    (0x1F191, 0x1F19A), (0x1F1AD, 0x1F1E5), (0x1F201, 0x1F20F), (0x1F21A, 0x1F21A),
+    (0x1F22F, 0x1F22F), (0x1F232, 0x1F23A), (0x1F23C, 0x1F23F), (0x1F249, 0x1F3FA),
+    (0x1F400, 0x1F53D), (0x1F546, 0x1F64F), (0x1F680, 0x1F6FF), (0x1F774, 0x1F77F),
+    (0x1F7D5, 0x1F7FF), (0x1F80C, 0x1F80F), (0x1F848, 0x1F84F), (0x1F85A, 0x1F85F),
+    (0x1F888, 0x1F88F), (0x1F8AE, 0x1F8FF), (0x1F90C, 0x1F93A), (0x1F93C, 0x1F945),
+    (0x1F947, 0x1FAFF), (0x1FC00, 0x1FFFD),
+]
+
+# Grapheme_Extend code points that are not Mn/Me, plus emoji modifiers and tags
+EXTRA_EXTEND_RANGES = [
+    (0x09BE, 0x09BE), (0x09D7, 0x09D7), (0x0B3E, 0x0B3E), (0x0B57, 0x0B57),
+    (0x0BBE, 0x0BBE), (0x0BD7, 0x0BD7), (0x0CC2, 0x0CC2), (0x0CD5, 0x0CD6),
+    (0x0D3E, 0x0D3E), (0x0D57, 0x0D57), (0x0DCF, 0x0DCF), (0x0DDF, 0x0DDF),
+    (0x1B35, 0x1B35), (0x200C, 0x200C), (0x302E, 0x302F), (0xFF9E, 0xFF9F),
+    (0x1D165, 0x1D165), (0x1D16E, 0x1D172), (0x1F3FB, 0x1F3FF), (0xE0020, 0xE007F),
+]
+REGIONAL_INDICATOR_RANGE = (0x1F1E6, 0x1F1FF)
+HANGUL_L_RANGES = [(0x1100, 0x115F), (0xA960, 0xA97C)]
+HANGUL_V_RANGES = [(0x1160, 0x11A7), (0xD7B0, 0xD7C6)]
+HANGUL_T_RANGES = [(0x11A8, 0x11FF), (0xD7CB, 0xD7FB)]
+HANGUL_SYLLABLES = (0xAC00, 0xD7A3)  # LV every 28th code point, LVT otherwise
+
+# Planes scanned for general categories: BMP, SMP and the tags plane
+CATEGORY_SCAN_RANGES = [(0x0000, 0x1FFFF), (0xE0000, 0xE0FFF)]
+
+
+@dataclass
+class PostAnalysis:
+    """Everything the platform rules need, computed once per post."""
+    text: str  # content with surrounding whitespace stripped
+    length: int
+    urls: list[str]
+    hashtags: list[str]
+    grapheme_count: int
+    line_count: int
+    first_line_length: int
+
+    @property
+    def hashtag_count(self) -> int:
+        return len(self.hashtags)
+
+    @cached_property
+    def twitter_length(self) -> int:
+        """Weighted length with every link counted at Twitter's fixed t.co cost."""
+        link_cost = PLATFORM_LIMITS["twitter"]["link_cost"]
+        url_length = sum(map(weighted_length, self.urls))
+        return weighted_length(self.text) - url_length + link_cost * len(self.urls)
+
+
+@lru_cache(maxsize=4096)
+def code_point_weight(char: str) -> int:
+    """Twitter weight of one code point, found by bisecting the range table."""
+    code_point = ord(char)
+    index = bisect_right(_WEIGHT_RANGE_STARTS, code_point) - 1
+    if index >= 0 and code_point <= TWITTER_WEIGHT_RANGES[index][1]:
+        return TWITTER_WEIGHT_RANGES[index][2]
+    return TWITTER_DEFAULT_WEIGHT
+
+
+def _char_class(ranges) -> str:
+    """Regex character class body for (first, last) code point ranges."""
+    return ''.join(
+        re.escape(chr(first)) if first == last else f'{re.escape(chr(first))}-{re.escape(chr(last))}'
+        for first, last in ranges
+    )
+
+
+def _merge_ranges(code_points) -> list[tuple[int, int]]:
+    ranges = []
+    for code_point in sorted(code_points):
+        if ranges and ranges[-1][1] == code_point - 1:
+            ranges[-1] = (ranges[-1][0], code_point)
+        else:
+            ranges.append((code_point, code_point))
+    return ranges
+
+
+# Code points outside the one-unit ranges; only these need a weight lookup
+OFF_SCALE_PATTERN = re.compile('[^' + _char_class(
+    (first, last) for first, last, weight in TWITTER_WEIGHT_RANGES
+    if weight == TWITTER_WEIGHT_SCALE
+) + ']')
+
+
+@lru_cache(maxsize=None)
+def grapheme_patterns() -> tuple[re.Pattern, re.Pattern]:
+    """
+    Compile the grapheme cluster and emoji sequence patterns.
+    
+    Character classes are built once from unicodedata general categories
+    and the range tables above, so segmentation runs inside the regex
+    engine. Follows the UAX #29 extended grapheme cluster rules except
+    Prepend, which is too rare in social posts to be worth the table.
+    """
+    extend, spacing_mark, control = set(), set(), set()
+    for first, last in CATEGORY_SCAN_RANGES:
+        for code_point in range(first, last + 1):
+            category = unicodedata.category(chr(code_point))
+            if category in ('Mn', 'Me'):
+                extend.add(code_point)
+            elif category == 'Mc':
+                spacing_mark.add(code_point)
+            elif category in ('Cc', 'Zl', 'Zp', 'Cf'):
+                control.add(code_point)
+    for first, last in EXTRA_EXTEND_RANGES:
+        extend.update(range(first, last + 1))
+    spacing_mark -= extend
+    spacing_mark.update((0x0E33, 0x0EB3))
+    control -= extend
+    control.discard(0x200D)  # ZWJ joins, see GB9 and GB11
+    
+    extend_class = _char_class(_merge_ranges(extend))
+    control_class = _char_class(_merge_ranges(control))
+    attach_class = extend_class + '\u200d' + _char_class(_merge_ranges(spacing_mark))
+    pictographic = _char_class(EXTENDED_PICTOGRAPHIC_RANGES)
+    astral_pictographic = _char_class(r for r in EXTENDED_PICTOGRAPHIC_RANGES if r[0] > 0xFFFF)
+    bmp_pictographic = _char_class(r for r in EXTENDED_PICTOGRAPHIC_RANGES if r[0] <= 0xFFFF)
+    regional = _char_class([REGIONAL_INDICATOR_RANGE])
+    lv = _char_class((c, c) for c in range(HANGUL_SYLLABLES[0], HANGUL_SYLLABLES[1] + 1, 28))
+    lvt = _char_class(
+        (c + 1, c + 27) for c in range(HANGUL_SYLLABLES[0], HANGUL_SYLLABLES[1] + 1, 28)
+    )
+    hangul_l = _char_class(HANGUL_L_RANGES)
+    hangul_v = _char_class(HANGUL_V_RANGES)
+    hangul_t = _char_class(HANGUL_T_RANGES)
+    
+    # GB11: an emoji ZWJ sequence stays together
+    pictographic_sequence = f'[{pictographic}](?:[{extend_class}]*\u200d[{pictographic}])*'
+    grapheme = re.compile(
+        '\r\n'                                            # GB3
+        f'|[{control_class}]'                               # GB4, GB5
+        f'|(?:[{regional}][{regional}]'                     # GB12, GB13
+        f'|[{hangul_l}]*(?:[{hangul_v}]+|[{lv}][{hangul_v}]*|[{lvt}])[{hangul_t}]*'
+        f'|[{hangul_l}]+|[{hangul_t}]+'                     # GB6-GB8
+        f'|{pictographic_sequence}'
+        f'|.)[{attach_class}]*',                            # GB9, GB9a
+        re.DOTALL,
+    )
+    # Sequences Twitter counts as one emoji. Text-style pictographs in the
+    # BMP only count as emoji with an explicit emoji presentation selector.
+    emoji = re.compile(
+        f'(?:[{regional}][{regional}]'
+        f'|[{astral_pictographic}]|[{bmp_pictographic}]\ufe0f|[0-9#*]\ufe0f?\u20e3)'
+        f'(?:[{extend_class}]*\u200d[{pictographic}])*[{extend_class}\u200d]*'
+    )
+    return grapheme, emoji
+
+
+def iter_graphemes(text: str) -> Iterator[str]:
+    """Yield the extended grapheme clusters of text."""
+    grapheme, _ = grapheme_patterns()
+    for match in grapheme.finditer(text):
+        yield match.group()
+
+
+def count_graphemes(text: str) -> int:
+    """Count user-perceived characters (extended grapheme clusters)."""
+    if text.isascii():
+        return len(text) - text.count('\r\n')
+    grapheme, _ = grapheme_patterns()
+    return len(grapheme.findall(text))
+
+
+def weighted_length(text: str) -> int:
+    """
+    Length of text as Twitter counts it, before link shortening.
+    
+    Text is NFC-normalized. Every code point costs its table weight,
+    except emoji sequences, which cost TWITTER_DEFAULT_WEIGHT in total.
+    Only code points outside the one-unit ranges are looked up.
+    """
+    if text.isascii():
+        return len(text)
+    text = unicodedata.normalize('NFC', text)
+    units = TWITTER_WEIGHT_SCALE * len(text)
+    for char in OFF_SCALE_PATTERN.findall(text):
+        units += code_point_weight(char) - TWITTER_WEIGHT_SCALE
+    _, emoji = grapheme_patterns()
+    for sequence in emoji.findall(text):
+        units += TWITTER_DEFAULT_WEIGHT - sum(map(code_point_weight, sequence))
+    return units // TWITTER_WEIGHT_SCALE
+
+
+def weighted_length_reference(text: str) -> int:
+    """Reference implementation: a table lookup per code point of every cluster. Used for benchmarking."""
+    text = unicodedata.normalize('NFC', text)
+    _, emoji = grapheme_patterns()
+    units = 0
+    for cluster in iter_graphemes(text):
+        match = emoji.match(cluster)
+        if match and match.end() == len(cluster):
+            units += TWITTER_DEFAULT_WEIGHT
+        else:
+            units += sum(code_point_weight.__wrapped__(char) for char in cluster)
+    return units // TWITTER_WEIGHT_SCALE
+
+
+def analyze_post(content: str) -> PostAnalysis:
+    """Scan a post once for the spans and counts every platform rule uses."""
+    text = content.strip()
+    first_newline = text.find('\n')
+    return PostAnalysis(
+        text=text,
+        length=len(text),
+        urls=URL_PATTERN.findall(text),
+        hashtags=HASHTAG_PATTERN.findall(text),
+        grapheme_count=count_graphemes(text),
+        line_count=text.count('\n') + 1 if text else 0,
+        first_line_length=len(text) if first_newline < 0 else first_newline,
+    )
+
+
+def as_analysis(content: Union[str, PostAnalysis]) -> PostAnalysis:
+    return content if isinstance(content, PostAnalysis) else analyze_post(content)
+
+
 @dataclass
 class ValidationResult:
     platform: str
@@ -68,30 +326,23 @@ def count_characters(text: str, platform: str) -> int:
     """
     Count characters accounting for platform-specific rules.
     """
-    text = text.strip()
-    char_count = len(text)
-    
-    # Twitter: Links consume fixed 23 characters regardless of actual length
+    # Twitter: weighted length, with links at a fixed 23 characters regardless of actual length
     if platform == "twitter":
-        url_pattern = r'https?://\S+'
-        urls = re.findall(url_pattern, text)
-        for url in urls:
-            # Remove actual URL length, add Twitter's shortened length
-            char_count = char_count - len(url) + PLATFORM_LIMITS["twitter"]["link_cost"]
-    
-    return char_count
+        return analyze_post(text).twitter_length
+    return len(text.strip())
 
 
 def count_hashtags(text: str) -> int:
     """Count hashtags in text."""
-    return len(re.findall(r'#\w+', text))
+    return len(HASHTAG_PATTERN.findall(text))
 
 
-def validate_twitter(content: str, premium: bool = False) -> ValidationResult:
+def validate_twitter(content: Union[str, PostAnalysis], premium: bool = False) -> ValidationResult:
     """Validate Twitter/X post."""
+    post = as_analysis(content)
     limit = PLATFORM_LIMITS["twitter"]["premium"] if premium else PLATFORM_LIMITS["twitter"]["standard"]
-    char_count = count_characters(content, "twitter")
-    hashtag_count = count_hashtags(content)
+    char_count = post.twitter_length
+    hashtag_count = post.hashtag_count
     
     warnings = []
     if hashtag_count > 3:
@@ -107,11 +358,12 @@ def validate_twitter(content: str, premium: bool = False) -> ValidationResult:
     )
 
 
-def validate_linkedin(content: str) -> ValidationResult:
+def validate_linkedin(content: Union[str, PostAnalysis]) -> ValidationResult:
     """Validate LinkedIn post."""
+    post = as_analysis(content)
     limit = PLATFORM_LIMITS["linkedin"]["post"]
-    char_count = len(content.strip())
-    hashtag_count = count_hashtags(content)
+    char_count = post.length
+    hashtag_count = post.hashtag_count
     
     warnings = []
     optimal_min = PLATFORM_LIMITS["linkedin"]["optimal_min"]
@@ -135,18 +387,18 @@ def validate_linkedin(content: str) -> ValidationResult:
     )
 
 
-def validate_instagram(content: str) -> ValidationResult:
+def validate_instagram(content: Union[str, PostAnalysis]) -> ValidationResult:
     """Validate Instagram caption."""
+    post = as_analysis(content)
     limit = PLATFORM_LIMITS["instagram"]["caption"]
-    char_count = len(content.strip())
-    hashtag_count = count_hashtags(content)
+    char_count = post.length
+    hashtag_count = post.hashtag_count
     preview_limit = PLATFORM_LIMITS["instagram"]["visible_preview"]
     
     warnings = []
     
-    first_line = content.strip().split('\n')[0] if content.strip() else ""
-    if len(first_line) > preview_limit:
-        warnings.append(f"First line ({len(first_line)} chars) exceeds visible preview ({preview_limit}). Hook may be cut off.")
+    if post.first_line_length > preview_limit:
+        warnings.append(f"First line ({post.first_line_length} chars) exceeds visible preview ({preview_limit}). Hook may be cut off.")
     
     if hashtag_count > 30:
         warnings.append(f"Too many hashtags ({hashtag_count}). Instagram allows max 30.")
@@ -163,10 +415,11 @@ def validate_instagram(content: str) -> ValidationResult:
     )
 
 
-def validate_facebook(content: str) -> ValidationResult:
+def validate_facebook(content: Union[str, PostAnalysis]) -> ValidationResult:
     """Validate Facebook post."""
+    post = as_analysis(content)
     limit = PLATFORM_LIMITS["facebook"]["post"]
-    char_count = len(content.strip())
+    char_count = post.length
     
     warnings = []
     optimal_max = PLATFORM_LIMITS["facebook"]["optimal_max"]
@@ -184,11 +437,12 @@ def validate_facebook(content: str) -> ValidationResult:
     )
 
 
-def validate_threads(content: str) -> ValidationResult:
+def validate_threads(content: Union[str, PostAnalysis]) -> ValidationResult:
     """Validate Threads post."""
+    post = as_analysis(content)
     limit = PLATFORM_LIMITS["threads"]["post"]
-    char_count = len(content.strip())
-    hashtag_count = count_hashtags(content)
+    char_count = post.length
+    hashtag_count = post.hashtag_count
     
     warnings = []
     if hashtag_count > 0:
@@ -204,17 +458,146 @@ def validate_threads(content: str) -> ValidationResult:
     )
 
 
-def validate_all(content: str) -> list[ValidationResult]:
-    """Validate content against all platforms."""
+PLATFORM_VALIDATORS = {
+    "twitter": validate_twitter,
+    "linkedin": validate_linkedin,
+    "instagram": validate_instagram,
+    "facebook": validate_facebook,
+    "threads": validate_threads,
+}
+
+
+def validate_all(content: Union[str, PostAnalysis], premium: bool = False) -> list[ValidationResult]:
+    """Validate content against all platforms, analyzing it only once."""
+    post = as_analysis(content)
     return [
-        validate_twitter(content),
-        validate_linkedin(content),
-        validate_instagram(content),
-        validate_facebook(content),
-        validate_threads(content),
+        validate_twitter(post, premium),
+        validate_linkedin(post),
+        validate_instagram(post),
+        validate_facebook(post),
+        validate_threads(post),
     ]
 
 
+def iter_campaign_posts(path: str, text_field: str = "text",
+                        id_field: str = "id") -> Iterator[tuple[str, str, Optional[str]]]:
+    """
+    Yield (post_id, content, error) from a CSV or JSONL campaign export.
+    
+    CSV files need a header row. JSONL lines may also be bare strings.
+    Rows without an id are numbered from 1. "-" reads JSONL from stdin.
+    A JSONL line that is not valid JSON, an object or a string yields an
+    error message and empty content instead of stopping the run.
+    """
+    if path == "-":
+        source = sys.stdin
+    else:
+        source = open(path, "r", encoding="utf-8", newline="")
+    try:
+        if path.lower().endswith(".csv"):
+            reader = csv.DictReader(source)
+            if text_field not in (reader.fieldnames or []):
+                raise ValueError(f"CSV has no '{text_field}' column")
+            for row_number, row in enumerate(reader, start=1):
+                yield row.get(id_field) or str(row_number), row[text_field] or "", None
+        else:
+            for line_number, line in enumerate(source, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    item = json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield str(line_number), "", f"Invalid JSON: {e}"
+                    continue
+                if isinstance(item, str):
+                    yield str(line_number), item, None
+                elif isinstance(item, dict):
+                    yield str(item.get(id_field, line_number)), str(item.get(text_field) or ""), None
+                else:
+                    yield str(line_number), "", f"Expected an object or a string, got {type(item).__name__}"
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+
+def check_campaign(posts: Iterator[tuple[str, str, Optional[str]]], platforms: list[str],
+                   premium: bool = False) -> Iterator[dict]:
+    """
+    Validate every post against the given platforms, yielding one record per post.
+    
+    Posts that could not be read yield {"id", "passed": False, "error"}.
+    """
+    for post_id, content, error in posts:
+        if error is not None:
+            yield {"id": post_id, "passed": False, "error": error}
+            continue
+        post = analyze_post(content)
+        results = {}
+        for platform in platforms:
+            if platform == "twitter":
+                result = validate_twitter(post, premium)
+            else:
+                result = PLATFORM_VALIDATORS[platform](post)
+            results[platform] = {
+                "length": result.content_length,
+                "limit": result.limit,
+                "remaining": result.remaining,
+                "passed": result.passed,
+                "warnings": result.warnings,
+            }
+        yield {
+            "id": post_id,
+            "passed": all(r["passed"] for r in results.values()),
+            "graphemes": post.grapheme_count,
+            "lines": post.line_count,
+            "results": results,
+        }
+
+
+# Sample posts for --benchmark, one per script mix in a localized campaign
+BENCHMARK_SAMPLES = [
+    "Our spring release is live! Faster sync, offline mode and a fresh look. "
+    "Read more: https://example.com/blog/spring-release #ProductUpdate",
+    "Café crème, naïve façade, coöperate — accents after NFC stay one unit each.",
+    "春のリリースを公開しました！同期が速くなり、オフラインでも使えます。詳しくはこちら https://example.com/ja #新機能",
+    "春季版本现已上线！同步更快，支持离线模式，界面焕然一新。#产品更新",
+    "봄 업데이트가 출시되었습니다! 더 빠른 동기화와 오프라인 모드를 만나보세요.",
+    "الإصدار الربيعي متاح الآن! مزامنة أسرع ووضع عدم الاتصال. #تحديث",
+    "Launch day 🚀🎉 Thanks team 👩🏽‍💻👨‍👩‍👧‍👦 See you in 🇯🇵 and 🇧🇷! ❤️ 1️⃣",
+]
+
+
+def benchmark(posts: list[str], repeat: int = 5) -> dict:
+    """
+    Time weighted_length against the per-code-point reference on posts.
+    
+    Both implementations must agree on every post. Returns throughput in
+    posts and characters per second for each, best of repeat runs.
+    """
+    for post in posts:
+        fast, reference = weighted_length(post), weighted_length_reference(post)
+        if fast != reference:
+            raise AssertionError(f"weighted_length {fast} != reference {reference} for {post!r}")
+    
+    chars = sum(map(len, posts))
+    report = {"posts": len(posts), "chars": chars}
+    for name, func in (("table", weighted_length), ("reference", weighted_length_reference)):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for post in posts:
+                func(post)
+            best = min(best, time.perf_counter() - start)
+        report[name] = {
+            "seconds": round(best, 4),
+            "posts_per_second": round(len(posts) / best),
+            "chars_per_second": round(chars / best),
+        }
+    report["speedup"] = round(report["reference"]["seconds"] / report["table"]["seconds"], 2)
+    return report
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Validate social media post character limits"
@@ -231,9 +614,66 @@ def main():
         "--premium", action="store_true",
         help="Use Twitter Premium limits (25,000 chars)"
     )
+    parser.add_argument(
+        "--bulk",
+        metavar="FILE",
+        help="Check every post in a CSV or JSONL campaign export (- for JSONL on stdin)"
+    )
+    parser.add_argument("--text-field", default="text", help="Column or key holding post text (default: text)")
+    parser.add_argument("--id-field", default="id", help="Column or key holding the post id (default: id)")
+    parser.add_argument("--output", "-o", help="JSONL output for --bulk (default: stdout)")
+    parser.add_argument(
+        "--benchmark",
+        nargs="?",
+        const=20000,
+        type=int,
+        metavar="POSTS",
+        help="Benchmark weighted length on a localized sample of POSTS posts (default: 20000)"
+    )
     
     args = parser.parse_args()
     
+    if args.benchmark:
+        grapheme_patterns()  # exclude one-time table construction from the timings
+        posts = [BENCHMARK_SAMPLES[i % len(BENCHMARK_SAMPLES)] + f" {i}" for i in range(args.benchmark)]
+        print(json.dumps(benchmark(posts), indent=2))
+        sys.exit(0)
+    
+    if args.bulk:
+        platforms = list(PLATFORM_VALIDATORS) if args.platform == "all" else [args.platform]
+        out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+        summary = {
+            "posts": 0,
+            "passed": 0,
+            "failed": 0,
+            "errors": 0,
+            "platforms": {p: {"passed": 0, "failed": 0, "warnings": 0} for p in platforms},
+        }
+        start = time.perf_counter()
+        try:
+            posts = iter_campaign_posts(args.bulk, args.text_field, args.id_field)
+            for record in check_campaign(posts, platforms, args.premium):
+                out.write(json.dumps(record, ensure_ascii=False) + "\n")
+                summary["posts"] += 1
+                summary["passed" if record["passed"] else "failed"] += 1
+                if "error" in record:
+                    summary["errors"] += 1
+                    continue
+                for platform, result in record["results"].items():
+                    counts = summary["platforms"][platform]
+                    counts["passed" if result["passed"] else "failed"] += 1
+                    counts["warnings"] += len(result["warnings"])
+        except (OSError, ValueError) as e:
+            print(f"Error reading {args.bulk}: {e}", file=sys.stderr)
+            sys.exit(2)
+        finally:
+            if out is not sys.stdout:
+                out.close()
+        summary["seconds"] = round(time.perf_counter() - start, 3)
+        # Summary goes to stderr so stdout stays pure JSONL
+        print(json.dumps(summary, indent=2), file=sys.stderr)
+        sys.exit(0 if summary["failed"] == 0 else 1)
+    
     # Get content
     if args.text:
         content = args.text
@@ -255,17 +695,11 @@ def main():
     results = []
     
     if args.platform == "all":
-        results = validate_all(content)
+        results = validate_all(content, args.premium)
     elif args.platform == "twitter":
         results = [validate_twitter(content, args.premium)]
-    elif args.platform == "linkedin":
-        results = [validate_linkedin(content)]
-    elif args.platform == "instagram":
-        results = [validate_instagram(content)]
-    elif args.platform == "facebook":
-        results = [validate_facebook(content)]
-    elif args.platform == "threads":
-        results = [validate_threads(content)]
+    else:
+        results = [PLATFORM_VALIDATORS[args.platform](content)]
     
     # Output
     print("\n=== Social Media Character Validation ===\n")
@@ -24,6 +24,14 @@ import json
 from pathlib import Path
 from typing import Optional
 
+# Parsed documents are memoized by scripts/markdown_model.py when this skill
+# sits in the repository; a copy of the skill parses each file itself.
+try:
+    sys.path.append(str(Path(__file__).resolve().parents[4] / "scripts"))
+    from markdown_model import load_document
+except (IndexError, ImportError):
+    load_document = None
+
 # Required sections for endpoint documentation
 REQUIRED_SECTIONS = ["Endpoint", "Authentication", "Response", "Example"]
 
@@ -99,10 +107,9 @@ def extract_json_blocks(content: str) -> list[tuple[str, int]]:
     return blocks
 
 
-def validate_json_blocks(content: str) -> list[str]:
+def validate_json_blocks(json_blocks: list[tuple[str, int]]) -> list[str]:
     """Validate that JSON code blocks are syntactically valid."""
     errors = []
-    json_blocks = extract_json_blocks(content)
     
     for block_content, line_num in json_blocks:
         try:
@@ -113,18 +120,21 @@ def validate_json_blocks(content: str) -> list[str]:
     return errors
 
 
-def validate_parameter_tables(content: str) -> list[str]:
+def extract_table_headers(content: str) -> list[set[str]]:
+    """Extract the header cells of each markdown table."""
+    table_pattern = r"\|([^|]+\|)+\n\|[-:|]+\|"
+    headers = []
+    for match in re.finditer(table_pattern, content):
+        header_line = match.group(0).split("\n")[0]
+        headers.append({h.strip() for h in header_line.split("|") if h.strip()})
+    return headers
+
+
+def validate_parameter_tables(table_headers: list[set[str]]) -> list[str]:
     """Validate parameter tables have required columns."""
     errors = []
     
-    # Find markdown tables
-    table_pattern = r"\|([^|]+\|)+\n\|[-:|]+\|"
-    tables = re.finditer(table_pattern, content)
-    
-    for match in tables:
-        header_line = match.group(0).split("\n")[0]
-        headers = {h.strip() for h in header_line.split("|") if h.strip()}
-        
+    for headers in table_headers:
         # Check if this looks like a parameter table
         if headers & {"Parameter", "Field"}:
             if "Type" not in headers:
@@ -151,19 +161,29 @@ def validate_example_section(sections: dict[str, str]) -> list[str]:
 def validate_file(filepath: Path) -> tuple[bool, list[str]]:
     """Run all validations on a file."""
     try:
-        content = filepath.read_text(encoding="utf-8")
+        if load_document is not None:
+            document = load_document(filepath)
+        else:
+            content = filepath.read_text(encoding="utf-8")
     except FileNotFoundError:
         return False, [f"File not found: {filepath}"]
     except Exception as e:
         return False, [f"Error reading file: {e}"]
     
-    sections = extract_sections(content)
+    if load_document is not None:
+        sections = document.sections_by_title(level=2)
+        json_blocks = [(block.content, block.line) for block in document.blocks_in("json")]
+        table_headers = [{h for h in table.columns if h} for table in document.tables]
+    else:
+        sections = extract_sections(content)
+        json_blocks = extract_json_blocks(content)
+        table_headers = extract_table_headers(content)
     
     all_errors = []
     all_errors.extend(validate_required_sections(sections))
     all_errors.extend(validate_endpoint_format(sections))
-    all_errors.extend(validate_json_blocks(content))
-    all_errors.extend(validate_parameter_tables(content))
+    all_errors.extend(validate_json_blocks(json_blocks))
+    all_errors.extend(validate_parameter_tables(table_headers))
     all_errors.extend(validate_example_section(sections))
     
     return len(all_errors) == 0, all_errors
@@ -22,6 +22,14 @@ import sys
 import re
 from pathlib import Path
 
+# Parsed documents are memoized by scripts/markdown_model.py when this skill
+# sits in the repository; a copy of the skill parses each file itself.
+try:
+    sys.path.append(str(Path(__file__).resolve().parents[4] / "scripts"))
+    from markdown_model import load_document
+except (IndexError, ImportError):
+    load_document = None
+
 # Constants
 MAX_HEADING_DEPTH = 4
 REQUIRED_SECTIONS = ["Prerequisites", "Steps", "Verify"]
@@ -115,14 +123,16 @@ def validate_file(filepath: Path) -> tuple[bool, list[str]]:
         Tuple of (passed, errors)
     """
     try:
-        content = filepath.read_text(encoding="utf-8")
+        if load_document is not None:
+            document = load_document(filepath)
+            headings = [(h.level, h.text, h.line) for h in document.headings]
+        else:
+            headings = extract_headings(filepath.read_text(encoding="utf-8"))
     except FileNotFoundError:
         return False, [f"File not found: {filepath}"]
     except Exception as e:
         return False, [f"Error reading file: {e}"]
     
-    headings = extract_headings(content)
-    
     if not headings:
         return False, ["No headings found in document"]
     
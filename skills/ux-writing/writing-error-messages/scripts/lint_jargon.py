@@ -7,12 +7,18 @@ Usage:
     python lint_jargon.py <file_or_text>
     python lint_jargon.py --text "Your error message here"
     python lint_jargon.py --file messages.yaml
+    python lint_jargon.py --jsonl strings_en.txt strings_de.txt > violations.jsonl
+    cat strings.txt | python lint_jargon.py --jsonl -
+    python lint_jargon.py --benchmark [messages.yaml]
 """
 
 import argparse
+import json
 import re
 import sys
+import time
 from pathlib import Path
+from typing import Iterator
 
 # Forbidden patterns with explanations
 # Sourced from reference/forbidden-phrases.md
@@ -65,38 +71,182 @@ FORBIDDEN_PATTERNS = [
 ]
 
 
+def required_literal(pattern: str) -> str:
+    """Return the longest literal word every match of pattern must contain.
+
+    Escapes (\\b, \\s, \\d), character classes and letters or groups made
+    optional by a quantifier are skipped. Returns an empty string when the
+    pattern has no usable literal (or uses alternation), meaning it must
+    always be searched.
+    """
+    if '|' in pattern:
+        return ''
+    stripped = re.sub(r'\\.|\[[^\]]*\]', ' ', pattern)
+    stripped = re.sub(r'\([^)]*\)[?*{]', ' ', stripped)
+    stripped = re.sub(r'[a-zA-Z][?*{]', ' ', stripped)
+    words = re.findall(r'[a-zA-Z]{2,}', stripped)
+    return max(words, key=len).lower() if words else ''
+
+
+class CompiledMatcher:
+    """Precompiled matcher for a list of (pattern, message) tuples.
+
+    Each pattern is compiled once and indexed by a required literal word.
+    A line is lowercased once and only patterns whose literal occurs in it
+    are searched, so clean lines (the common case) cost a handful of
+    substring checks instead of one regex search per pattern.
+
+    Lines with non-ASCII characters skip the literal check and search every
+    pattern: re.IGNORECASE matches 'İ' to 'i' and 'ſ' to 's', which
+    lowercasing does not. Literals are ASCII, so the check is exact for
+    ASCII lines.
+    """
+
+    def __init__(self, patterns: list, flags: int = re.IGNORECASE):
+        self.patterns = list(patterns)
+        self.compiled = [re.compile(pattern, flags) for pattern, _ in self.patterns]
+        self.always = []
+        self.by_literal = {}
+        for i, (pattern, _) in enumerate(self.patterns):
+            literal = required_literal(pattern)
+            if literal:
+                self.by_literal.setdefault(literal, []).append(i)
+            else:
+                self.always.append(i)
+
+    def search(self, text: str) -> list:
+        """Return list of (pattern, message) tuples that match text, in declaration order."""
+        if text.isascii():
+            text_lower = text.lower()
+            candidates = list(self.always)
+            for literal, indexes in self.by_literal.items():
+                if literal in text_lower:
+                    candidates.extend(indexes)
+            candidates.sort()
+        else:
+            candidates = range(len(self.patterns))
+
+        violations = []
+        for i in candidates:
+            if self.compiled[i].search(text):
+                violations.append(self.patterns[i])
+        return violations
+
+
+MATCHER = CompiledMatcher(FORBIDDEN_PATTERNS)
+
+
 def lint_text(text: str) -> list:
     """Check text for forbidden patterns. Returns list of (pattern, message) tuples."""
+    return MATCHER.search(text)
+
+
+def lint_text_uncompiled(text: str) -> list:
+    """Reference implementation: one re.search per pattern. Used for benchmarking."""
     violations = []
-    text_lower = text.lower()
-    
     for pattern, message in FORBIDDEN_PATTERNS:
-        flags = re.IGNORECASE
-        if re.search(pattern, text, flags):
+        if re.search(pattern, text, re.IGNORECASE):
             violations.append((pattern, message))
-    
     return violations
 
 
+def iter_violations(lines) -> Iterator[tuple]:
+    """Lint an iterable of lines lazily.
+
+    Yields (line_number, text, violations) for each line with violations,
+    as soon as it is found. Only one line is held in memory at a time.
+    """
+    for line_num, line in enumerate(lines, start=1):
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        violations = lint_text(line)
+        if violations:
+            yield line_num, line[:80] + ('...' if len(line) > 80 else ''), violations
+
+
 def lint_file(filepath: Path) -> dict:
     """Lint all text content in a file. Returns dict of line_number: violations."""
     results = {}
     
     with open(filepath, 'r', encoding='utf-8') as f:
-        for line_num, line in enumerate(f, start=1):
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-            violations = lint_text(line)
-            if violations:
-                results[line_num] = {
-                    'text': line[:80] + ('...' if len(line) > 80 else ''),
-                    'violations': violations
-                }
+        for line_num, text, violations in iter_violations(f):
+            results[line_num] = {
+                'text': text,
+                'violations': violations
+            }
     
     return results
 
 
+def stream_jsonl(sources: list, out=sys.stdout) -> int:
+    """Write one JSONL record per violating line across sources.
+
+    A source of '-' reads stdin. Memory stays constant regardless of input
+    size. Returns the number of records written.
+    """
+    count = 0
+    for source in sources:
+        if source == '-':
+            stream, name = sys.stdin, '<stdin>'
+        else:
+            stream, name = open(source, 'r', encoding='utf-8'), source
+        try:
+            for line_num, text, violations in iter_violations(stream):
+                out.write(json.dumps({
+                    'file': name,
+                    'line': line_num,
+                    'text': text,
+                    'violations': [
+                        {'pattern': pattern, 'message': message}
+                        for pattern, message in violations
+                    ],
+                }) + '\n')
+                count += 1
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+    return count
+
+
+BENCHMARK_SAMPLE = [
+    'Your session expired. Sign in again to save your changes.',
+    'We couldn\'t connect to the server. Check your connection and try again.',
+    'Enter a valid email address, like name@example.com.',
+    'FATAL: null pointer exception in runtime!!',
+    'Oops, an error occurred. Error code 5012.',
+    'That file was moved or deleted.',
+]
+
+
+def benchmark(lines: list, repeat: int = 5) -> dict:
+    """Time the compiled matcher against the per-pattern loop on the same lines.
+
+    Returns best-of-repeat timings in seconds and the speedup ratio. Raises
+    AssertionError if the two implementations disagree on any line.
+    """
+    for line in lines:
+        assert lint_text(line) == lint_text_uncompiled(line), line
+
+    def best_time(func) -> float:
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for line in lines:
+                func(line)
+            best = min(best, time.perf_counter() - start)
+        return best
+
+    loop_time = best_time(lint_text_uncompiled)
+    compiled_time = best_time(lint_text)
+    return {
+        'lines': len(lines),
+        'loop_seconds': loop_time,
+        'compiled_seconds': compiled_time,
+        'speedup': loop_time / compiled_time if compiled_time else float('inf'),
+    }
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Lint error messages for jargon and forbidden phrases'
@@ -111,12 +261,36 @@ def main():
     )
     parser.add_argument(
         'input',
-        nargs='?',
-        help='Text or file path to lint'
+        nargs='*',
+        help='File path(s) to lint; "-" reads stdin with --jsonl'
+    )
+    parser.add_argument(
+        '--jsonl',
+        action='store_true',
+        help='Stream violations as JSONL records (reads stdin if no files given)'
+    )
+    parser.add_argument(
+        '--benchmark',
+        action='store_true',
+        help='Compare compiled matcher against the per-pattern loop'
     )
     
     args = parser.parse_args()
     
+    if args.benchmark:
+        source = args.file or (args.input[0] if args.input else None)
+        if source:
+            with open(source, 'r', encoding='utf-8') as f:
+                lines = [line.strip() for line in f if line.strip()]
+        else:
+            lines = BENCHMARK_SAMPLE * 20000
+        stats = benchmark(lines)
+        print(f'Lines:    {stats["lines"]}')
+        print(f'Loop:     {stats["loop_seconds"]:.3f}s')
+        print(f'Compiled: {stats["compiled_seconds"]:.3f}s')
+        print(f'Speedup:  {stats["speedup"]:.1f}x')
+        sys.exit(0)
+    
     # Determine input source
     if args.text:
         text = args.text
@@ -131,24 +305,39 @@ def main():
             print('✓ No forbidden patterns found')
             sys.exit(0)
     
+    elif args.jsonl:
+        sources = ([args.file] if args.file else []) + args.input or ['-']
+        for source in sources:
+            if source != '-' and not Path(source).exists():
+                print(f'Error: File not found: {source}', file=sys.stderr)
+                sys.exit(1)
+        count = stream_jsonl(sources)
+        sys.exit(1 if count else 0)
+    
     elif args.file or args.input:
-        filepath = Path(args.file or args.input)
-        if not filepath.exists():
-            print(f'Error: File not found: {filepath}', file=sys.stderr)
-            sys.exit(1)
-        
-        results = lint_file(filepath)
-        if results:
-            print(f'Found violations in {len(results)} line(s):\n')
-            for line_num, data in results.items():
-                print(f'Line {line_num}: {data["text"]}')
-                for pattern, message in data['violations']:
-                    print(f'  ✗ {message}')
-                print()
-            sys.exit(1)
-        else:
-            print(f'✓ No forbidden patterns found in {filepath}')
-            sys.exit(0)
+        found = False
+        sources = ([args.file] if args.file else []) + args.input
+        for source in sources:
+            filepath = Path(source)
+            if not filepath.exists():
+                print(f'Error: File not found: {filepath}', file=sys.stderr)
+                sys.exit(1)
+            
+            results = lint_file(filepath)
+            if results:
+                found = True
+                if len(sources) > 1:
+                    print(f'{filepath}: found violations in {len(results)} line(s):\n')
+                else:
+                    print(f'Found violations in {len(results)} line(s):\n')
+                for line_num, data in results.items():
+                    print(f'Line {line_num}: {data["text"]}')
+                    for pattern, message in data['violations']:
+                        print(f'  ✗ {message}')
+                    print()
+            else:
+                print(f'✓ No forbidden patterns found in {filepath}')
+        sys.exit(1 if found else 0)
     
     else:
         parser.print_help()